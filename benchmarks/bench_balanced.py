@@ -0,0 +1,102 @@
+"""
+균형 배치(최소 들쭉날쭉함) 줄 나누기 벤치마크
+입력 크기를 두 배씩 늘려 가며 탐욕적 배치 대비 균형 배치의 시간을 비교합니다.
+마침표 분리를 끈 입력은 텍스트 전체가 문단 하나이므로 문단이 아주 긴 최악의 경우입니다.
+균형 배치가 탐욕적 배치의 몇 배 안쪽이고, 크기가 두 배일 때 시간도 두 배 안팎인지 확인합니다.
+
+사용법:
+    python -m benchmarks.bench_balanced --start 256KB --steps 6
+"""
+
+import argparse
+import math
+import sys
+from typing import List, Tuple
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size
+from benchmarks.measure import best_of
+from core.text_processor import DEFAULT_LINE_LENGTH, TextProcessor
+
+
+# 탐욕적 배치 대비 허용하는 최대 시간 배율
+MAX_RATIO = 5.0
+
+# 선형으로 판정하는 최대 증가 지수 (시간 ∝ 크기^지수)
+LINEAR_EXPONENT_LIMIT = 1.3
+
+
+def run(
+    start: int, steps: int, width: int = DEFAULT_LINE_LENGTH, repeat: int = 3
+) -> List[Tuple[str, int, float, float]]:
+    """
+    입력 크기를 start부터 두 배씩 steps번 늘려 가며 측정합니다.
+
+    Returns:
+        List[Tuple[str, int, float, float]]: (항목, 크기, 탐욕적 배치 초, 균형 배치 초)
+    """
+    processor = TextProcessor()
+    rows = []
+    for separate_sentences, name in ((True, "문단별"), (False, "문단 하나")):
+        for step in range(steps):
+            size = start << step
+            text = generate_corpus(size)
+            greedy = best_of(
+                lambda: processor.format_lines(
+                    text, width, separate_sentences=separate_sentences
+                ),
+                repeat,
+            )
+            balanced = best_of(
+                lambda: processor.format_lines(
+                    text, width, separate_sentences=separate_sentences, balanced=True
+                ),
+                repeat,
+            )
+            rows.append((name, size, greedy, balanced))
+    return rows
+
+
+def scaling_exponent(rows: List[Tuple[str, int, float, float]]) -> float:
+    """가장 작은 크기와 가장 큰 크기의 균형 배치 시간으로 증가 지수를 구합니다."""
+    (_, first_size, _, first_seconds), (_, last_size, _, last_seconds) = (
+        rows[0],
+        rows[-1],
+    )
+    return math.log(last_seconds / first_seconds) / math.log(last_size / first_size)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="균형 배치 줄 나누기 벤치마크")
+    parser.add_argument("--start", default="256KB", help="시작 크기 (기본값: 256KB)")
+    parser.add_argument("--steps", type=int, default=6, help="두 배로 늘리는 횟수")
+    parser.add_argument(
+        "--width", type=int, default=DEFAULT_LINE_LENGTH, help="한 줄당 문자 수"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    rows = run(parse_size(args.start), args.steps, args.width, args.repeat)
+    print(f"{'항목':<10}{'크기':>10}{'탐욕적':>12}{'균형':>12}{'배율':>9}")
+    failed = False
+    for name in dict.fromkeys(row[0] for row in rows):
+        group = [row for row in rows if row[0] == name]
+        for _, size, greedy, balanced in group:
+            print(
+                f"{name:<10}{format_size(size):>10}{greedy:>11.3f}s"
+                f"{balanced:>11.3f}s{balanced / greedy:>8.2f}x"
+            )
+        exponent = scaling_exponent(group)
+        worst = max(balanced / greedy for _, _, greedy, balanced in group)
+        print(f"{name} 증가 지수: {exponent:.2f} (1.0 = 선형, 2.0 = 제곱)")
+        if exponent > LINEAR_EXPONENT_LIMIT or worst > MAX_RATIO:
+            print(
+                f"{name}: 선형 기준({LINEAR_EXPONENT_LIMIT}) 또는 "
+                f"배율 기준({MAX_RATIO}x)을 넘었습니다",
+                file=sys.stderr,
+            )
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
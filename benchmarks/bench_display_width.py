@@ -0,0 +1,86 @@
+"""
+표시 폭 카운팅 벤치마크
+문자마다 unicodedata(east_asian_width, category)를 부르는 방식과
+2단계 표를 문자마다 찾는 방식(char_width), 표로 만든 블록별 대표 폭과 예외 문자만 세는
+count_display_width를 전체 텍스트와 단어별(줄 나누기에서 쓰는 count_many 포함)로 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_display_width --size 10MB
+"""
+
+import argparse
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size
+from benchmarks.measure import best_of
+from utils.display_width import unicode_width
+from utils.text_counter import char_width, count_display_width, count_many
+
+
+def unicodedata_width(text: str) -> int:
+    """문자마다 unicodedata로 폭을 구해 더합니다. (비교 기준)"""
+    return sum(unicode_width(ord(char)) for char in text)
+
+
+def table_width(text: str) -> int:
+    """문자마다 2단계 표에서 폭을 찾아 더합니다."""
+    return sum(map(char_width, text))
+
+
+COUNTERS: Dict[str, Callable[[str], int]] = {
+    "unicodedata": unicodedata_width,
+    "char_width": table_width,
+    "count_display_width": count_display_width,
+}
+
+
+def run(size: int, repeat: int = 3) -> List[Tuple[str, str, float]]:
+    """
+    전체 텍스트와 단어별 표시 폭 카운팅을 방식마다 측정합니다. 결과가 모두 같은지도 확인합니다.
+
+    Returns:
+        List[Tuple[str, str, float]]: (대상, 방식, 초)
+    """
+    text = generate_corpus(size)
+    words = text.split()
+    expected = unicodedata_width(text)
+    rows = []
+
+    for name, counter in COUNTERS.items():
+        assert counter(text) == expected, name
+        rows.append(("text", name, best_of(lambda: counter(text), repeat)))
+
+    for name, counter in COUNTERS.items():
+        rows.append(("words", name, best_of(lambda: list(map(counter, words)), repeat)))
+    assert count_many(words, count_display_width) == list(map(unicodedata_width, words))
+    rows.append(
+        (
+            "words",
+            "count_many",
+            best_of(lambda: count_many(words, count_display_width), repeat),
+        )
+    )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="표시 폭 카운팅 벤치마크")
+    parser.add_argument("--size", default="10MB", help="말뭉치 크기 (기본값: 10MB)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    size = parse_size(args.size)
+    rows = run(size, args.repeat)
+    baseline = {
+        target: seconds for target, name, seconds in rows if name == "unicodedata"
+    }
+    print(f"말뭉치 {format_size(size)}, 최소값 기준 {args.repeat}회 반복")
+    print(f"{'대상':<8}{'방식':<22}{'시간':>10}{'배속':>8}")
+    for target, name, seconds in rows:
+        print(
+            f"{target:<8}{name:<22}{seconds:>9.3f}s{baseline[target] / seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+파일 입력 경로 메모리 벤치마크
+파일 전체를 읽어 처리하는 경로와 format_file(메모리 매핑 + 점진적 디코딩 + 스트리밍 쓰기)의
+최대 상주 메모리(RSS)와 소요 시간을 파일 크기별로 비교합니다.
+측정마다 새 프로세스를 띄우므로 이전 측정의 메모리가 섞이지 않습니다.
+
+사용법:
+    python -m benchmarks.bench_file_io --sizes 10MB,50MB,100MB --encoding cp949
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size
+from benchmarks.measure import peak_rss
+from core.batch import format_file, write_atomic
+from core.text_processor import DEFAULT_LINE_LENGTH, TextProcessor
+
+
+MODES = ("read", "stream")
+
+
+def _run_child(mode: str, source: str, destination: str, encoding: str) -> None:
+    """자식 프로세스: 한 가지 경로로 파일을 처리하고 측정값을 JSON으로 출력합니다."""
+    baseline = peak_rss()
+    started = time.perf_counter()
+    if mode == "read":
+        with open(source, encoding=encoding) as source_file:
+            text = source_file.read()
+        result = TextProcessor().format_text_with_options(text, DEFAULT_LINE_LENGTH)
+        write_atomic(Path(destination), result, encoding)
+    else:
+        format_file(Path(source), Path(destination), encoding=encoding)
+    print(
+        json.dumps(
+            {
+                "seconds": time.perf_counter() - started,
+                "baseline_rss": baseline,
+                "peak_rss": peak_rss(),
+            }
+        )
+    )
+
+
+def measure(mode: str, source: Path, destination: Path, encoding: str) -> dict:
+    """새 프로세스에서 한 가지 경로를 실행해 측정값을 받습니다."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_file_io",
+            "--child",
+            mode,
+            str(source),
+            str(destination),
+            encoding,
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def run(sizes: List[int], encoding: str) -> List[Tuple[int, str, dict]]:
+    """
+    크기별로 입력 파일을 만들고 두 경로를 측정합니다. 두 경로의 출력이 같은지도 확인합니다.
+
+    Returns:
+        List[Tuple[int, str, dict]]: (크기, 경로, 측정값)
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        for size in sizes:
+            source = root / f"input-{size}.txt"
+            # CP949 등으로 표현할 수 없는 문자(보이지 않는 문자 등)는 빼고 저장
+            text = generate_corpus(size).encode(encoding, "ignore")
+            source.write_bytes(text)
+            outputs = {}
+            for mode in MODES:
+                destination = root / f"output-{mode}.txt"
+                rows.append((size, mode, measure(mode, source, destination, encoding)))
+                outputs[mode] = destination.read_bytes()
+            assert outputs["read"] == outputs["stream"], size
+            source.unlink()
+    return rows
+
+
+def main() -> None:
+    if len(sys.argv) == 6 and sys.argv[1] == "--child":
+        _run_child(*sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(description="파일 입력 경로 메모리 벤치마크")
+    parser.add_argument(
+        "--sizes", default="10MB,50MB,100MB", help="쉼표로 구분한 파일 크기"
+    )
+    parser.add_argument("--encoding", default="utf-8", help="파일 인코딩")
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    print(f"인코딩 {args.encoding}")
+    print(f"{'크기':>8}{'경로':>8}{'시간':>10}{'최대 RSS':>12}{'증가분':>12}")
+    for size, mode, result in run(sizes, args.encoding):
+        growth = result["peak_rss"] - result["baseline_rss"]
+        print(
+            f"{format_size(size):>8}{mode:>8}{result['seconds']:>9.2f}s"
+            f"{result['peak_rss'] / 1024**2:>10.1f}MB{growth / 1024**2:>10.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
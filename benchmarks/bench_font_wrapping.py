@@ -0,0 +1,106 @@
+"""
+픽셀 폭 줄 나누기 벤치마크
+단어마다 QFontMetricsF.horizontalAdvance를 부르는 방식과
+문자마다 한 번만 잰 전진 폭 표(AdvanceTable)를 찾는 방식으로 같은 말뭉치를 픽셀 폭에 맞춰 나눕니다.
+표 방식은 빈 표에서 시작(새 문자 측정 포함)과 이미 채운 표 두 가지를 잽니다.
+문자별 폭의 합은 커닝을 반영하지 않으므로, 방식마다 나온 줄 수와
+줄 전체를 Qt로 다시 쟀을 때 줄 폭을 넘는 줄 수도 함께 출력합니다.
+
+화면 없이 실행합니다 (QT_QPA_PLATFORM=offscreen):
+    python -m benchmarks.bench_font_wrapping --size 1MB --width 400
+"""
+
+import argparse
+import os
+from typing import List, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtGui import QFont, QFontMetricsF, QGuiApplication  # noqa: E402
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size  # noqa: E402
+from benchmarks.measure import best_of  # noqa: E402
+from core.advances import ADVANCE_UNITS, AdvanceTable  # noqa: E402
+from core.wrapping import wrap_spans  # noqa: E402
+
+
+def run(
+    size: int, width: int = 400, repeat: int = 3, font: QFont = None
+) -> List[Tuple[str, float, int, int]]:
+    """
+    단어별 측정과 전진 폭 표로 말뭉치를 나누는 시간을 측정합니다.
+    QGuiApplication이 먼저 만들어져 있어야 합니다.
+
+    Args:
+        size (int): 말뭉치 크기 (바이트)
+        width (int): 줄 폭 (픽셀)
+        repeat (int): 반복 횟수
+        font (QFont): 잴 글꼴 (기본값: 애플리케이션 기본 글꼴)
+
+    Returns:
+        List[Tuple[str, float, int, int]]: (방식, 초, 줄 수, 줄 폭을 넘는 줄 수)
+    """
+    metrics = QFontMetricsF(font if font is not None else QFont())
+    text = generate_corpus(size)
+    table = AdvanceTable(metrics.horizontalAdvance)
+    length = table.length_for(width)
+
+    def count_per_word(word: str) -> int:
+        """단어 전체를 매번 Qt로 잽니다. (비교 기준)"""
+        return round(metrics.horizontalAdvance(word) * ADVANCE_UNITS) + table.space
+
+    def wrap_per_word() -> List[str]:
+        return list(wrap_spans(text, length, count_per_word, table.split_long_word))
+
+    def wrap_cold() -> List[str]:
+        cold = AdvanceTable(metrics.horizontalAdvance)
+        return list(wrap_spans(text, length, cold.count, cold.split_long_word))
+
+    def wrap_warm() -> List[str]:
+        return list(wrap_spans(text, length, table.count, table.split_long_word))
+
+    rows = []
+    for name, wrap in (
+        ("horizontalAdvance", wrap_per_word),
+        ("AdvanceTable (cold)", wrap_cold),
+        ("AdvanceTable (warm)", wrap_warm),
+    ):
+        lines = wrap()
+        # 강제 분할된 한 글자 줄은 제외
+        over = sum(
+            1
+            for line in lines
+            if len(line) > 1 and metrics.horizontalAdvance(line) > width
+        )
+        rows.append((name, best_of(wrap, repeat), len(lines), over))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="픽셀 폭 줄 나누기 벤치마크")
+    parser.add_argument("--size", default="1MB", help="말뭉치 크기 (기본값: 1MB)")
+    parser.add_argument(
+        "--width", type=int, default=400, help="줄 폭 (픽셀, 기본값: 400)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    app = QGuiApplication([])  # noqa: F841 (글꼴을 쓰려면 필요)
+    font = QFont()
+    size = parse_size(args.size)
+    rows = run(size, args.width, args.repeat, font)
+    baseline = rows[0][1]
+    print(
+        f"말뭉치 {format_size(size)}, 줄 폭 {args.width}px, "
+        f"글꼴 {font.family()} {font.pointSizeF():g}pt, 최소값 기준 {args.repeat}회 반복"
+    )
+    print(f"{'방식':<22}{'시간':>10}{'배속':>8}{'줄 수':>10}{'폭 초과':>8}")
+    for name, seconds, line_count, over in rows:
+        print(
+            f"{name:<22}{seconds:>9.3f}s{baseline / seconds:>7.1f}x"
+            f"{line_count:>10}{over:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
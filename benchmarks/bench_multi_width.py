@@ -0,0 +1,95 @@
+"""
+여러 줄 길이 한 번에 가다듬기 벤치마크
+줄 길이 10~100 전체를 format_multi 한 번으로 구하는 시간과
+format_text_with_options를 줄 길이마다 호출하는 시간을 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_multi_width --size 1MB
+"""
+
+import argparse
+from typing import List, Tuple
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size
+from benchmarks.measure import best_of
+from core.text_processor import LINE_LENGTH_RANGE, TextProcessor
+
+
+def run(
+    size: int, widths: range = LINE_LENGTH_RANGE, repeat: int = 3
+) -> List[Tuple[str, float, float]]:
+    """
+    옵션 조합별로 줄 길이마다 호출한 시간과 format_multi 시간을 측정합니다.
+
+    Returns:
+        List[Tuple[str, float, float]]: (항목, 줄 길이마다 호출 초, format_multi 초)
+    """
+    processor = TextProcessor()
+    text = generate_corpus(size)
+    rows = []
+    for balanced in (False, True):
+        for separate_sentences in (True, False):
+            multi = processor.format_multi(
+                text, widths, separate_sentences=separate_sentences, balanced=balanced
+            )
+            for width in (widths[0], widths[-1]):
+                assert multi[width].join() == processor.format_text_with_options(
+                    text,
+                    width,
+                    separate_sentences=separate_sentences,
+                    balanced=balanced,
+                )
+
+            rows.append(
+                (
+                    f"sentences={separate_sentences},balanced={balanced}",
+                    best_of(
+                        lambda: [
+                            processor.format_text_with_options(
+                                text,
+                                width,
+                                separate_sentences=separate_sentences,
+                                balanced=balanced,
+                            )
+                            for width in widths
+                        ],
+                        repeat,
+                    ),
+                    best_of(
+                        lambda: processor.format_multi(
+                            text,
+                            widths,
+                            separate_sentences=separate_sentences,
+                            balanced=balanced,
+                        ),
+                        repeat,
+                    ),
+                )
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="여러 줄 길이 한 번에 가다듬기 벤치마크"
+    )
+    parser.add_argument("--size", default="1MB", help="말뭉치 크기 (기본값: 1MB)")
+    parser.add_argument("--min-width", type=int, default=LINE_LENGTH_RANGE[0])
+    parser.add_argument("--max-width", type=int, default=LINE_LENGTH_RANGE[-1])
+    parser.add_argument("--repeat", type=int, default=1, help="반복 횟수")
+    args = parser.parse_args()
+
+    size = parse_size(args.size)
+    widths = range(args.min_width, args.max_width + 1)
+    print(
+        f"말뭉치 {format_size(size)}, 줄 길이 {widths[0]}~{widths[-1]} ({len(widths)}개)"
+    )
+    print(f"{'항목':<36}{'길이마다 호출':>14}{'format_multi':>14}{'배율':>9}")
+    for name, separate_s, multi_s in run(size, widths, args.repeat):
+        print(
+            f"{name:<36}{separate_s:>13.3f}s{multi_s:>13.3f}s{separate_s / multi_s:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+출력 경로 메모리 벤치마크
+결과 전체를 문자열로 만든 뒤 쓰는 기존 경로(format_text_with_options)와
+완성된 줄을 묶음으로 바로 쓰는 format_to(문자열 입력, 청크 입력)의
+할당 메모리 최대치(tracemalloc)와 소요 시간을 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_output_memory --sizes 1MB,10MB,50MB
+"""
+
+import argparse
+import io
+import os
+import time
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size
+from benchmarks.measure import peak_memory
+from core.text_processor import DEFAULT_LINE_LENGTH, TextProcessor
+
+
+# format_to 청크 입력에서 한 번에 넘기는 문자 수
+CHUNK_CHARS = 1024 * 1024
+
+
+def _paths(processor: TextProcessor, text: str) -> Dict[str, Callable]:
+    """경로 이름별로 텍스트를 가다듬어 sink에 쓰는 함수"""
+
+    def joined(sink) -> None:
+        sink.write(processor.format_text_with_options(text, DEFAULT_LINE_LENGTH))
+
+    def format_to_text(sink) -> None:
+        processor.format_to(text, sink, DEFAULT_LINE_LENGTH)
+
+    def format_to_chunks(sink) -> None:
+        chunks = (
+            text[start : start + CHUNK_CHARS]
+            for start in range(0, len(text), CHUNK_CHARS)
+        )
+        processor.format_to(chunks, sink, DEFAULT_LINE_LENGTH)
+
+    return {
+        "join + write": joined,
+        "format_to(text)": format_to_text,
+        "format_to(chunks)": format_to_chunks,
+    }
+
+
+def run(sizes: List[int]) -> List[Tuple[int, str, int, float]]:
+    """
+    크기별로 세 경로를 측정합니다. 쓴 내용이 모두 같은지도 확인합니다.
+    입력 텍스트는 측정 전에 만들어 두므로 최대치에는 처리 중 새로 할당된 메모리만 들어갑니다.
+
+    Returns:
+        List[Tuple[int, str, int, float]]: (크기, 경로, 최대 할당 바이트, 초)
+    """
+    processor = TextProcessor()
+    rows = []
+    for size in sizes:
+        text = generate_corpus(size)
+        expected = processor.format_text_with_options(text, DEFAULT_LINE_LENGTH)
+        for name, write_all in _paths(processor, text).items():
+            output = io.StringIO()
+            write_all(output)
+            assert output.getvalue() == expected, name
+            del output
+
+            with open(os.devnull, "w", encoding="utf-8") as sink:
+                peak = peak_memory(lambda: write_all(sink))
+                started = time.perf_counter()
+                write_all(sink)
+                seconds = time.perf_counter() - started
+            rows.append((size, name, peak, seconds))
+        del expected
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="출력 경로 메모리 벤치마크")
+    parser.add_argument(
+        "--sizes", default="1MB,10MB", help="쉼표로 구분한 입력 크기 (기본값: 1MB,10MB)"
+    )
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    print(f"{'크기':>8}  {'경로':<20}{'최대 할당':>12}{'입력 대비':>10}{'시간':>9}")
+    for size, name, peak, seconds in run(sizes):
+        print(
+            f"{format_size(size):>8}  {name:<20}{peak / 1024**2:>10.1f}MB"
+            f"{peak / size:>9.2f}x{seconds:>8.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
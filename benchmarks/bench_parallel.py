@@ -0,0 +1,72 @@
+"""
+문서 하나의 병렬 가다듬기 확장성 벤치마크
+작업자 수를 1부터 N까지 늘려 가며 format_text_with_options(마침표 분리 + 모든 문자) 시간과
+1 작업자 대비 속도 향상을 측정하고, 결과가 한 스레드 처리와 같은지 확인합니다.
+
+사용법:
+    python -m benchmarks.bench_parallel --size 50MB --max-workers 8
+"""
+
+import argparse
+import os
+from typing import List, Tuple
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size
+from benchmarks.measure import best_of
+from core.text_processor import DEFAULT_LINE_LENGTH, TextProcessor
+
+
+def run(
+    size: int, max_workers: int, width: int = DEFAULT_LINE_LENGTH, repeat: int = 3
+) -> List[Tuple[int, float]]:
+    """
+    작업자 수별 소요 시간을 측정합니다.
+
+    Returns:
+        List[Tuple[int, float]]: (작업자 수, 초)
+    """
+    text = generate_corpus(size)
+    expected = TextProcessor().format_text_with_options(text, width)
+    rows = []
+
+    for workers in range(1, max_workers + 1):
+        with TextProcessor(workers=workers) as processor:
+            # 첫 실행으로 작업자 풀을 띄워 두고 결과 확인
+            assert processor.format_text_with_options(text, width) == expected, workers
+            seconds = best_of(
+                lambda: processor.format_text_with_options(text, width), repeat
+            )
+        rows.append((workers, seconds))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="병렬 가다듬기 확장성 벤치마크")
+    parser.add_argument("--size", default="20MB", help="말뭉치 크기 (기본값: 20MB)")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="최대 작업자 수 (기본값: CPU 수)",
+    )
+    parser.add_argument(
+        "--width", type=int, default=DEFAULT_LINE_LENGTH, help="한 줄당 문자 수"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    size = parse_size(args.size)
+    print(
+        f"말뭉치 {format_size(size)}, 줄 길이 {args.width}, "
+        f"CPU {os.cpu_count()}개, {args.repeat}회 반복"
+    )
+    print(f"{'작업자':>6}{'시간':>10}{'속도 향상':>10}{'효율':>8}")
+    rows = run(size, args.max_workers, args.width, args.repeat)
+    serial = rows[0][1]
+    for workers, seconds in rows:
+        speedup = serial / seconds
+        print(f"{workers:>6}{seconds:>9.3f}s{speedup:>9.2f}x{speedup / workers:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+마침표 문장 분리 확장성 벤치마크
+마침표 없이 개행만 많은 텍스트(가사, 목록)에서 입력 크기를 두 배씩 늘려 가며
+이전 구현(개행마다 다음 마침표까지 앞으로 훑는 정규식)과 현재 구현의 시간을 비교합니다.
+크기가 두 배가 될 때 시간도 두 배 안팎이면 선형, 네 배면 제곱 시간입니다.
+
+사용법:
+    python -m benchmarks.bench_sentences --start 64KB --steps 7 --legacy-max 256KB
+"""
+
+import argparse
+import math
+import sys
+from typing import List, Optional, Tuple
+
+from benchmarks.corpus import format_size, generate_line_list, parse_size
+from benchmarks.legacy import LegacyTextProcessor
+from benchmarks.measure import best_of
+from core.text_processor import TextProcessor
+
+
+# 선형으로 판정하는 최대 증가 지수 (시간 ∝ 크기^지수)
+LINEAR_EXPONENT_LIMIT = 1.3
+
+
+def run(
+    start: int, steps: int, legacy_max: int, repeat: int = 3
+) -> List[Tuple[int, Optional[float], float]]:
+    """
+    입력 크기를 start부터 두 배씩 steps번 늘려 가며 측정합니다.
+    이전 구현은 legacy_max 이하 크기에서만 실행합니다.
+
+    Returns:
+        List[Tuple[int, Optional[float], float]]: (크기, 이전 구현 초, 현재 구현 초)
+    """
+    legacy = LegacyTextProcessor()
+    processor = TextProcessor()
+    rows = []
+
+    for step in range(steps):
+        size = start << step
+        text = generate_line_list(size)
+        current = best_of(lambda: processor.separate_sentences_by_period(text), repeat)
+        legacy_seconds = None
+        if size <= legacy_max:
+            assert legacy.separate_sentences_by_period(
+                text
+            ) == processor.separate_sentences_by_period(text)
+            legacy_seconds = best_of(
+                lambda: legacy.separate_sentences_by_period(text), 1
+            )
+        rows.append((size, legacy_seconds, current))
+    return rows
+
+
+def scaling_exponent(rows: List[Tuple[int, Optional[float], float]]) -> float:
+    """가장 작은 크기와 가장 큰 크기의 현재 구현 시간으로 증가 지수를 구합니다."""
+    (first_size, _, first_seconds), (last_size, _, last_seconds) = rows[0], rows[-1]
+    return math.log(last_seconds / first_seconds) / math.log(last_size / first_size)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="마침표 문장 분리 확장성 벤치마크")
+    parser.add_argument("--start", default="64KB", help="시작 크기 (기본값: 64KB)")
+    parser.add_argument("--steps", type=int, default=7, help="두 배로 늘리는 횟수")
+    parser.add_argument(
+        "--legacy-max", default="256KB", help="이전 구현을 실행할 최대 크기"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    rows = run(
+        parse_size(args.start), args.steps, parse_size(args.legacy_max), args.repeat
+    )
+    print(f"{'크기':>10}{'이전':>12}{'현재':>12}{'현재 증가율':>12}")
+    previous = None
+    for size, legacy_seconds, current_seconds in rows:
+        legacy_text = f"{legacy_seconds:>11.3f}s" if legacy_seconds else f"{'-':>12}"
+        growth = f"{current_seconds / previous:>11.2f}x" if previous else f"{'-':>12}"
+        print(f"{format_size(size):>10}{legacy_text}{current_seconds:>11.3f}s{growth}")
+        previous = current_seconds
+
+    exponent = scaling_exponent(rows)
+    print(f"증가 지수: {exponent:.2f} (1.0 = 선형, 2.0 = 제곱)")
+    if exponent > LINEAR_EXPONENT_LIMIT:
+        print(f"선형 기준({LINEAR_EXPONENT_LIMIT})을 넘었습니다", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
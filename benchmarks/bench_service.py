@@ -0,0 +1,169 @@
+"""
+가다듬기 서비스 부하 생성기
+연결 여러 개를 열어 두고 각 연결에서 /format 요청을 쉬지 않고 보내
+요청별 지연 시간의 p50/p99와 초당 요청 수를 구합니다.
+서로 다른 텍스트 수(--distinct)를 줄이면 같은 요청이 겹쳐 합치기(coalescing)가 일어나고,
+--batch-items 1로 묶지 않을 때와 비교할 수 있습니다.
+
+포트를 주지 않으면 서비스를 같은 프로세스에서 띄워 측정하고 묶음/합치기 통계도 출력합니다:
+    python -m benchmarks.bench_service --requests 2000 --concurrency 32 --workers 4
+이미 떠 있는 서비스(python cli.py serve)를 측정:
+    python -m benchmarks.bench_service --port 8765
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+from typing import List, NamedTuple, Optional
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size
+from benchmarks.suite import percentile
+from core.service import (
+    BATCH_MAX_ITEMS,
+    DEFAULT_HOST,
+    FormatService,
+    ServiceClient,
+    ServiceStats,
+)
+
+
+class LoadReport(NamedTuple):
+    """부하 측정 결과"""
+
+    requests: int
+    errors: int  # 200이 아닌 응답 수
+    seconds: float
+    p50: float  # 지연 시간 (초)
+    p99: float
+    service: Optional[ServiceStats] = None  # 같은 프로세스에서 띄운 경우의 서비스 통계
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds if self.seconds > 0 else 0.0
+
+
+async def generate_load(
+    port: int,
+    texts: List[str],
+    total: int,
+    concurrency: int,
+    width: int = 18,
+    host: str = DEFAULT_HOST,
+) -> LoadReport:
+    """
+    연결 concurrency개에서 texts를 차례로 돌려 가며 /format 요청을 total개 보냅니다.
+
+    Returns:
+        LoadReport: 측정 결과
+    """
+    latencies: List[float] = []
+    errors = 0
+    indexes = itertools.count()
+
+    async def connection() -> None:
+        nonlocal errors
+        async with ServiceClient(host, port) as client:
+            for index in indexes:
+                if index >= total:
+                    return
+                payload = {"text": texts[index % len(texts)], "width": width}
+                started = time.perf_counter()
+                status, _ = await client.request("POST", "/format", payload)
+                latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(connection() for _ in range(concurrency)))
+    seconds = time.perf_counter() - started
+    return LoadReport(
+        len(latencies),
+        errors,
+        seconds,
+        percentile(latencies, 0.5),
+        percentile(latencies, 0.99),
+    )
+
+
+async def run(
+    total: int,
+    concurrency: int,
+    texts: List[str],
+    workers: Optional[int] = None,
+    port: Optional[int] = None,
+    batch_items: int = BATCH_MAX_ITEMS,
+) -> LoadReport:
+    """
+    부하를 걸어 측정합니다. port가 없으면 서비스를 같은 프로세스에서 띄웁니다.
+
+    Returns:
+        LoadReport: 측정 결과
+    """
+    if port is not None:
+        return await generate_load(port, texts, total, concurrency)
+
+    service = FormatService(workers, batch_items=batch_items)
+    try:
+        port = await service.start(port=0)
+        report = await generate_load(port, texts, total, concurrency)
+        return report._replace(service=service.stats)
+    finally:
+        await service.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="가다듬기 서비스 부하 생성기")
+    parser.add_argument("--requests", type=int, default=2000, help="보낼 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 연결 수")
+    parser.add_argument(
+        "--text-size", default="2KB", help="요청 하나의 텍스트 크기 (기본값: 2KB)"
+    )
+    parser.add_argument(
+        "--distinct", type=int, default=500, help="서로 다른 텍스트 수 (기본값: 500)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="서비스 작업자 수 (기본값: CPU 수)"
+    )
+    parser.add_argument(
+        "--batch-items",
+        type=int,
+        default=BATCH_MAX_ITEMS,
+        help=f"한 묶음의 최대 요청 수 (기본값: {BATCH_MAX_ITEMS}, 1이면 묶지 않음)",
+    )
+    parser.add_argument(
+        "--port", type=int, default=None, help="이미 떠 있는 서비스의 포트"
+    )
+    args = parser.parse_args()
+
+    size = parse_size(args.text_size)
+    texts = [generate_corpus(size, seed=seed) for seed in range(args.distinct)]
+    report = asyncio.run(
+        run(
+            args.requests,
+            args.concurrency,
+            texts,
+            args.workers,
+            args.port,
+            args.batch_items,
+        )
+    )
+
+    print(
+        f"요청 {report.requests}개 (텍스트 {format_size(size)}, 서로 다른 텍스트 "
+        f"{args.distinct}개), 동시 연결 {args.concurrency}개"
+    )
+    print(
+        f"p50 {report.p50 * 1000:.2f}ms, p99 {report.p99 * 1000:.2f}ms, "
+        f"{report.requests_per_second:.0f} req/s, 오류 {report.errors}개"
+    )
+    if report.service is not None:
+        stats = report.service
+        print(
+            f"묶음 {stats.batches}개 (평균 {stats.batch_size:.1f}개), "
+            f"합친 요청 {stats.coalesced}개, 거절 {stats.rejected}개"
+        )
+
+
+if __name__ == "__main__":
+    main()
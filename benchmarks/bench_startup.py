@@ -0,0 +1,237 @@
+"""
+시작 시간 벤치마크 (임포트 시간 회귀 확인)
+GUI 없이 쓰는 모듈을 새 파이썬 프로세스에서 가져오는 시간(-X importtime의 누적 시간)을 재고,
+그 모듈들(GUI 진입점 main.py 포함)이 Qt(PySide6, shiboken6)를 불러오지 않는지 확인합니다.
+--gui를 주면 main.py --measure-startup으로 창을 처음 그리기까지의 단계별 시간도 잽니다.
+
+저장해 둔 기준 결과보다 허용치 넘게 느려졌거나 Qt를 불러온 모듈이 있으면 실패(종료 코드 1)합니다.
+
+사용법:
+    python -m benchmarks.bench_startup --output startup.json
+    python -m benchmarks.bench_startup --baseline startup.json --threshold 0.2 --gui
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+
+# Qt 없이 가져올 수 있어야 하는 모듈
+QT_FREE_MODULES = (
+    "utils.text_counter",
+    "core.text_processor",
+    "core.plan",
+    "core.batch",
+    "core.service",
+    "core.pipe",
+    "utils.clipboard_helper",
+    "cli",
+    "main",
+)
+
+# Qt를 불러왔는지 판단하는 모듈 이름 접두사
+QT_MODULE_PREFIXES = ("PySide6", "shiboken6")
+
+# 저장소 최상위 (하위 프로세스의 작업 디렉터리)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 가져온 뒤 Qt 모듈이 있는지 표준 출력에 쓰는 코드
+_IMPORT_CODE = (
+    "import sys; import {module}; "
+    "print(any(name.startswith({prefixes!r}) for name in sys.modules))"
+)
+
+
+class ImportTiming(NamedTuple):
+    """모듈 하나의 임포트 측정 결과"""
+
+    module: str
+    seconds: float  # 반복 측정의 중앙값 (의존 모듈 포함 누적 시간)
+    qt: bool  # Qt 모듈을 불러왔는지 여부
+
+
+def _environment() -> Dict[str, str]:
+    """하위 프로세스 환경 (첫 실행에서 바이트코드를 써 두어 컴파일 시간이 섞이지 않도록 함)"""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def _import_time(stderr: str, module: str) -> float:
+    """-X importtime 출력에서 모듈의 누적 시간(초)을 찾습니다."""
+    for line in reversed(stderr.splitlines()):
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1e6
+    raise ValueError(f"임포트 시간을 찾을 수 없습니다: {module}")
+
+
+def measure_import(module: str, repeat: int = 5) -> ImportTiming:
+    """
+    새 파이썬 프로세스에서 모듈을 repeat번 가져와 누적 임포트 시간의 중앙값을 구합니다.
+    (측정 전에 한 번 가져와 바이트코드를 준비함)
+
+    Args:
+        module (str): 가져올 모듈 이름
+        repeat (int): 반복 횟수
+
+    Returns:
+        ImportTiming: 측정 결과
+    """
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        _IMPORT_CODE.format(module=module, prefixes=QT_MODULE_PREFIXES),
+    ]
+    env = _environment()
+    seconds = []
+    qt = False
+    for index in range(repeat + 1):
+        completed = subprocess.run(
+            command, cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        if index:
+            seconds.append(_import_time(completed.stderr, module))
+        qt = completed.stdout.strip() == "True"
+    return ImportTiming(module, statistics.median(seconds), qt)
+
+
+def measure_gui(repeat: int = 3) -> Dict[str, float]:
+    """
+    main.py --measure-startup을 repeat번 실행해 시작 단계별 시간(초)의 중앙값을 구합니다.
+
+    Returns:
+        Dict[str, float]: 단계 이름 → 앞 단계가 끝난 뒤 걸린 시간
+    """
+    samples: Dict[str, List[float]] = {}
+    command = [sys.executable, os.path.join(ROOT, "main.py"), "--measure-startup"]
+    for index in range(repeat + 1):
+        completed = subprocess.run(
+            command,
+            cwd=ROOT,
+            env=_environment(),
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=60,
+        )
+        if not index:
+            continue
+        # 줄 형식: "   12.3ms   45.6ms  단계 이름"
+        for line in completed.stderr.splitlines():
+            fields = line.split(None, 2)
+            if len(fields) == 3 and fields[0].endswith("ms"):
+                samples.setdefault(fields[2], []).append(float(fields[0][:-2]) / 1000)
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def run(
+    modules: Sequence[str] = QT_FREE_MODULES, repeat: int = 5, gui: bool = False
+) -> Dict[str, object]:
+    """
+    모듈별 임포트 시간과 (gui면) 창을 처음 그리기까지의 시간을 잽니다.
+
+    Returns:
+        Dict[str, object]: JSON으로 저장할 수 있는 결과
+    """
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "imports": [measure_import(module, repeat)._asdict() for module in modules],
+        "gui": measure_gui(repeat) if gui else None,
+    }
+
+
+def compare(
+    current: Dict[str, object], baseline: Dict[str, object], threshold: float
+) -> List[Tuple[str, float, float, bool]]:
+    """
+    기준 결과와 임포트 시간(과 GUI 단계별 시간)을 비교합니다. 양쪽에 모두 있는 항목만 비교합니다.
+
+    Args:
+        current (Dict[str, object]): 현재 결과
+        baseline (Dict[str, object]): 기준 결과
+        threshold (float): 허용 비율 (0.2 = 기준보다 20% 느려질 때까지 허용)
+
+    Returns:
+        List[Tuple[str, float, float, bool]]: (항목, 기준 시간, 현재 시간, 허용치 초과 여부)
+    """
+
+    def timings(report: Dict[str, object]) -> Dict[str, float]:
+        result = {item["module"]: item["seconds"] for item in report["imports"]}
+        for name, seconds in (report.get("gui") or {}).items():
+            result[f"gui: {name}"] = seconds
+        return result
+
+    before = timings(baseline)
+    rows = []
+    for name, after in timings(current).items():
+        if name in before:
+            regressed = after > before[name] * (1 + threshold)
+            rows.append((name, before[name], after, regressed))
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="시작 시간 벤치마크 (임포트 시간 회귀 확인)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="항목당 반복 횟수")
+    parser.add_argument(
+        "--gui", action="store_true", help="창을 처음 그리기까지의 시간도 측정"
+    )
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="기준 대비 허용 비율 (기본값: 0.2 = 20%% 느려질 때까지 허용)",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(repeat=args.repeat, gui=args.gui)
+    failed = False
+    for item in report["imports"]:
+        mark = "Qt 불러옴" if item["qt"] else ""
+        print(f"{item['module']:<28}{item['seconds'] * 1000:>9.1f}ms {mark}")
+        failed |= item["qt"]
+    for name, seconds in (report["gui"] or {}).items():
+        print(f"{'gui: ' + name:<28}{seconds * 1000:>9.1f}ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, ensure_ascii=False, indent=2)
+            output_file.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        rows = compare(report, baseline, args.threshold)
+        regressions = [row for row in rows if row[3]]
+        for name, before, after, regressed in rows:
+            mark = "느려짐" if regressed else ""
+            print(
+                f"{name:<28}{before * 1000:>9.1f}ms{after * 1000:>9.1f}ms"
+                f"{after / before if before else float('inf'):>8.2f}x {mark}",
+                file=sys.stderr,
+            )
+        print(
+            f"기준 대비 {len(rows)}개 항목 중 {len(regressions)}개가 "
+            f"허용치({args.threshold:.0%})를 넘었습니다",
+            file=sys.stderr,
+        )
+        failed |= bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
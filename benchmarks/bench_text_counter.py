@@ -0,0 +1,92 @@
+"""
+text_counter 카운팅 벤치마크
+이전 구현(호출마다 제외 문자 집합 생성 + 리스트 컴프리헨션)과 현재 구현을 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_text_counter --size 10MB
+"""
+
+import argparse
+from typing import List, Tuple
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size
+from benchmarks.legacy import (
+    legacy_count_all_chars,
+    legacy_count_all_chars_with_period,
+    legacy_count_korean,
+    legacy_count_visible_chars,
+)
+from benchmarks.measure import best_of
+from utils.text_counter import (
+    count_all_chars,
+    count_all_chars_with_period,
+    count_korean,
+    count_many,
+    count_visible_chars,
+)
+
+
+COUNTERS = (
+    ("count_all_chars", legacy_count_all_chars, count_all_chars),
+    (
+        "count_all_chars_with_period",
+        legacy_count_all_chars_with_period,
+        count_all_chars_with_period,
+    ),
+    ("count_visible_chars", legacy_count_visible_chars, count_visible_chars),
+    ("count_korean", legacy_count_korean, count_korean),
+)
+
+
+def run(size: int, repeat: int = 3) -> List[Tuple[str, float, float]]:
+    """
+    전체 텍스트 카운팅과 단어별 카운팅을 이전/현재 구현으로 측정합니다.
+
+    Returns:
+        List[Tuple[str, float, float]]: (항목, 이전 구현 초, 현재 구현 초)
+    """
+    text = generate_corpus(size)
+    words = text.split()
+    rows = []
+
+    for name, legacy, current in COUNTERS:
+        assert legacy(text) == current(text), name
+        rows.append(
+            (
+                f"{name}(text)",
+                best_of(lambda: legacy(text), repeat),
+                best_of(lambda: current(text), repeat),
+            )
+        )
+
+    for name, legacy, current in COUNTERS:
+        assert [legacy(word) for word in words] == count_many(words, current), name
+        rows.append(
+            (
+                f"count_many(words, {name})",
+                best_of(lambda: [legacy(word) for word in words], repeat),
+                best_of(lambda: count_many(words, current), repeat),
+            )
+        )
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="text_counter 카운팅 벤치마크")
+    parser.add_argument("--size", default="10MB", help="말뭉치 크기 (기본값: 10MB)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    size = parse_size(args.size)
+    print(f"말뭉치 {format_size(size)}, 최소값 기준 {args.repeat}회 반복")
+    print(f"{'항목':<45}{'이전':>10}{'현재':>10}{'배속':>8}")
+    for name, legacy_seconds, current_seconds in run(size, args.repeat):
+        print(
+            f"{name:<45}{legacy_seconds:>9.3f}s{current_seconds:>9.3f}s"
+            f"{legacy_seconds / current_seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
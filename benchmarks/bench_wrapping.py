@@ -0,0 +1,102 @@
+"""
+줄 나누기 엔진 벤치마크
+이전 구현(줄 문자열 누적, 문단 분할 후 재결합)과 구간 기반 엔진의
+소요 시간과 할당 메모리 최대치(tracemalloc)를 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_wrapping --size 100MB --repeat 1
+"""
+
+import argparse
+from typing import List, Tuple
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size
+from benchmarks.legacy import LegacyTextProcessor
+from benchmarks.measure import best_of, peak_memory
+from core.text_processor import DEFAULT_LINE_LENGTH, TextProcessor
+from core.wrapping import wrap_spans
+from utils.text_counter import count_all_chars
+
+
+def run(
+    size: int, width: int = DEFAULT_LINE_LENGTH, repeat: int = 3
+) -> List[Tuple[str, float, float, int, int]]:
+    """
+    분할 함수별로 이전/현재 구현의 시간과 메모리를 측정합니다.
+
+    Returns:
+        List[Tuple[str, float, float, int, int]]:
+            (항목, 이전 초, 현재 초, 이전 최대 할당, 현재 최대 할당)
+    """
+    legacy = LegacyTextProcessor()
+    processor = TextProcessor()
+    raw = generate_corpus(size)
+    separated = processor.separate_sentences_by_period(raw)
+
+    cases = (
+        (
+            "split_by_all_chars",
+            lambda: legacy.split_by_all_chars(separated, width),
+            lambda: processor.split_by_all_chars(separated, width),
+        ),
+        (
+            "split_by_all_chars_simple",
+            lambda: legacy.split_by_all_chars_simple(raw, width),
+            lambda: processor.split_by_all_chars_simple(raw, width),
+        ),
+        (
+            "split_by_korean_count",
+            lambda: legacy.split_by_korean_count(raw, width),
+            lambda: processor.split_by_korean_count(raw, width),
+        ),
+        (
+            "split_by_all_chars -> Lines",
+            lambda: legacy.split_by_all_chars(separated, width),
+            lambda: wrap_spans(
+                separated,
+                width,
+                count_all_chars,
+                processor._split_long_word_by_all_chars,
+                paragraphs=True,
+            ),
+        ),
+    )
+
+    rows = []
+    for name, legacy_func, current_func in cases:
+        assert list(legacy_func()) == list(current_func()), name
+        rows.append(
+            (
+                name,
+                best_of(legacy_func, repeat),
+                best_of(current_func, repeat),
+                peak_memory(legacy_func),
+                peak_memory(current_func),
+            )
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="줄 나누기 엔진 벤치마크")
+    parser.add_argument("--size", default="10MB", help="말뭉치 크기 (기본값: 10MB)")
+    parser.add_argument(
+        "--width", type=int, default=DEFAULT_LINE_LENGTH, help="한 줄당 문자 수"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    size = parse_size(args.size)
+    print(f"말뭉치 {format_size(size)}, 줄 길이 {args.width}, {args.repeat}회 반복")
+    print(f"{'항목':<32}{'이전':>10}{'현재':>10}{'이전 메모리':>14}{'현재 메모리':>14}")
+    for name, legacy_s, current_s, legacy_peak, current_peak in run(
+        size, args.width, args.repeat
+    ):
+        print(
+            f"{name:<32}{legacy_s:>9.3f}s{current_s:>9.3f}s"
+            f"{legacy_peak / 1024**2:>12.1f}MB{current_peak / 1024**2:>12.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+벤치마크용 합성 말뭉치 생성기
+같은 (크기, 시드)에 대해 항상 같은 텍스트를 만듭니다.
+"""
+
+import random
+import re
+
+
+KOREAN_WORDS = (
+    "안녕하세요",
+    "저는",
+    "텍스트",
+    "가다듬기",
+    "프로그램을",
+    "개발하고",
+    "있는",
+    "개발자입니다",
+    "오늘은",
+    "날씨가",
+    "정말",
+    "좋습니다",
+    "우리는",
+    "함께",
+    "영상",
+    "대본을",
+    "자막으로",
+    "만들어",
+    "봅시다",
+    "이",
+    "문장은",
+    "예시입니다",
+    "한국어",
+    "문자",
+    "수를",
+    "기준으로",
+    "줄을",
+    "나눕니다",
+    "그리고",
+    "하지만",
+    "그래서",
+    "또한",
+    "여러분",
+    "감사합니다",
+    "처리",
+    "속도가",
+    "빨라졌습니다",
+    "긴단어가나다라마바사아자차카타파하",
+    "ㅋㅋㅋ",
+    "구독과",
+    "좋아요",
+)
+
+ENGLISH_WORDS = (
+    "Hello",
+    "world",
+    "text",
+    "breaker",
+    "Python",
+    "PySide6",
+    "line",
+    "length",
+    "subtitle",
+    "script",
+    "format",
+    "the",
+    "a",
+    "of",
+    "and",
+    "to",
+    "in",
+    "performance",
+    "benchmark",
+    "verylongidentifierwithoutanyspaces",
+    "OK",
+)
+
+OTHER_TOKENS = ("123", "2024", "3.14", "100%", "(예시)", "#태그", "e-mail", "v1.2")
+
+SENTENCE_ENDINGS = (".", ".", ".", "!", "?", ",", "")
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMG]?)B?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_size(value: str) -> int:
+    """'1KB', '10MB', '512' 같은 크기 표기를 바이트 수로 변환합니다."""
+    match = _SIZE_PATTERN.match(str(value))
+    if not match:
+        raise ValueError(f"잘못된 크기 표기입니다: {value!r}")
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit.upper()])
+
+
+def format_size(num_bytes: int) -> str:
+    """바이트 수를 '10MB' 형태로 표기합니다."""
+    for unit in ("G", "M", "K"):
+        scale = _SIZE_UNITS[unit]
+        if num_bytes >= scale and num_bytes % scale == 0:
+            return f"{num_bytes // scale}{unit}B"
+    return f"{num_bytes}B"
+
+
+def generate_corpus(size: int, seed: int = 0, korean_ratio: float = 0.7) -> str:
+    """
+    한글/영문이 섞인 결정적 합성 텍스트를 생성합니다.
+    문장 끝 마침표, 쉼표, 개행, 빈 행, 보이지 않는 문자, 긴 단어를 고루 포함합니다.
+
+    Args:
+        size (int): 대략적인 UTF-8 바이트 크기
+        seed (int): 난수 시드
+        korean_ratio (float): 한글 단어 비율
+
+    Returns:
+        str: 생성된 텍스트 (UTF-8로 size 바이트 이하)
+    """
+    rng = random.Random(seed)
+    choices = rng.choices
+    word_pool = KOREAN_WORDS + ENGLISH_WORDS + OTHER_TOKENS
+    weights = (
+        [korean_ratio / len(KOREAN_WORDS)] * len(KOREAN_WORDS)
+        + [(1 - korean_ratio) * 0.8 / len(ENGLISH_WORDS)] * len(ENGLISH_WORDS)
+        + [(1 - korean_ratio) * 0.2 / len(OTHER_TOKENS)] * len(OTHER_TOKENS)
+    )
+
+    parts = []
+    total = 0
+    while total < size:
+        words = choices(word_pool, weights, k=rng.randint(3, 14))
+        sentence = " ".join(words) + rng.choice(SENTENCE_ENDINGS)
+        roll = rng.random()
+        if roll < 0.08:
+            separator = "\n\n"
+        elif roll < 0.2:
+            separator = "\n"
+        elif roll < 0.21:
+            separator = " ​"
+        else:
+            separator = " "
+        parts.append(sentence + separator)
+        total += len(parts[-1].encode("utf-8"))
+
+    text = "".join(parts)
+    encoded = text.encode("utf-8")
+    if len(encoded) > size:
+        text = encoded[:size].decode("utf-8", "ignore")
+    return text
+
+
+def generate_line_list(size: int, seed: int = 0) -> str:
+    """
+    마침표 없이 짧은 줄만 개행으로 이어진 텍스트(가사, 목록 등)를 생성합니다.
+    개행마다 다음 마침표를 찾아 앞으로 훑는 구현이 제곱 시간이 되는 입력입니다.
+
+    Args:
+        size (int): 대략적인 UTF-8 바이트 크기
+        seed (int): 난수 시드
+
+    Returns:
+        str: 생성된 텍스트 (UTF-8로 size 바이트 이하)
+    """
+    rng = random.Random(seed)
+    word_pool = KOREAN_WORDS + ENGLISH_WORDS
+
+    parts = []
+    total = 0
+    while total < size:
+        line = " ".join(rng.choices(word_pool, k=rng.randint(1, 5)))
+        parts.append(line + "\n" * rng.choice((1, 1, 1, 2)))
+        total += len(parts[-1].encode("utf-8"))
+
+    text = "".join(parts)
+    encoded = text.encode("utf-8")
+    if len(encoded) > size:
+        text = encoded[:size].decode("utf-8", "ignore")
+    return text
@@ -0,0 +1,102 @@
+"""
+벤치마크 측정 도우미
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    """repeat번 실행한 중 가장 짧은 시간(초)을 반환합니다."""
+    return min(timings(func, repeat))
+
+
+def timings(func: Callable[[], object], repeat: int, calls: int = 1) -> List[float]:
+    """
+    repeat번 측정한 각 소요 시간(초)을 반환합니다.
+    calls가 2 이상이면 한 번 측정에 calls번 호출하고 호출당 평균 시간을 기록합니다.
+    """
+    result = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        result.append((time.perf_counter() - started) / calls)
+    return result
+
+
+def calls_for(func: Callable[[], object], min_seconds: float = 0.005) -> int:
+    """한 번 측정이 min_seconds 이상 걸리도록 하는 호출 횟수를 구합니다."""
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    if elapsed >= min_seconds:
+        return 1
+    return min(10_000, int(min_seconds / max(elapsed, 1e-7)) + 1)
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """
+    함수 실행 중 새로 할당된 메모리의 최대치(바이트)를 tracemalloc으로 측정합니다.
+    반환값은 측정이 끝날 때까지 살아 있으므로 결과 객체 크기도 포함됩니다.
+    """
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        del result
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def peak_rss() -> int:
+    """
+    현재 프로세스의 최대 상주 메모리(RSS, 바이트)를 반환합니다.
+    Windows는 PeakWorkingSetSize, Linux는 /proc/self/status의 VmHWM,
+    그 외에는 getrusage의 ru_maxrss를 사용합니다.
+    (Linux의 ru_maxrss는 exec 전 부모 프로세스의 값을 이어받으므로 쓰지 않음)
+    """
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(
+            ctypes.windll.kernel32.GetCurrentProcess(),
+            ctypes.byref(counters),
+            counters.cb,
+        )
+        return counters.PeakWorkingSetSize
+
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux 등은 KB 단위
+    return peak if sys.platform == "darwin" else peak * 1024
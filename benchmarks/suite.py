@@ -0,0 +1,373 @@
+"""
+TextProcessor / text_counter 전체 진입점 성능 벤치마크 모음
+결정적 합성 말뭉치를 크기별로 만들어 진입점마다 반복 측정하고,
+처리량, 지연 시간(p50/p95), 최대 할당 메모리를 JSON으로 기록합니다.
+저장해 둔 기준 결과와 비교해 허용치보다 느려진 항목이 있으면 실패(종료 코드 1)합니다.
+
+사용법:
+    python -m benchmarks.suite --sizes 1KB,1MB,10MB --output result.json
+    python -m benchmarks.suite --baseline result.json --threshold 0.2
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from benchmarks.corpus import format_size, generate_corpus, parse_size
+from benchmarks.measure import calls_for, peak_memory, timings
+from core.text_processor import DEFAULT_LINE_LENGTH, TextProcessor
+from utils.text_counter import (
+    count_all_chars,
+    count_all_chars_with_period,
+    count_display_width,
+    count_korean,
+    count_many,
+    count_visible_chars,
+    is_korean_char,
+    is_visible_char,
+)
+
+
+DEFAULT_SIZES = "1KB,64KB,1MB"
+
+# 측정 가능한 최대 말뭉치 크기
+MAX_SIZE = 100 * 1024**2
+
+# 결과 JSON 형식 버전 (필드가 바뀌면 올림)
+SCHEMA_VERSION = 1
+
+
+class Case(NamedTuple):
+    """측정 항목: 이름과, 말뭉치를 받아 측정할 함수를 만드는 함수"""
+
+    name: str
+    prepare: Callable[[str], Callable[[], object]]
+
+
+def build_cases(line_length: int = DEFAULT_LINE_LENGTH) -> List[Case]:
+    """
+    측정할 모든 진입점 목록을 만듭니다.
+
+    Args:
+        line_length (int): 줄 나누기 함수에 쓸 한 줄당 문자 수
+
+    Returns:
+        List[Case]: 측정 항목 목록
+    """
+    processor = TextProcessor()
+    plan = processor.compile(line_length)
+    cases = []
+
+    for use_all_chars in (True, False):
+        for separate_sentences in (True, False):
+            for balanced in (False, True):
+
+                def prepare(text, a=use_all_chars, s=separate_sentences, b=balanced):
+                    return lambda: processor.format_text_with_options(
+                        text, line_length, a, s, b
+                    )
+
+                cases.append(
+                    Case(
+                        f"format_text_with_options[all_chars={use_all_chars},"
+                        f"sentences={separate_sentences},balanced={balanced}]",
+                        prepare,
+                    )
+                )
+
+    cases += [
+        Case(
+            "format_text",
+            lambda text: lambda: processor.format_text(text, line_length),
+        ),
+        Case(
+            "format_lines",
+            lambda text: lambda: processor.format_lines(text, line_length),
+        ),
+        Case("FormatPlan.format", lambda text: lambda: plan.format(text)),
+        Case(
+            "iter_format",
+            lambda text: lambda: list(processor.iter_format([text], line_length)),
+        ),
+        Case(
+            "split_by_korean_count",
+            lambda text: lambda: processor.split_by_korean_count(text, line_length),
+        ),
+        Case(
+            "split_by_all_chars_simple",
+            lambda text: lambda: processor.split_by_all_chars_simple(text, line_length),
+        ),
+        Case(
+            "split_by_all_chars",
+            lambda text: _with_separated(
+                processor,
+                text,
+                lambda separated: processor.split_by_all_chars(separated, line_length),
+            ),
+        ),
+        Case(
+            "split_by_display_width",
+            lambda text: lambda: processor.split_by_display_width(text, line_length),
+        ),
+        Case(
+            "separate_sentences_by_period",
+            lambda text: lambda: processor.separate_sentences_by_period(text),
+        ),
+    ]
+
+    for counter in (
+        count_all_chars,
+        count_all_chars_with_period,
+        count_visible_chars,
+        count_korean,
+        count_display_width,
+    ):
+        cases.append(Case(counter.__name__, lambda text, c=counter: lambda: c(text)))
+        cases.append(
+            Case(
+                f"count_many[{counter.__name__}]",
+                lambda text, c=counter: _with_words(
+                    text, lambda words: count_many(words, c)
+                ),
+            )
+        )
+
+    for predicate in (is_visible_char, is_korean_char):
+        cases.append(
+            Case(
+                predicate.__name__,
+                lambda text, p=predicate: lambda: sum(map(p, text)),
+            )
+        )
+
+    return cases
+
+
+def _with_separated(
+    processor: TextProcessor, text: str, func: Callable[[str], object]
+) -> Callable[[], object]:
+    """마침표 분리를 미리 해 두고 분리된 텍스트만 측정합니다."""
+    separated = processor.separate_sentences_by_period(text)
+    return lambda: func(separated)
+
+
+def _with_words(text: str, func: Callable[[List[str]], object]) -> Callable[[], object]:
+    """단어 분할을 미리 해 두고 단어 목록 처리만 측정합니다."""
+    words = text.split()
+    return lambda: func(words)
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """정렬된 값의 백분위수를 구합니다. (최근접 순위 방식)"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure_case(
+    case: Case, text: str, size: str, repeat: int, memory: bool = True
+) -> Dict[str, object]:
+    """
+    항목 하나를 측정합니다.
+    작은 입력은 한 번 측정에 여러 번 호출해 타이머 해상도보다 충분히 길게 잽니다.
+
+    Args:
+        case (Case): 측정 항목
+        text (str): 말뭉치
+        size (str): 결과에 기록할 말뭉치 크기 표기
+        repeat (int): 반복 횟수 (지연 시간 분포용)
+        memory (bool): tracemalloc으로 최대 할당량을 측정할지 여부
+
+    Returns:
+        Dict[str, object]: 측정 결과 한 건 (시간은 호출 1회당 초)
+    """
+    func = case.prepare(text)
+    calls = calls_for(func)  # 예열 겸 호출 횟수 보정
+    samples = timings(func, repeat, calls)
+    input_bytes = len(text.encode("utf-8"))
+    p50 = percentile(samples, 0.5)
+
+    return {
+        "name": case.name,
+        "size": size,
+        "bytes": input_bytes,
+        "repeat": repeat,
+        "calls": calls,
+        "p50": p50,
+        "p95": percentile(samples, 0.95),
+        "mean": sum(samples) / len(samples),
+        "throughput_mb_s": input_bytes / 1024**2 / p50 if p50 > 0 else None,
+        "peak_bytes": peak_memory(func) if memory else None,
+    }
+
+
+def run_suite(
+    sizes: Sequence[int],
+    repeat: int = 5,
+    name_filter: str = "",
+    memory: bool = True,
+    seed: int = 0,
+    line_length: int = DEFAULT_LINE_LENGTH,
+    on_result: Optional[Callable[[Dict[str, object]], None]] = None,
+) -> Dict[str, object]:
+    """
+    크기별 말뭉치에 대해 모든 항목을 측정합니다.
+
+    Args:
+        sizes (Sequence[int]): 말뭉치 크기 목록 (바이트)
+        repeat (int): 항목당 반복 횟수
+        name_filter (str): 이름에 이 문자열이 포함된 항목만 측정
+        memory (bool): 최대 할당 메모리 측정 여부
+        seed (int): 말뭉치 난수 시드
+        line_length (int): 한 줄당 문자 수
+        on_result (Optional[Callable[[Dict[str, object]], None]]): 항목마다 호출
+
+    Returns:
+        Dict[str, object]: 실행 환경 정보와 측정 결과 목록 (JSON 직렬화 가능)
+    """
+    cases = [case for case in build_cases(line_length) if name_filter in case.name]
+    results = []
+    for size in sizes:
+        text = generate_corpus(size, seed)
+        for case in cases:
+            result = measure_case(case, text, format_size(size), repeat, memory)
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "line_length": line_length,
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, object], baseline: Dict[str, object], threshold: float
+) -> List[Tuple[str, str, float, float, bool]]:
+    """
+    기준 결과와 p50을 비교합니다. 양쪽에 모두 있는 (항목, 크기)만 비교합니다.
+
+    Args:
+        current (Dict[str, object]): 현재 결과
+        baseline (Dict[str, object]): 기준 결과
+        threshold (float): 허용 비율 (0.2 = 기준보다 20% 느려질 때까지 허용)
+
+    Returns:
+        List[Tuple[str, str, float, float, bool]]:
+            (항목, 크기, 기준 p50, 현재 p50, 허용치 초과 여부)
+    """
+    baseline_p50 = {
+        (result["name"], result["size"]): result["p50"]
+        for result in baseline["results"]
+    }
+    rows = []
+    for result in current["results"]:
+        key = (result["name"], result["size"])
+        if key not in baseline_p50:
+            continue
+        before = baseline_p50[key]
+        rows.append(
+            (*key, before, result["p50"], result["p50"] > before * (1 + threshold))
+        )
+    return rows
+
+
+def _print_result(result: Dict[str, object]) -> None:
+    throughput = result["throughput_mb_s"]
+    peak = result["peak_bytes"]
+    print(
+        f"{result['name']:<58}{result['size']:>8}"
+        f"{result['p50'] * 1000:>11.3f}ms{result['p95'] * 1000:>11.3f}ms"
+        f"{throughput if throughput is not None else float('inf'):>10.1f}MB/s"
+        + (f"{peak / 1024**2:>10.1f}MB" if peak is not None else ""),
+        file=sys.stderr,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="전체 진입점 성능 벤치마크")
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"쉼표로 구분한 말뭉치 크기, 1KB~100MB (기본값: {DEFAULT_SIZES})",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="항목당 반복 횟수")
+    parser.add_argument("--filter", default="", help="이름에 포함된 항목만 측정")
+    parser.add_argument("--seed", type=int, default=0, help="말뭉치 난수 시드")
+    parser.add_argument(
+        "--width", type=int, default=DEFAULT_LINE_LENGTH, help="한 줄당 문자 수"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="최대 할당 메모리 측정 생략"
+    )
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (생략 시 표준 출력)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="기준 대비 허용 비율 (기본값: 0.2 = 20%% 느려질 때까지 허용)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        sizes = [parse_size(size) for size in args.sizes.split(",")]
+    except ValueError as e:
+        parser.error(str(e))
+    if any(not 1024 <= size <= MAX_SIZE for size in sizes):
+        parser.error("말뭉치 크기는 1KB~100MB 범위여야 합니다")
+
+    print(
+        f"{'항목':<58}{'크기':>8}{'p50':>13}{'p95':>13}{'처리량':>14}{'메모리':>12}",
+        file=sys.stderr,
+    )
+    report = run_suite(
+        sizes,
+        args.repeat,
+        args.filter,
+        memory=not args.no_memory,
+        seed=args.seed,
+        line_length=args.width,
+        on_result=_print_result,
+    )
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output + "\n")
+    else:
+        print(output)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    rows = compare(report, baseline, args.threshold)
+    regressions = [row for row in rows if row[4]]
+    for name, size, before, after, regressed in rows:
+        mark = "느려짐" if regressed else ""
+        print(
+            f"{name:<58}{size:>8}{before * 1000:>11.3f}ms{after * 1000:>11.3f}ms"
+            f"{after / before if before else float('inf'):>8.2f}x {mark}",
+            file=sys.stderr,
+        )
+    print(
+        f"기준 대비 {len(rows)}개 항목 중 {len(regressions)}개가 "
+        f"허용치({args.threshold:.0%})를 넘었습니다",
+        file=sys.stderr,
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
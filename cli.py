@@ -0,0 +1,285 @@
+"""
+명령줄 진입점 (GUI 없이 동작)
+
+사용 예:
+    python cli.py format --width 18 --no-sentence-split --jobs 4 in/ out/
+    python cli.py serve --port 8765 --workers 4
+    python cli.py pipe --workers 4 < requests.jsonl > results.jsonl
+    python cli.py format --metrics-file word_breaker.prom in/ out/
+"""
+
+import argparse
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from core.batch import FileResult, format_directory
+from core.cancellation import CancellationToken, OperationCancelled
+from core.metrics import MetricsRegistry
+from core.pipe import run_pipe
+from core.service import DEFAULT_HOST, DEFAULT_PORT, QUEUE_SIZE, serve
+from core.text_processor import DEFAULT_LINE_LENGTH
+
+
+def _format_size(num_bytes: float) -> str:
+    """바이트 수를 읽기 쉬운 단위로 변환합니다."""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def _print_failure(result: FileResult) -> None:
+    """실패한 파일만 출력합니다."""
+    if result.error:
+        print(f"FAIL {result.source}: {result.error}", file=sys.stderr)
+
+
+def _print_file_result(result: FileResult) -> None:
+    """파일 하나의 처리 시간과 처리량을 출력합니다."""
+    if result.error:
+        _print_failure(result)
+        return
+
+    rate = result.input_bytes / result.seconds if result.seconds > 0 else 0.0
+    print(
+        f"ok   {result.source} -> {result.destination} "
+        f"({_format_size(result.input_bytes)}, {result.seconds * 1000:.1f}ms, "
+        f"{_format_size(rate)}/s)"
+    )
+
+
+def _positive_int(value: str) -> int:
+    """1 이상의 정수 인자 (아니면 argparse 오류로 사용법과 함께 종료)"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+
+def _add_metrics_arguments(parser: argparse.ArgumentParser) -> None:
+    """처리 지표 내보내기 인자를 추가합니다."""
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        default=None,
+        help="끝난 뒤 처리 지표를 Prometheus 텍스트 형식으로 쓸 파일",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="실행 중에 http://127.0.0.1:PORT/metrics로 처리 지표를 내보냄",
+    )
+
+
+@contextmanager
+def _metrics_export(args: argparse.Namespace) -> Iterator[Optional[MetricsRegistry]]:
+    """
+    지표 인자를 주었으면 지표 모음을 만들어 실행 중에 내보내고, 끝나면(실패해도) 파일에 씁니다.
+    인자가 없으면 None을 넘겨 지표를 모으지 않습니다.
+    """
+    if args.metrics_file is None and args.metrics_port is None:
+        yield None
+        return
+
+    registry = MetricsRegistry()
+    server = None
+    if args.metrics_port is not None:
+        server = registry.serve(port=args.metrics_port)
+    try:
+        yield registry
+    finally:
+        if server is not None:
+            server.close()
+        if args.metrics_file is not None:
+            registry.write_textfile(args.metrics_file)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 파서를 생성합니다."""
+    parser = argparse.ArgumentParser(
+        prog="word-breaker", description="텍스트 문단 가다듬기 (명령줄 모드)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    format_parser = commands.add_parser(
+        "format", help="디렉터리의 텍스트 파일을 일괄로 가다듬습니다"
+    )
+    format_parser.add_argument("src", type=Path, help="입력 디렉터리")
+    format_parser.add_argument("dst", type=Path, help="출력 디렉터리")
+    format_parser.add_argument(
+        "--width",
+        type=int,
+        default=DEFAULT_LINE_LENGTH,
+        help=f"한 줄당 문자 수 (기본값: {DEFAULT_LINE_LENGTH})",
+    )
+    format_parser.add_argument(
+        "--korean-only",
+        action="store_true",
+        help="한글 문자만 카운트합니다 (기본값: 모든 문자)",
+    )
+    format_parser.add_argument(
+        "--no-sentence-split", action="store_true", help="마침표 분리를 하지 않습니다"
+    )
+    format_parser.add_argument(
+        "--balanced",
+        action="store_true",
+        help="문단마다 줄 길이를 고르게 나눕니다 (기본값: 줄을 꽉 채움)",
+    )
+    format_parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="작업 프로세스 수 (기본값: CPU 수)",
+    )
+    format_parser.add_argument(
+        "--pattern", default="*.txt", help="처리할 파일 이름 패턴 (기본값: *.txt)"
+    )
+    format_parser.add_argument(
+        "--encoding", default="utf-8", help="입출력 인코딩 (기본값: utf-8)"
+    )
+    format_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="제한 시간(초). 넘으면 남은 파일을 취소하고 종료합니다",
+    )
+    format_parser.add_argument(
+        "--quiet", action="store_true", help="실패한 파일만 출력합니다"
+    )
+    _add_metrics_arguments(format_parser)
+    format_parser.set_defaults(handler=run_format)
+
+    serve_parser = commands.add_parser(
+        "serve", help="localhost에서 HTTP/JSON 가다듬기 서비스를 실행합니다"
+    )
+    serve_parser.add_argument(
+        "--host", default=DEFAULT_HOST, help=f"받을 주소 (기본값: {DEFAULT_HOST})"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본값: {DEFAULT_PORT})"
+    )
+    serve_parser.add_argument(
+        "--workers", type=int, default=None, help="작업자 수 (기본값: CPU 수)"
+    )
+    serve_parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=QUEUE_SIZE,
+        help=f"대기열 크기, 넘치면 503으로 거절 (기본값: {QUEUE_SIZE})",
+    )
+    serve_parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="GET /metrics로 처리 지표를 Prometheus 텍스트 형식으로 내보냅니다",
+    )
+    serve_parser.set_defaults(handler=run_serve)
+
+    pipe_parser = commands.add_parser(
+        "pipe",
+        help="표준 입력의 JSON 줄을 가다듬어 표준 출력에 JSON 줄로 씁니다",
+    )
+    pipe_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="작업자 수 (기본값: 1, 2 이상이면 끝나는 대로 씀)",
+    )
+    pipe_parser.add_argument(
+        "--ordered",
+        action="store_true",
+        help="작업자가 여럿이어도 입력 순서대로 씁니다",
+    )
+    pipe_parser.add_argument(
+        "--quiet", action="store_true", help="끝난 뒤 요약을 출력하지 않습니다"
+    )
+    _add_metrics_arguments(pipe_parser)
+    pipe_parser.set_defaults(handler=run_pipe_command)
+
+    return parser
+
+
+def run_format(args: argparse.Namespace) -> int:
+    """format 명령 실행"""
+    if not args.src.is_dir():
+        print(f"입력 디렉터리가 없습니다: {args.src}", file=sys.stderr)
+        return 2
+
+    token = None if args.timeout is None else CancellationToken(args.timeout)
+    try:
+        with _metrics_export(args) as metrics:
+            summary = format_directory(
+                args.src,
+                args.dst,
+                line_length=args.width,
+                use_all_chars=not args.korean_only,
+                separate_sentences=not args.no_sentence_split,
+                jobs=args.jobs,
+                pattern=args.pattern,
+                encoding=args.encoding,
+                on_result=_print_failure if args.quiet else _print_file_result,
+                balanced=args.balanced,
+                token=token,
+                metrics=metrics,
+            )
+    except OperationCancelled:
+        print(f"제한 시간({args.timeout}초)을 넘어 중단했습니다", file=sys.stderr)
+        return 1
+
+    failed = summary.failed
+    print(
+        f"{len(summary.results)}개 파일, {_format_size(summary.input_bytes)}, "
+        f"{summary.seconds:.2f}s, {_format_size(summary.throughput)}/s"
+        + (f", 실패 {len(failed)}개" if failed else "")
+    )
+    return 1 if failed else 0
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    """serve 명령 실행 (Ctrl+C로 종료)"""
+    metrics = MetricsRegistry() if args.metrics else None
+    serve(args.host, args.port, args.workers, args.queue_size, metrics)
+    return 0
+
+
+def run_pipe_command(args: argparse.Namespace) -> int:
+    """pipe 명령 실행 (요약은 표준 오류로 출력)"""
+    try:
+        with _metrics_export(args) as metrics:
+            summary = run_pipe(
+                sys.stdin.buffer, sys.stdout.buffer, args.workers, args.ordered, metrics
+            )
+    except OSError as e:
+        if isinstance(e, BrokenPipeError):
+            # 읽는 쪽이 닫힌 경우 (예: | head): 종료할 때 남은 출력을 비우다 다시 실패하지 않도록
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            os.close(devnull)
+        print(f"출력에 쓰지 못해 중단했습니다: {e}", file=sys.stderr)
+        return 1
+    if not args.quiet:
+        print(
+            f"{summary.records}개 줄, {_format_size(summary.input_bytes)}, "
+            f"{summary.seconds:.2f}s, {_format_size(summary.throughput)}/s"
+            + (f", 실패 {summary.errors}개" if summary.errors else ""),
+            file=sys.stderr,
+        )
+    return 1 if summary.errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """메인 함수"""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+글꼴 전진 폭(advance) 표
+화면에 그려지는 자막은 글자 수가 아니라 픽셀 폭으로 줄이 넘칩니다.
+글꼴 하나에 대해 문자마다 전진 폭을 한 번만 재어 두고, 줄 나누기에서는 표만 찾아 단어 폭을 셉니다.
+
+폭은 1/64픽셀 단위 정수(26.6 고정 소수점)로 보관해 합계에 반올림 오차가 쌓이지 않고,
+정수 무게를 쓰는 기존 줄 나누기 엔진(wrap_spans, wrap_balanced)을 그대로 씁니다.
+문자별 폭의 합이므로 커닝과 합자는 반영하지 않습니다.
+
+Qt에 의존하지 않으며, 폭을 재는 함수(예: QFontMetricsF.horizontalAdvance)를 받아 씁니다.
+"""
+
+import threading
+from typing import Callable, Iterable, List
+
+
+# 1픽셀당 단위 수 (26.6 고정 소수점)
+ADVANCE_UNITS = 64
+
+
+class _Advances(dict):
+    """문자 → 전진 폭(단위) 사전. 처음 보는 문자만 재어 저장합니다."""
+
+    __slots__ = ("measure", "lock")
+
+    def __init__(self, measure: Callable[[str], float]):
+        super().__init__()
+        self.measure = measure
+        self.lock = threading.Lock()
+
+    def __missing__(self, char: str) -> int:
+        with self.lock:
+            advance = round(self.measure(char) * ADVANCE_UNITS)
+            self[char] = advance
+        return advance
+
+
+class AdvanceTable:
+    """
+    글꼴 하나의 문자별 전진 폭 표 (문자마다 한 번만 잼)
+
+    단어 무게는 단어 폭에 공백 폭 하나를 더한 값입니다.
+    줄의 단어는 공백 한 칸으로 이어지므로, 단어 n개짜리 줄의 폭이 limit(픽셀) 이하인 것과
+    무게 합이 length_for(limit) 이하인 것이 같습니다. (줄 통계도 이 단위를 씁니다)
+    """
+
+    __slots__ = ("key", "space", "_advances")
+
+    def __init__(self, measure: Callable[[str], float], key: str = ""):
+        """
+        Args:
+            measure (Callable[[str], float]): 문자 하나의 전진 폭(픽셀)을 재는 함수
+            key (str): 글꼴을 구별하는 이름 (결과 캐시 키에 쓰임)
+        """
+        self.key = key
+        self._advances = _Advances(measure)
+        self.space = self._advances[" "]
+
+    def __len__(self) -> int:
+        """지금까지 잰 문자 수"""
+        return len(self._advances)
+
+    def measure_missing(self, text: Iterable[str]) -> int:
+        """
+        text에 나오는 문자 중 아직 재지 않은 문자를 미리 잽니다.
+        글꼴을 쓸 수 있는 스레드에서 불러 두면 줄 나누기 중에는 표만 찾습니다.
+
+        Returns:
+            int: 새로 잰 문자 수
+        """
+        advances = self._advances
+        missing = set(text).difference(advances)
+        for char in missing:
+            advances[char]
+        return len(missing)
+
+    def advance(self, char: str) -> int:
+        """문자 하나의 전진 폭 (단위)"""
+        return self._advances[char]
+
+    def width(self, text: str) -> int:
+        """문자열의 폭 (단위, 문자별 전진 폭의 합)"""
+        return sum(map(self._advances.__getitem__, text))
+
+    def count(self, word: str) -> int:
+        """줄 나누기에 쓰는 단어 무게 (단어 폭 + 공백 폭)"""
+        return sum(map(self._advances.__getitem__, word), self.space)
+
+    def length_for(self, pixels: float) -> int:
+        """픽셀 줄 폭을 줄 나누기 엔진의 줄 길이(무게 합 한도)로 바꿉니다."""
+        return round(pixels * ADVANCE_UNITS) + self.space
+
+    def split_long_word(self, word: str, max_length: int) -> List[str]:
+        """
+        한 줄에 들어가지 않는 단어를 무게가 max_length 이하인 조각으로 강제 분할합니다.
+        (조각마다 최소 한 문자)
+        """
+        if not word:
+            return []
+
+        advances = self._advances
+        result = []
+        current_part = ""
+        current_width = self.space
+
+        for char in word:
+            advance = advances[char]
+            if current_width + advance <= max_length or not current_part:
+                current_part += char
+                current_width += advance
+            else:
+                result.append(current_part)
+                current_part = char
+                current_width = self.space + advance
+
+        result.append(current_part)
+        return result
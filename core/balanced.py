@@ -0,0 +1,266 @@
+"""
+균형 배치(최소 들쭉날쭉함) 줄 나누기
+문단마다 줄 길이 제한 안에서 각 줄의 남는 칸 수 제곱의 합이 가장 작은 나눔을 찾아,
+줄 길이가 고르게 되도록 합니다. (자막, 짧은 영상 대본용)
+
+줄 (i, j)의 비용 (length - 줄 문자 수)^2은 줄 문자 수에 대해 볼록하므로 사각 부등식(Monge)을
+만족합니다. 따라서 "나중 후보가 어느 위치에서 이기면 그 뒤로도 계속 이긴다"는 성질이 성립하고,
+후보를 담당 구간과 함께 덱에 쌓아 두는 방식(Galil-Park)으로 제곱 시간 없이 최적해를 구합니다.
+길이 제한을 넘는 줄은 비용이 무한대인 계단 모양 영역이라 이 성질을 깨지 않으며,
+이분 탐색 범위도 한 줄에 들어가는 단어 수로 줄어 거의 선형 시간에 동작합니다.
+"""
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from core.cancellation import Checkpoint
+from core.wrapping import Block, Lines, WrapStats, count_blocks
+
+
+def balanced_breaks(counts: Sequence[int], length: int) -> List[int]:
+    """
+    단어별 문자 수로 남는 칸 수 제곱의 합이 가장 작은 줄 나눔을 구합니다.
+    마지막 줄도 비용에 포함하므로 짧은 마지막 줄이 남지 않도록 고르게 나눕니다.
+
+    Args:
+        counts (Sequence[int]): 단어별 문자 수 (모두 length 이하)
+        length (int): 한 줄당 최대 문자 수
+
+    Returns:
+        List[int]: 각 줄이 끝나는 단어 위치 (줄 k는 단어 [결과[k-1], 결과[k])), 마지막 값은 단어 수
+    """
+    total = len(counts)
+    if not total:
+        return []
+
+    prefix = [0]
+    prefix += accumulate(counts)
+    cost = [0] * (total + 1)
+    previous = [0] * (total + 1)
+
+    # 후보 덱: candidates[k]는 starts[k]부터 다음 후보 시작 전까지의 줄 끝에서 가장 좋은 줄 시작
+    candidates = [0]
+    starts = [1]
+    head = 0
+
+    for end in range(1, total + 1):
+        while head + 1 < len(candidates) and starts[head + 1] <= end:
+            head += 1
+        begin = candidates[head]
+        slack = length - prefix[end] + prefix[begin]
+        new_cost = cost[end] = cost[begin] + slack * slack
+        previous[end] = begin
+        if end == total:
+            break
+
+        # end를 다음 줄의 시작 후보로 추가: 뒤쪽 후보를 이기는 첫 위치를 찾음
+        new_limit = prefix[end] + length
+        new_start = end + 1
+        while len(candidates) > head:
+            old = candidates[-1]
+            old_cost = cost[old]
+            limit = (
+                prefix[old] + length
+            )  # old에서 시작한 줄이 닿을 수 있는 최대 누적 문자 수
+            position = starts[-1]
+            if position <= end:
+                position = end + 1
+
+            reached = prefix[position]
+            old_slack = limit - reached
+            new_slack = new_limit - reached
+            if (
+                old_slack < 0
+                or new_cost + new_slack * new_slack <= old_cost + old_slack * old_slack
+            ):
+                # 담당 구간 첫 위치부터 이기면 구간 전체에서 이김
+                candidates.pop()
+                starts.pop()
+                continue
+
+            # old가 들어갈 수 없는 위치부터는 항상 이기므로 그 앞까지만 이분 탐색
+            low = position + 1
+            high = bisect_right(prefix, limit, low)
+            while low < high:
+                middle = (low + high) // 2
+                reached = prefix[middle]
+                old_slack = limit - reached
+                new_slack = new_limit - reached
+                if new_cost + new_slack * new_slack <= old_cost + old_slack * old_slack:
+                    high = middle
+                else:
+                    low = middle + 1
+            new_start = low
+            break
+
+        if new_start <= total:
+            candidates.append(end)
+            starts.append(new_start)
+
+    breaks = []
+    end = total
+    while end:
+        breaks.append(end)
+        end = previous[end]
+    breaks.reverse()
+    return breaks
+
+
+def wrap_balanced(
+    text: str,
+    length: int,
+    count: Callable[[str], int],
+    split_long_word: Callable[[str, int], List[str]],
+    paragraphs: bool = False,
+    stats: Optional[WrapStats] = None,
+    checkpoint: Optional[Checkpoint] = None,
+) -> Lines:
+    """
+    wrap_spans와 같은 규칙(문단 경계, 긴 단어 강제 분할)으로 나누되,
+    줄 위치는 탐욕적 배치 대신 balanced_breaks로 정합니다. (count_blocks + place_balanced)
+
+    Args:
+        text (str): 나눌 텍스트
+        length (int): 한 줄당 최대 문자 수 (공백 제외)
+        count (Callable[[str], int]): 단어의 문자 수를 세는 함수
+        split_long_word (Callable[[str, int], List[str]]): 긴 단어 강제 분할 함수
+        paragraphs (bool): 빈 행(\\n\\n)을 문단 경계로 보존할지 여부
+        stats (Optional[WrapStats]): 지정하면 나누는 중에 통계를 채움
+        checkpoint (Optional[Checkpoint]): 구간마다 취소 확인과 진행 상황 보고
+
+    Returns:
+        Lines: 원문 위의 줄 구간 목록 (문단 경계는 빈 줄, 단어가 없으면 빈 목록)
+    """
+    return place_balanced(
+        text,
+        count_blocks(text, count, stats),
+        length,
+        count,
+        split_long_word,
+        paragraphs,
+        stats,
+        checkpoint,
+    )
+
+
+def place_balanced(
+    text: str,
+    blocks: Iterable[Block],
+    length: int,
+    count: Callable[[str], int],
+    split_long_word: Callable[[str, int], List[str]],
+    paragraphs: bool = False,
+    stats: Optional[WrapStats] = None,
+    checkpoint: Optional[Checkpoint] = None,
+) -> Lines:
+    """
+    구간별 단어 정보로 줄 나눌 위치를 균형 있게 정합니다. (wrap_balanced와 Tokens.wrap의 엔진)
+
+    문단(paragraphs=False이면 텍스트 전체)의 단어를 모았다가 한 번에 배치하며,
+    길이 제한을 넘어 강제로 분할한 단어는 place_greedy와 같이 마지막 조각만 다음 단어들과 한 줄에 놓입니다.
+
+    Args:
+        text (str): 나눌 텍스트 (blocks를 만든 원문)
+        blocks (Iterable[Block]): count_blocks로 만든 구간별 단어 정보
+        length (int): 한 줄당 최대 문자 수 (공백 제외)
+        count (Callable[[str], int]): 단어의 문자 수를 세는 함수 (강제 분할한 조각에 사용)
+        split_long_word (Callable[[str, int], List[str]]): 긴 단어 강제 분할 함수
+        paragraphs (bool): 빈 행(\\n\\n)을 문단 경계로 보존할지 여부
+        stats (Optional[WrapStats]): 지정하면 줄별 문자 수, 강제 분할 수, 문단 수를 채움
+        checkpoint (Optional[Checkpoint]): 구간마다 취소 확인과 진행 상황 보고
+
+    Returns:
+        Lines: 원문 위의 줄 구간 목록 (문단 경계는 빈 줄, 단어가 없으면 빈 목록)
+    """
+    line_starts = array("q")
+    line_ends = array("q")
+    line_joins = bytearray()
+    add_start = line_starts.append
+    add_end = line_ends.append
+    add_join = line_joins.append
+
+    # 배치를 기다리는 단어들 (문단 또는 강제 분할 사이)
+    word_starts = []
+    word_ends = []
+    word_counts = []
+    word_plain = bytearray()  # 단어 앞 공백이 " " 한 칸인지 여부
+    seen_break = False
+
+    def flush(paragraph_end: bool = True) -> None:
+        start = 0
+        for end in balanced_breaks(word_counts, length):
+            add_start(word_starts[start])
+            add_end(word_ends[end - 1])
+            add_join(word_plain.find(0, start + 1, end) != -1)
+            if stats is not None:
+                stats.line_counts.append(sum(word_counts[start:end]))
+            start = end
+        if stats is not None and paragraph_end and word_counts:
+            # 강제 분할 뒤에는 마지막 조각이 항상 남으므로 단어가 있던 문단은 비어 있지 않음
+            stats.paragraphs += 1
+        word_starts.clear()
+        word_ends.clear()
+        word_counts.clear()
+        word_plain.clear()
+
+    for position, word_lengths, block_counts, gaps in blocks:
+        if checkpoint is not None:
+            checkpoint(position)
+        for word_length, word_count, gap in zip(word_lengths, block_counts, gaps):
+            plain = gap == " "
+            position += len(gap)
+            if paragraphs and not plain and "\n\n" in gap:
+                # 문단 경계: 모은 단어를 배치하고 경계 수만큼 빈 행 추가
+                flush()
+                for _ in range(gap.count("\n\n")):
+                    add_start(position)
+                    add_end(position)
+                    add_join(False)
+                seen_break = True
+
+            word_start = position
+            position += word_length
+
+            if word_count > length:
+                # 단어 자체가 길이 제한을 초과하는 경우: 앞 조각들은 한 줄씩 내보내고
+                # 마지막 조각만 다음 단어들과 함께 배치
+                flush(paragraph_end=False)
+                split_word = split_long_word(text[word_start:position], length)
+                for part in split_word[:-1]:
+                    add_start(word_start)
+                    word_start += len(part)
+                    add_end(word_start)
+                    add_join(False)
+                    if stats is not None:
+                        stats.line_counts.append(count(part))
+                if stats is not None:
+                    stats.forced_splits += 1
+                word_count = count(split_word[-1])
+                plain = True
+
+            word_starts.append(word_start)
+            word_ends.append(position)
+            word_counts.append(word_count)
+            word_plain.append(plain)
+
+        if paragraphs and len(gaps) > len(word_lengths) and "\n\n" in gaps[-1]:
+            # 텍스트 끝의 문단 경계
+            flush()
+            for _ in range(gaps[-1].count("\n\n")):
+                add_start(len(text))
+                add_end(len(text))
+                add_join(False)
+            seen_break = True
+
+    # 마지막 문단 배치
+    if word_counts:
+        flush()
+    elif seen_break:
+        # 마지막 문단이 비어 있으면 빈 행으로 보존
+        add_start(len(text))
+        add_end(len(text))
+        add_join(False)
+
+    return Lines(text, line_starts, line_ends, line_joins)
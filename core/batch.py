@@ -0,0 +1,451 @@
+"""
+디렉터리 단위 일괄 가다듬기 (GUI 없이 동작)
+PySide6를 가져오지 않으므로 디스플레이가 없는 서버에서도 사용할 수 있습니다.
+"""
+
+import codecs
+import mmap
+import os
+import secrets
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from core.cancellation import (
+    CancellationToken,
+    OperationCancelled,
+    ProgressCallback,
+)
+from core.metrics import DocumentMetrics, MetricsRegistry
+from core.parallel import worker_processor
+from core.text_processor import DEFAULT_LINE_LENGTH, TextProcessor
+
+
+class FileResult(NamedTuple):
+    """파일 하나의 처리 결과"""
+
+    source: Path
+    destination: Path
+    input_bytes: int
+    output_bytes: int
+    seconds: float
+    error: Optional[str] = None
+
+
+class BatchSummary(NamedTuple):
+    """일괄 처리 전체 결과"""
+
+    results: List[FileResult]
+    seconds: float
+
+    @property
+    def input_bytes(self) -> int:
+        return sum(result.input_bytes for result in self.results)
+
+    @property
+    def failed(self) -> List[FileResult]:
+        return [result for result in self.results if result.error]
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리한 입력 바이트 수"""
+        return self.input_bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+# 이보다 큰 파일은 전체를 읽지 않고 메모리 매핑 후 조금씩 디코딩하며 처리 (바이트)
+STREAMING_MIN_BYTES = 32 * 1024 * 1024
+
+# 스트리밍 처리 시 한 번에 디코딩하는 입력 크기 (바이트)
+DECODE_CHUNK_BYTES = 1024 * 1024
+
+# 읽은 매핑 페이지를 내려놓는 madvise 옵션 (지원하지 않는 플랫폼에서는 None)
+_MADV_DONTNEED = getattr(mmap, "MADV_DONTNEED", None)
+
+# 스트리밍 처리 시 출력 버퍼 크기 (바이트)
+WRITE_BUFFER_BYTES = 1024 * 1024
+
+# 스트리밍 처리 시 한 번에 인코딩해 쓰는 줄 수
+WRITE_BATCH_LINES = 4096
+
+# 프로세스 풀로 처리할 때 취소 토큰을 확인하는 간격 (초)
+CANCEL_POLL_SECONDS = 0.1
+
+
+def collect_jobs(
+    src_dir: Path, dst_dir: Path, pattern: str = "*.txt"
+) -> List[Tuple[Path, Path, int]]:
+    """
+    입력 디렉터리에서 처리할 파일을 찾아 큰 파일부터 정렬합니다.
+    큰 파일을 먼저 배정해야 작업 프로세스 간 부하가 고르게 나뉩니다.
+
+    Args:
+        src_dir (Path): 입력 디렉터리
+        dst_dir (Path): 출력 디렉터리 (입력과 같은 하위 경로 구조로 저장)
+        pattern (str): 처리할 파일 이름 패턴
+
+    Returns:
+        List[Tuple[Path, Path, int]]: (입력 경로, 출력 경로, 파일 크기) 목록
+    """
+    jobs = []
+    for source in src_dir.rglob(pattern):
+        if not source.is_file():
+            continue
+        destination = dst_dir / source.relative_to(src_dir)
+        jobs.append((source, destination, source.stat().st_size))
+
+    jobs.sort(key=lambda job: job[2], reverse=True)
+    return jobs
+
+
+def _create_temp(path: Path) -> Tuple[int, str]:
+    """
+    대상과 같은 디렉터리에 임시 파일을 새로 만들어 (파일 기술자, 경로)를 돌려줍니다.
+    tempfile.mkstemp(0600)와 달리 open()처럼 0666에 현재 umask를 적용한 권한으로 만들므로,
+    이름을 바꾼 뒤에도 일반 파일과 같은 권한이 됩니다.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        temp_name = str(path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(temp_name, flags, 0o666), temp_name
+        except FileExistsError:
+            continue
+
+
+@contextmanager
+def _atomic_output(path: Path) -> Iterator[BinaryIO]:
+    """
+    같은 디렉터리의 임시 파일을 쓰기용으로 열어 주고, 정상 종료 시에만 대상 경로로 이름을 바꿉니다.
+    이름을 바꾸기 전에 디스크에 내려 쓰므로 중단되거나 시스템이 멈춰도 반쯤 쓰인 파일이 남지 않습니다.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = _create_temp(path)
+    try:
+        with os.fdopen(fd, "wb", buffering=WRITE_BUFFER_BYTES) as temp_file:
+            yield temp_file
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+def write_atomic(path: Path, text: str, encoding: str = "utf-8") -> int:
+    """
+    임시 파일에 먼저 쓴 뒤 이름을 바꿔, 중단되더라도 반쯤 쓰인 파일이 남지 않게 합니다.
+
+    Returns:
+        int: 기록한 바이트 수
+    """
+    data = text.encode(encoding)
+    with _atomic_output(path) as temp_file:
+        temp_file.write(data)
+    return len(data)
+
+
+def iter_decoded_chunks(
+    path: Path,
+    encoding: str = "utf-8",
+    chunk_bytes: int = DECODE_CHUNK_BYTES,
+    progress: Optional[ProgressCallback] = None,
+) -> Iterator[str]:
+    """
+    파일을 메모리 매핑하고 점진적 디코더로 chunk_bytes씩 디코딩합니다.
+    여러 바이트로 된 문자(UTF-8, CP949 등)가 조각 경계에 걸쳐도 디코더가 이어서 처리하며,
+    한 번에 조각 하나만 문자열로 만들므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Args:
+        path (Path): 입력 파일
+        encoding (str): 입력 인코딩 (예: utf-8, cp949, euc-kr)
+        chunk_bytes (int): 한 번에 디코딩할 바이트 수 (mmap.PAGESIZE의 배수)
+        progress (Optional[ProgressCallback]): 조각을 넘길 때마다 (읽은 바이트 수, 파일 크기)로 호출
+
+    Yields:
+        str: 디코딩된 텍스트 조각
+    """
+    if chunk_bytes <= 0 or chunk_bytes % mmap.PAGESIZE:
+        raise ValueError("조각 크기는 mmap.PAGESIZE의 배수여야 합니다")
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(path, "rb") as source_file:
+        size = os.fstat(source_file.fileno()).st_size
+        if size:
+            with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for start in range(0, size, chunk_bytes):
+                    chunk = decoder.decode(mapped[start : start + chunk_bytes])
+                    if _MADV_DONTNEED is not None:
+                        # 이미 읽은 페이지를 상주 메모리에서 내려 RSS가 파일 크기만큼 늘지 않게 함
+                        mapped.madvise(
+                            _MADV_DONTNEED, start, min(chunk_bytes, size - start)
+                        )
+                    if progress is not None:
+                        progress(min(start + chunk_bytes, size), size)
+                    if chunk:
+                        yield chunk
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def format_file(
+    source: Path,
+    destination: Path,
+    line_length: int = DEFAULT_LINE_LENGTH,
+    use_all_chars: bool = True,
+    separate_sentences: bool = True,
+    encoding: str = "utf-8",
+    processor: Optional[TextProcessor] = None,
+    progress: Optional[ProgressCallback] = None,
+    token: Optional[CancellationToken] = None,
+) -> int:
+    """
+    파일을 전체를 읽지 않고 스트리밍으로 가다듬어 저장합니다.
+    메모리 매핑한 입력을 조각별로 디코딩해 format_to에 넘기고,
+    묶음으로 나온 줄을 인코딩해 큰 버퍼의 임시 파일에 쓴 뒤 원자적으로 이름을 바꿉니다.
+    결과는 파일 전체를 읽어 format_text_with_options로 처리한 것과 같습니다.
+
+    Args:
+        source (Path): 입력 파일
+        destination (Path): 출력 파일 (입력과 같은 인코딩으로 저장)
+        line_length (int): 한 줄당 문자 수
+        use_all_chars (bool): 모든 문자 카운팅 여부
+        separate_sentences (bool): 마침표 분리 여부
+        encoding (str): 입출력 인코딩 (예: utf-8, cp949, euc-kr)
+        processor (Optional[TextProcessor]): 사용할 처리기 (None: 새로 생성)
+        progress (Optional[ProgressCallback]): 진행 상황 콜백 (읽은 바이트 수, 파일 크기)
+        token (Optional[CancellationToken]): 취소 토큰 (디코딩한 조각마다 확인)
+
+    Returns:
+        int: 기록한 바이트 수
+
+    Raises:
+        OperationCancelled: 처리 중 취소가 요청된 경우 (출력 파일은 만들지 않음)
+    """
+    if processor is None:
+        processor = TextProcessor()
+    return _write_formatted(
+        iter_decoded_chunks(Path(source), encoding, progress=progress),
+        Path(destination),
+        encoding,
+        processor,
+        line_length,
+        use_all_chars=use_all_chars,
+        separate_sentences=separate_sentences,
+        token=token,
+    )
+
+
+def _write_formatted(
+    source: Union[str, Iterable[str]],
+    destination: Path,
+    encoding: str,
+    processor: TextProcessor,
+    line_length: int,
+    **options,
+) -> int:
+    """
+    format_to가 묶음으로 내보내는 줄을 바로 인코딩해 임시 파일에 쓰고 원자적으로 이름을 바꿉니다.
+    결과 전체를 문자열이나 바이트열로 만들지 않습니다.
+
+    Returns:
+        int: 기록한 바이트 수
+    """
+    encoder = codecs.getincrementalencoder(encoding)()
+    written = 0
+    with _atomic_output(destination) as output:
+
+        def write(text: str) -> None:
+            nonlocal written
+            data = encoder.encode(text)
+            output.write(data)
+            written += len(data)
+
+        processor.format_to(
+            source, write, line_length, batch_lines=WRITE_BATCH_LINES, **options
+        )
+        data = encoder.encode("", final=True)
+        output.write(data)
+        written += len(data)
+    return written
+
+
+def format_file_job(
+    source: Path,
+    destination: Path,
+    line_length: int = DEFAULT_LINE_LENGTH,
+    use_all_chars: bool = True,
+    separate_sentences: bool = True,
+    encoding: str = "utf-8",
+    balanced: bool = False,
+    token: Optional[CancellationToken] = None,
+    processor: Optional[TextProcessor] = None,
+) -> FileResult:
+    """
+    파일 하나를 가다듬어 저장합니다. (작업 프로세스에서 실행)
+    균형 배치는 문단 전체를 모아야 하므로 큰 파일도 스트리밍하지 않고 한 번에 읽습니다.
+    processor를 주지 않으면 작업자마다 하나씩 만든 처리기(worker_processor)를 씁니다.
+
+    Returns:
+        FileResult: 처리 결과 (실패 시 error에 사유 기록)
+
+    Raises:
+        OperationCancelled: 처리 중 취소가 요청된 경우 (파일 하나의 실패가 아니므로 기록하지 않음)
+    """
+    if processor is None:
+        processor = worker_processor()
+    started = time.perf_counter()
+    input_bytes = 0
+    try:
+        input_bytes = source.stat().st_size
+        if input_bytes >= STREAMING_MIN_BYTES and not balanced:
+            # 큰 파일은 전체를 읽지 않고 스트리밍으로 처리
+            output_bytes = format_file(
+                source,
+                destination,
+                line_length,
+                use_all_chars,
+                separate_sentences,
+                encoding,
+                processor,
+                token=token,
+            )
+        else:
+            with open(source, encoding=encoding) as source_file:
+                text = source_file.read()
+            output_bytes = _write_formatted(
+                text,
+                destination,
+                encoding,
+                processor,
+                line_length,
+                use_all_chars=use_all_chars,
+                separate_sentences=separate_sentences,
+                balanced=balanced,
+                token=token,
+            )
+    except OperationCancelled:
+        raise
+    except Exception as e:
+        return FileResult(
+            source,
+            destination,
+            input_bytes,
+            0,
+            time.perf_counter() - started,
+            f"{type(e).__name__}: {e}",
+        )
+
+    return FileResult(
+        source, destination, input_bytes, output_bytes, time.perf_counter() - started
+    )
+
+
+def format_directory(
+    src_dir: Path,
+    dst_dir: Path,
+    line_length: int = DEFAULT_LINE_LENGTH,
+    use_all_chars: bool = True,
+    separate_sentences: bool = True,
+    jobs: Optional[int] = None,
+    pattern: str = "*.txt",
+    encoding: str = "utf-8",
+    on_result: Optional[Callable[[FileResult], None]] = None,
+    balanced: bool = False,
+    token: Optional[CancellationToken] = None,
+    metrics: Optional[MetricsRegistry] = None,
+) -> BatchSummary:
+    """
+    디렉터리의 모든 파일을 프로세스 풀에서 가다듬습니다.
+
+    Args:
+        src_dir (Path): 입력 디렉터리
+        dst_dir (Path): 출력 디렉터리
+        line_length (int): 한 줄당 문자 수
+        use_all_chars (bool): 모든 문자 카운팅 여부
+        separate_sentences (bool): 마침표 분리 여부
+        jobs (Optional[int]): 작업 프로세스 수 (None: CPU 수, 1: 현재 프로세스에서 처리)
+        pattern (str): 처리할 파일 이름 패턴
+        encoding (str): 입출력 인코딩
+        on_result (Optional[Callable[[FileResult], None]]): 파일 하나가 끝날 때마다 호출
+        balanced (bool): 균형 배치 여부 (문단마다 줄 길이를 고르게)
+        token (Optional[CancellationToken]): 취소 토큰 (제한 시간이 있는 작업 등)
+            현재 프로세스에서 처리하면 파일 안에서도 조각마다 확인하고,
+            프로세스 풀에서는 아직 시작하지 않은 파일을 취소한 뒤 처리 중인 파일이 끝나기를 기다립니다.
+        metrics (Optional[MetricsRegistry]): 처리 지표 모음
+            지정하면 파일마다 문서 수, 입출력 바이트 수, 처리 시간을 기록합니다. (source="batch")
+            현재 프로세스에서 처리하면 처리기의 API 지표도 기록합니다.
+
+    Returns:
+        BatchSummary: 파일별 결과와 전체 소요 시간
+
+    Raises:
+        OperationCancelled: 처리 중 취소가 요청된 경우 (이미 끝난 파일은 on_result로 전달됨)
+    """
+    started = time.perf_counter()
+    options = (line_length, use_all_chars, separate_sentences, encoding, balanced)
+    results = []
+    file_jobs = collect_jobs(src_dir, dst_dir, pattern)
+    documents = None if metrics is None else DocumentMetrics(metrics, "batch")
+    for result in _run_jobs(file_jobs, options, jobs, token, metrics):
+        results.append(result)
+        if documents is not None:
+            documents.record(
+                1,
+                1 if result.error else 0,
+                result.input_bytes,
+                result.output_bytes,
+                result.seconds,
+            )
+        if on_result:
+            on_result(result)
+
+    return BatchSummary(results, time.perf_counter() - started)
+
+
+def _run_jobs(
+    file_jobs: List[Tuple[Path, Path, int]],
+    options: tuple,
+    jobs: Optional[int],
+    token: Optional[CancellationToken] = None,
+    metrics: Optional[MetricsRegistry] = None,
+) -> Iterator[FileResult]:
+    """
+    작업 목록을 순서대로(큰 파일 우선) 배정하고 끝나는 대로 결과를 내보냅니다.
+    현재 프로세스에서 처리할 때만 처리기의 API 지표를 metrics에 기록합니다.
+    (작업 프로세스의 지표는 부모 프로세스로 모이지 않음)
+    """
+    if jobs == 1 or len(file_jobs) <= 1:
+        processor = None if metrics is None else TextProcessor(metrics=metrics)
+        for source, destination, _ in file_jobs:
+            if token is not None:
+                token.raise_if_cancelled()
+            yield format_file_job(source, destination, *options, token, processor)
+        return
+
+    # 토큰은 다른 프로세스로 넘길 수 없으므로 결과를 기다리는 동안 주기적으로 확인
+    timeout = None if token is None else CANCEL_POLL_SECONDS
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = {
+            executor.submit(format_file_job, source, destination, *options)
+            for source, destination, _ in file_jobs
+        }
+        while pending:
+            done, pending = wait(pending, timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+            if token is not None and pending and token.cancelled:
+                executor.shutdown(wait=False, cancel_futures=True)
+                token.raise_if_cancelled()
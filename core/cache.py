@@ -0,0 +1,344 @@
+"""
+가다듬기 결과 캐시
+같은 문단을 같은 설정으로 다시 가다듬을 때 이전 결과를 재사용합니다.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+
+# 문단 캐시 기본 용량 (저장된 문단과 줄의 총 문자 수)
+DEFAULT_PARAGRAPH_CACHE_SIZE = 16 * 1024 * 1024
+
+# 결과 캐시 기본 용량 (저장된 결과의 총 메모리 바이트 수)
+DEFAULT_RESULT_CACHE_BYTES = 64 * 1024 * 1024
+
+# 결과 하나가 차지할 수 있는 최대 비율 (큰 결과 하나가 캐시 전체를 밀어내지 않도록)
+MAX_RESULT_FRACTION = 0.25
+
+# 단계 캐시의 단계별 기본 보관 개수 (옵션을 번갈아 바꿔도 재사용되도록 몇 개 보관)
+DEFAULT_STAGE_CACHE_ENTRIES = 4
+
+
+class CacheStats(NamedTuple):
+    """캐시 사용 통계"""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """조회 중 적중 비율"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ParagraphCache:
+    """
+    문단 단위 줄 나누기 결과 캐시 (LRU)
+    키는 (문단, 줄 길이, 카운팅 방식)이며, 문단 문자열의 해시로 찾고 내용까지 비교하므로
+    해시 충돌로 다른 문단의 결과가 나오는 일은 없습니다.
+    용량은 저장된 문단과 줄의 총 문자 수로 제한하고, 넘치면 가장 오래 쓰지 않은 문단부터 버립니다.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PARAGRAPH_CACHE_SIZE):
+        """
+        Args:
+            max_size (int): 저장할 문단과 줄의 최대 총 문자 수
+        """
+        if max_size <= 0:
+            raise ValueError("캐시 용량은 0보다 커야 합니다")
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple[str, ...], int]]" = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, paragraph: str, length: int, mode: str) -> Optional[Tuple[str, ...]]:
+        """
+        캐시된 줄 목록을 찾습니다.
+
+        Args:
+            paragraph (str): 문단 원문
+            length (int): 한 줄당 문자 수
+            mode (str): 카운팅 방식
+
+        Returns:
+            Optional[Tuple[str, ...]]: 캐시된 줄 목록, 없으면 None
+        """
+        key = (paragraph, length, mode)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(
+        self, paragraph: str, length: int, mode: str, lines: Tuple[str, ...]
+    ) -> None:
+        """
+        줄 목록을 저장합니다. 용량을 넘으면 오래된 문단부터 버립니다.
+        용량보다 큰 문단 하나는 다른 문단을 모두 밀어내지 않도록 저장하지 않습니다.
+        """
+        size = len(paragraph) + sum(map(len, lines))
+        if size > self.max_size:
+            return
+
+        key = (paragraph, length, mode)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (lines, size)
+            self._size += size
+            while self._size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """저장된 문단과 통계를 모두 지웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = self._misses = self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """현재까지의 캐시 사용 통계"""
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 결과 캐시에 저장하는 값 (결과 문자열 또는 첫 필드가 결과 문자열인 튜플)
+Result = Union[str, Tuple[Any, ...]]
+
+
+class ResultCache:
+    """
+    가다듬기 결과 캐시 (LRU, 바이트 수 기준 용량)
+    키는 원문의 내용 요약값(BLAKE2b)과 옵션이므로 원문 자체는 저장하지 않습니다.
+    결과 문자열(또는 첫 필드가 결과 문자열인 FormatResult 같은 튜플)을 그대로 저장하므로
+    적중 시 줄을 다시 이어 붙이지 않고 바로 반환합니다.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_RESULT_CACHE_BYTES):
+        """
+        Args:
+            max_bytes (int): 저장할 결과의 최대 총 메모리 바이트 수
+        """
+        if max_bytes <= 0:
+            raise ValueError("캐시 용량은 0보다 커야 합니다")
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Result, int]]" = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str, *options: Hashable) -> Tuple[bytes, Tuple[Hashable, ...]]:
+        """
+        원문 내용 요약값과 옵션으로 캐시 키를 만듭니다.
+
+        Args:
+            text (str): 원문
+            *options (Hashable): 결과에 영향을 주는 옵션들
+
+        Returns:
+            Tuple[bytes, Tuple[Hashable, ...]]: 캐시 키
+        """
+        digest = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        return digest, options
+
+    def get(self, key: Hashable) -> Optional["Result"]:
+        """
+        캐시된 결과를 찾습니다.
+
+        Returns:
+            Optional[Result]: 캐시된 결과, 없으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, result: "Result") -> None:
+        """
+        결과를 저장합니다. 용량을 넘으면 오래된 결과부터 버립니다.
+        용량의 MAX_RESULT_FRACTION보다 큰 결과는 저장하지 않습니다.
+        """
+        size = sys.getsizeof(result)
+        if isinstance(result, tuple):
+            # 통계와 함께 저장하는 결과는 결과 문자열의 크기도 더함 (나머지 필드는 정수)
+            size += sys.getsizeof(result[0])
+        if size > self.max_bytes * MAX_RESULT_FRACTION:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (result, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """저장된 결과와 통계를 모두 지웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = self._misses = self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """현재까지의 캐시 사용 통계 (size는 바이트 수)"""
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class StageCache:
+    """
+    가다듬기 단계별 중간 결과 캐시 (단계마다 LRU, 개수 기준 용량)
+    각 단계의 결과를 (입력, 옵션) 기준으로 보관하므로, 옵션 하나를 바꾸면 그 옵션을 쓰는 단계부터만 다시 계산합니다.
+    문자열 입력은 내용으로, 그 밖의 입력(앞 단계 결과 객체)은 객체 자체(id)로 찾습니다.
+    가장 최근 실행에서 다시 계산한 단계 이름은 recomputed로 확인할 수 있습니다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_STAGE_CACHE_ENTRIES):
+        """
+        Args:
+            max_entries (int): 단계마다 보관할 최대 결과 수
+        """
+        if max_entries <= 0:
+            raise ValueError("캐시 용량은 0보다 커야 합니다")
+        self.max_entries = max_entries
+        self._stages: Dict[str, "OrderedDict[Hashable, Tuple[Any, Any]]"] = {}
+        self._recomputed: List[str] = []
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def begin(self) -> None:
+        """새 실행을 시작합니다. (다시 계산한 단계 기록 초기화)"""
+        with self._lock:
+            self._recomputed = []
+
+    def lookup(
+        self,
+        stage: str,
+        source: Any,
+        options: Tuple[Hashable, ...],
+        compute: Callable[[Any], Any],
+    ) -> Any:
+        """
+        단계 결과를 찾고, 없으면 계산해 저장합니다.
+
+        Args:
+            stage (str): 단계 이름
+            source (Any): 단계 입력 (문자열 또는 앞 단계 결과)
+            options (Tuple[Hashable, ...]): 결과에 영향을 주는 옵션들
+            compute (Callable[[Any], Any]): 입력으로 결과를 계산하는 함수
+
+        Returns:
+            Any: 단계 결과
+        """
+        identity = isinstance(source, str)
+        key = (source if identity else id(source), options)
+        with self._lock:
+            entries = self._stages.setdefault(stage, OrderedDict())
+            entry = entries.get(key)
+            # id로 찾은 경우 같은 객체인지 확인 (버려진 객체의 id가 재사용될 수 있음)
+            if entry is not None and (identity or entry[0] is source):
+                entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+            self._recomputed.append(stage)
+
+        result = compute(source)
+        with self._lock:
+            # 입력 객체를 함께 보관해 id가 재사용되지 않도록 함
+            entries[key] = (source, result)
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    @property
+    def recomputed(self) -> Tuple[str, ...]:
+        """가장 최근 실행에서 다시 계산한 단계 이름 (계산 순서)"""
+        with self._lock:
+            return tuple(self._recomputed)
+
+    def clear(self) -> None:
+        """저장된 결과와 통계를 모두 지웁니다."""
+        with self._lock:
+            self._stages.clear()
+            self._recomputed = []
+            self._hits = self._misses = self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """현재까지의 캐시 사용 통계 (size는 모든 단계의 결과 수)"""
+        with self._lock:
+            entries = sum(map(len, self._stages.values()))
+            return CacheStats(
+                self._hits, self._misses, self._evictions, entries, entries
+            )
+
+    def __len__(self) -> int:
+        return sum(map(len, self._stages.values()))
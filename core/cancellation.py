@@ -0,0 +1,146 @@
+"""
+작업 취소 토큰과 진행 상황 보고
+다른 스레드(GUI 등)에서 진행 중인 가다듬기 작업에 중단을 요청하거나 진행 상황을 받을 때 사용합니다.
+엔진은 구간(청크)과 문단마다 Checkpoint를 불러 취소 여부를 확인하고 진행량을 알립니다.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+# 진행 상황 콜백: (처리한 양, 전체 양)
+ProgressCallback = Callable[[int, int], None]
+
+# 진행 상황을 알리는 최소 간격 (전체 양에 대한 비율, 콜백 호출 수를 제한)
+PROGRESS_STEP = 0.01
+
+
+class OperationCancelled(Exception):
+    """취소 토큰에 중단이 요청되어(또는 제한 시간을 넘어) 작업을 멈춤"""
+
+
+class CancellationToken:
+    """작업을 요청한 쪽과 작업 스레드가 함께 들고 있는 취소 요청 표시"""
+
+    __slots__ = ("_event", "_deadline")
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout (Optional[float]): 지정하면 생성 후 이 시간(초)이 지나면 취소된 것으로 봄
+        """
+        self._event = threading.Event()
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+
+    def cancel(self) -> None:
+        """작업 중단을 요청합니다. 작업은 다음 확인 지점에서 멈춥니다."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """중단이 요청되었는지(또는 제한 시간이 지났는지) 여부"""
+        if self._event.is_set():
+            return True
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self._event.set()
+            return True
+        return False
+
+    def raise_if_cancelled(self) -> None:
+        """중단이 요청되었으면 OperationCancelled를 발생시킵니다."""
+        if self.cancelled:
+            raise OperationCancelled("작업이 취소되었습니다")
+
+
+class Checkpoint:
+    """
+    엔진이 구간과 문단마다 부르는 취소 확인 및 진행 상황 보고 지점
+    처리 단계마다 전체 진행량 중 맡을 비율을 정해 두면(stage), 단계 안의 텍스트 위치를
+    전체 진행량으로 바꿔 알리므로 단계가 바뀌어도 진행량이 줄지 않습니다.
+    """
+
+    __slots__ = (
+        "total",
+        "progress",
+        "token",
+        "_start",
+        "_span",
+        "_length",
+        "_step",
+        "_reported",
+    )
+
+    def __init__(
+        self,
+        total: int,
+        progress: Optional[ProgressCallback] = None,
+        token: Optional[CancellationToken] = None,
+    ):
+        """
+        Args:
+            total (int): 전체 양 (문자열은 문자 수, 파일은 바이트 수)
+            progress (Optional[ProgressCallback]): 진행 상황 콜백
+            token (Optional[CancellationToken]): 취소 토큰
+        """
+        self.total = total
+        self.progress = progress
+        self.token = token
+        self._start = 0
+        self._span = total
+        self._length = total
+        self._step = max(1, int(total * PROGRESS_STEP))
+        self._reported = -self._step
+
+    def stage(self, start: float, end: float, length: int) -> "Checkpoint":
+        """
+        전체 진행량의 [start, end) 비율을 길이 length인 텍스트를 처리하는 단계에 배정합니다.
+
+        Returns:
+            Checkpoint: 자기 자신 (단계 함수에 바로 넘기기 위함)
+        """
+        self._start = int(self.total * start)
+        self._span = int(self.total * end) - self._start
+        self._length = length
+        return self
+
+    def __call__(self, position: int) -> None:
+        """
+        현재 단계의 텍스트를 position까지 처리했음을 알립니다.
+
+        Raises:
+            OperationCancelled: 취소가 요청된 경우
+        """
+        if self.token is not None:
+            self.token.raise_if_cancelled()
+        if self.progress is not None:
+            if self._length:
+                done = (
+                    self._start
+                    + self._span * min(position, self._length) // self._length
+                )
+            else:
+                done = self._start + self._span
+            if done - self._reported >= self._step:
+                self._reported = done
+                self.progress(done, self.total)
+
+    def finish(self) -> None:
+        """작업이 끝났음을 알립니다. (진행량 = 전체 양)"""
+        if self.progress is not None and self._reported < self.total:
+            self._reported = self.total
+            self.progress(self.total, self.total)
+
+
+def checkpoint_for(
+    total: int,
+    progress: Optional[ProgressCallback] = None,
+    token: Optional[CancellationToken] = None,
+) -> Optional[Checkpoint]:
+    """
+    진행 상황 콜백이나 취소 토큰이 있을 때만 Checkpoint를 만듭니다.
+    둘 다 없으면 None을 돌려주어 엔진이 확인 지점마다 None 비교만 하도록 합니다.
+    """
+    if progress is None and token is None:
+        return None
+    return Checkpoint(total, progress, token)
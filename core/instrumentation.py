@@ -0,0 +1,155 @@
+"""
+처리 구간 계측
+TextProcessor의 자주 불리는 구간(보이지 않는 문자 제거, 마침표 분리, 단어 배열 만들기,
+줄 나누기, 단어별 문자 수 세기, 긴 단어 강제 분할)마다 누적 시간, 호출 수, 처리한 문자 수를 모읍니다.
+
+계측은 TextProcessor(instrumentation=Instrumentation())으로 켜며, 이때만 해당 메서드를
+시간을 재는 래퍼로 바꿔 인스턴스에 둡니다. 계측하지 않는 처리기는 클래스의 메서드를
+그대로 부르므로 확인하는 비용도 들지 않습니다.
+구간은 겹칠 수 있습니다. (공백 정리 시간에는 보이지 않는 문자 제거 시간이 포함되는 등)
+
+작업자 풀(workers > 1)로 나눠 처리하는 조각은 다른 프로세스에서 처리되므로 모이지 않습니다.
+"""
+
+import functools
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, TypeVar
+
+
+# 계측 구간 (순서대로 요약에 표시)
+TIMER_STRIP_INVISIBLE = "strip_invisible"  # 보이지 않는 문자 제거
+TIMER_NORMALIZE = "normalize"  # 공백 정리 (보이지 않는 문자 제거 포함)
+TIMER_SEPARATE = "separate"  # 마침표 뒤에 빈 행 넣기 (정규식 치환)
+TIMER_TOKENIZE = "tokenize"  # 단어/문자 수 배열 만들기
+TIMER_WRAP = "wrap"  # 줄 나누기 (일괄 문자 수 세기와 강제 분할 포함)
+TIMER_COUNT = "count"  # 단어 하나씩 문자 수 세기 (한글 카운팅, 공개 카운팅 메서드)
+TIMER_SPLIT_LONG_WORD = "split_long_word"  # 줄 길이보다 긴 단어 강제 분할
+TIMERS = (
+    TIMER_STRIP_INVISIBLE,
+    TIMER_NORMALIZE,
+    TIMER_SEPARATE,
+    TIMER_TOKENIZE,
+    TIMER_WRAP,
+    TIMER_COUNT,
+    TIMER_SPLIT_LONG_WORD,
+)
+
+# 요약에 쓰는 구간 이름
+_TIMER_LABELS = {
+    TIMER_STRIP_INVISIBLE: "문자 제거",
+    TIMER_NORMALIZE: "공백 정리",
+    TIMER_SEPARATE: "마침표 분리",
+    TIMER_TOKENIZE: "단어 배열",
+    TIMER_WRAP: "줄 나누기",
+    TIMER_COUNT: "문자 수",
+    TIMER_SPLIT_LONG_WORD: "강제 분할",
+}
+
+F = TypeVar("F", bound=Callable)
+
+
+class TimerStats(NamedTuple):
+    """계측 구간 하나의 누적 통계"""
+
+    seconds: float  # 누적 실행 시간 (벽시계 기준)
+    calls: int
+    chars: int  # 처리한 입력(텍스트 또는 단어)의 총 문자 수
+
+    @property
+    def chars_per_second(self) -> float:
+        """초당 처리한 문자 수"""
+        return self.chars / self.seconds if self.seconds > 0 else 0.0
+
+
+class Instrumentation:
+    """
+    처리 구간별 누적 시간, 호출 수, 문자 수
+    여러 스레드의 처리기가 함께 써도 되며, 처리 중에도 snapshot으로 읽을 수 있습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 구간 → [누적 시간, 호출 수, 문자 수]
+        self._totals: Dict[str, List[float]] = {timer: [0.0, 0, 0] for timer in TIMERS}
+
+    def record(self, timer: str, seconds: float, chars: int) -> None:
+        """구간 한 번의 실행을 누적합니다."""
+        with self._lock:
+            totals = self._totals.get(timer)
+            if totals is None:
+                totals = self._totals[timer] = [0.0, 0, 0]
+            totals[0] += seconds
+            totals[1] += 1
+            totals[2] += chars
+
+    def timed(self, timer: str, func: F) -> F:
+        """
+        첫 인자(텍스트 또는 단어)를 받는 함수를 실행 시간과 입력 문자 수를 누적하는 래퍼로 감쌉니다.
+
+        Args:
+            timer (str): 누적할 구간 이름
+            func (F): 감쌀 함수
+
+        Returns:
+            F: func와 같이 동작하는 함수 (예외가 나도 실행 시간은 누적)
+        """
+        record = self.record
+        clock = time.perf_counter
+
+        @functools.wraps(func)
+        def timed(text, *args, **kwargs):
+            started = clock()
+            try:
+                return func(text, *args, **kwargs)
+            finally:
+                record(timer, clock() - started, len(text))
+
+        return timed
+
+    def stats(self, timer: str) -> TimerStats:
+        """구간 하나의 누적 통계"""
+        with self._lock:
+            return TimerStats(*self._totals.get(timer, (0.0, 0, 0)))
+
+    @property
+    def forced_splits(self) -> int:
+        """줄 길이보다 길어 강제로 나눈 단어 수"""
+        return self.stats(TIMER_SPLIT_LONG_WORD).calls
+
+    def reset(self) -> None:
+        """누적한 통계를 모두 0으로 되돌립니다."""
+        with self._lock:
+            for totals in self._totals.values():
+                totals[:] = [0.0, 0, 0]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        현재까지 누적한 통계를 복사해 돌려줍니다. (JSON으로 바로 쓸 수 있는 형태)
+
+        Returns:
+            Dict[str, Dict[str, float]]: 구간 → {"seconds", "calls", "chars"}
+        """
+        with self._lock:
+            return {
+                timer: TimerStats(*totals)._asdict()
+                for timer, totals in self._totals.items()
+            }
+
+    def summary(self) -> str:
+        """
+        호출된 구간의 누적 시간과 호출 수를 한 줄로 요약합니다.
+        예: "공백 정리 1.2ms/3회 · 마침표 분리 0.8ms/3회 · 강제 분할 2회"
+        """
+        parts = []
+        for timer, totals in self.snapshot().items():
+            if not totals["calls"]:
+                continue
+            label = _TIMER_LABELS.get(timer, timer)
+            if timer == TIMER_SPLIT_LONG_WORD:
+                parts.append(f"{label} {totals['calls']}회")
+            else:
+                parts.append(
+                    f"{label} {totals['seconds'] * 1000:.1f}ms/{totals['calls']}회"
+                )
+        return " · ".join(parts) if parts else "계측된 처리가 없습니다"
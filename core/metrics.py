@@ -0,0 +1,602 @@
+"""
+처리 지표 (Prometheus 텍스트 형식, 표준 라이브러리만 사용)
+요청/문서 수, 입출력 바이트 수, API별 지연 시간 히스토그램, 캐시 적중률을 모아
+Prometheus 텍스트 형식(0.0.4)으로 파일에 쓰거나 localhost의 /metrics로 내보냅니다.
+
+    registry = MetricsRegistry()
+    processor = TextProcessor(metrics=registry)   # 공개 API 호출 지표
+    server = registry.serve(port=9465)            # http://127.0.0.1:9465/metrics
+    registry.write_textfile("word_breaker.prom")  # node_exporter 텍스트 파일 수집기 등
+
+기록은 잠금 한 번에 값 몇 개를 더하는 정도라 부하 중에도 켜 둘 수 있으며,
+캐시 통계와 대기열 길이처럼 이미 따로 세는 값은 기록하지 않고 내보낼 때 읽습니다.
+작업 프로세스(workers > 1, 일괄 처리 작업자)에서 불린 API는 모이지 않으므로,
+일괄 처리와 파이프 모드는 부모 프로세스에서 문서 단위로 기록합니다.
+"""
+
+import bisect
+import functools
+import math
+import os
+import tempfile
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+
+# 지연 시간 히스토그램의 기본 구간 상한 (초)
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# 지표 내보내기 응답의 Content-Type (Prometheus 텍스트 형식 0.0.4)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 지표 내보내기 HTTP 서버의 기본 주소 (localhost에서만 받음)
+DEFAULT_METRICS_HOST = "127.0.0.1"
+DEFAULT_METRICS_PORT = 9465
+
+# 지표 이름
+API_SECONDS = "word_breaker_api_seconds"
+API_INPUT_CHARS = "word_breaker_api_input_chars_total"
+API_ERRORS = "word_breaker_api_errors_total"
+DOCUMENTS = "word_breaker_documents_total"
+DOCUMENT_INPUT_BYTES = "word_breaker_document_input_bytes_total"
+DOCUMENT_OUTPUT_BYTES = "word_breaker_document_output_bytes_total"
+DOCUMENT_SECONDS = "word_breaker_document_seconds"
+HTTP_REQUESTS = "word_breaker_http_requests_total"
+HTTP_SECONDS = "word_breaker_http_request_seconds"
+HTTP_RECEIVED_BYTES = "word_breaker_http_received_bytes_total"
+HTTP_SENT_BYTES = "word_breaker_http_sent_bytes_total"
+CACHE_HITS = "word_breaker_cache_hits_total"
+CACHE_MISSES = "word_breaker_cache_misses_total"
+CACHE_HIT_RATIO = "word_breaker_cache_hit_ratio"
+CACHE_ENTRIES = "word_breaker_cache_entries"
+
+Labels = Tuple[str, ...]
+
+F = TypeVar("F", bound=Callable)
+
+
+class MetricFamily(NamedTuple):
+    """내보낼 때 값을 읽어 만드는 지표 (캐시 통계, 대기열 길이 등)"""
+
+    name: str
+    kind: str  # "counter" 또는 "gauge"
+    help: str
+    labelnames: Labels
+    values: Dict[Labels, float]  # 레이블 값 (labelnames 순서) → 값
+
+
+class HistogramSnapshot(NamedTuple):
+    """히스토그램 레이블 하나의 누적 값"""
+
+    count: int
+    sum: float
+    buckets: Tuple[int, ...]  # 구간 상한마다 그 이하인 관측 수 (누적)
+
+
+class Counter:
+    """
+    늘어나기만 하는 값 (요청 수, 바이트 수 등)
+    레이블 값은 labelnames 순서의 튜플로 넘기며, 여러 스레드에서 함께 써도 됩니다.
+    """
+
+    __slots__ = ("name", "help", "labelnames", "_lock", "_values")
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        """레이블 값 labels의 값을 amount만큼 늘립니다."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        """레이블 값 labels의 현재 값"""
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def render(self) -> Iterator[str]:
+        """Prometheus 텍스트 형식의 값 줄들"""
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Histogram:
+    """
+    관측값(지연 시간 등)의 구간별 분포
+    레이블마다 구간별 관측 수, 합계를 누적하고 내보낼 때 누적 구간 수로 바꿉니다.
+    """
+
+    __slots__ = ("name", "help", "labelnames", "buckets", "_lock", "_cells")
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # 레이블 값 → [구간별 관측 수..., 가장 큰 구간을 넘은 관측 수, 합계]
+        self._cells: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """관측값 하나를 기록합니다."""
+        # 구간 상한은 "이하"이므로 상한과 같은 값은 그 구간에 넣음
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            cell = self._cells.get(labels)
+            if cell is None:
+                cell = self._cells[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            cell[index] += 1
+            cell[-1] += value
+
+    def snapshot(self, labels: Labels = ()) -> HistogramSnapshot:
+        """레이블 값 labels의 관측 수, 합계, 누적 구간 수"""
+        with self._lock:
+            cell = list(self._cells.get(labels, [0] * (len(self.buckets) + 1) + [0.0]))
+        cumulative = _accumulate(cell[:-1])
+        return HistogramSnapshot(cumulative[-1], cell[-1], tuple(cumulative[:-1]))
+
+    def render(self) -> Iterator[str]:
+        """Prometheus 텍스트 형식의 값 줄들 (_bucket, _sum, _count)"""
+        with self._lock:
+            cells = sorted((labels, list(cell)) for labels, cell in self._cells.items())
+        names = (*self.labelnames, "le")
+        bounds = [_number(bound) for bound in self.buckets] + ["+Inf"]
+        for labels, cell in cells:
+            cumulative = _accumulate(cell[:-1])
+            for bound, count in zip(bounds, cumulative):
+                yield (f"{self.name}_bucket{_labels(names, (*labels, bound))} {count}")
+            suffix = _labels(self.labelnames, labels)
+            yield f"{self.name}_sum{suffix} {_number(cell[-1])}"
+            yield f"{self.name}_count{suffix} {cumulative[-1]}"
+
+
+Metric = Union[Counter, Histogram]
+
+
+class MetricsRegistry:
+    """
+    지표 모음
+    지표는 이름으로 한 번만 만들어지며(같은 이름으로 다시 요청하면 같은 지표),
+    수집기(collector)는 내보낼 때마다 불러 그때의 값을 읽습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[MetricFamily]]] = {}
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        이름이 name인 카운터를 돌려줍니다. (없으면 만듦)
+
+        Raises:
+            ValueError: 같은 이름의 다른 종류 지표나 레이블이 다른 지표가 이미 있는 경우
+        """
+        return self._get(Counter, name, help, tuple(labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        이름이 name인 히스토그램을 돌려줍니다. (없으면 만듦)
+
+        Raises:
+            ValueError: 같은 이름의 다른 종류 지표나 레이블이 다른 지표가 이미 있는 경우
+        """
+        return self._get(Histogram, name, help, tuple(labelnames), buckets)
+
+    def _get(self, cls: type, name: str, help: str, labelnames: Labels, *args):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labelnames, *args)
+            elif type(metric) is not cls or metric.labelnames != labelnames:
+                raise ValueError(f"같은 이름의 다른 지표가 이미 있습니다: {name}")
+            return metric
+
+    def add_collector(
+        self, key: str, collect: Callable[[], Iterable[MetricFamily]]
+    ) -> None:
+        """
+        내보낼 때마다 부를 수집기를 등록합니다. (같은 key로 다시 등록하면 바꿈)
+        여러 수집기가 같은 이름의 지표를 내면 레이블 값을 합쳐 한 지표로 내보냅니다.
+
+        Args:
+            key (str): 수집기 이름
+            collect (Callable[[], Iterable[MetricFamily]]): 그때의 값을 읽어 돌려주는 함수
+        """
+        with self._lock:
+            self._collectors[key] = collect
+
+    def remove_collector(self, key: str) -> None:
+        """등록한 수집기를 뺍니다. (없으면 무시)"""
+        with self._lock:
+            self._collectors.pop(key, None)
+
+    def render(self) -> str:
+        """
+        모든 지표를 Prometheus 텍스트 형식(0.0.4)으로 만듭니다.
+
+        Returns:
+            str: # HELP, # TYPE 줄과 값 줄들 (개행으로 끝남)
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+
+        families: Dict[str, MetricFamily] = {}
+        for collect in collectors:
+            for family in collect():
+                merged = families.get(family.name)
+                if merged is None:
+                    families[family.name] = family._replace(values=dict(family.values))
+                else:
+                    merged.values.update(family.values)
+        for family in families.values():
+            lines.append(f"# HELP {family.name} {_escape_help(family.help)}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for labels, value in sorted(family.values.items()):
+                lines.append(
+                    f"{family.name}{_labels(family.labelnames, labels)} "
+                    f"{_number(value)}"
+                )
+        return "".join(line + "\n" for line in lines)
+
+    def write_textfile(self, path: Union[str, os.PathLike]) -> None:
+        """
+        지표를 파일에 씁니다. 임시 파일에 쓴 뒤 이름을 바꾸므로
+        읽는 쪽(텍스트 파일 수집기 등)이 반쯤 쓴 파일을 보지 않습니다.
+
+        Args:
+            path (Union[str, os.PathLike]): 쓸 파일 경로
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as output:
+                output.write(self.render())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def serve(
+        self, host: str = DEFAULT_METRICS_HOST, port: int = DEFAULT_METRICS_PORT
+    ) -> "MetricsServer":
+        """
+        GET /metrics로 지표를 내보내는 HTTP 서버를 백그라운드 스레드에서 시작합니다.
+
+        Args:
+            host (str): 받을 주소
+            port (int): 받을 포트 (0이면 비어 있는 포트)
+
+        Returns:
+            MetricsServer: 실행 중인 서버 (close로 멈춤)
+        """
+        return MetricsServer(self, host, port)
+
+
+class MetricsServer:
+    """지표 내보내기 HTTP 서버 (요청마다 스레드 하나, 데몬 스레드에서 실행)"""
+
+    def __init__(self, registry: MetricsRegistry, host: str, port: int):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                # 수집 요청마다 표준 오류에 기록하지 않음
+                pass
+
+        self._server: "ThreadingHTTPServer" = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port: int = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """서버를 멈추고 포트를 닫습니다."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> "MetricsServer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ApiMetrics:
+    """TextProcessor 공개 API의 호출 지표 (API별 지연 시간, 입력 문자 수, 실패 수)"""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.seconds = registry.histogram(
+            API_SECONDS, "API 호출 한 번의 처리 시간 (초)", ("api",)
+        )
+        self.input_chars = registry.counter(
+            API_INPUT_CHARS, "API에 넘긴 텍스트의 문자 수", ("api",)
+        )
+        self.errors = registry.counter(API_ERRORS, "예외로 끝난 API 호출 수", ("api",))
+
+    def timed(self, api: str, func: F) -> F:
+        """
+        첫 인자로 텍스트를 받는 함수를 호출 지표를 기록하는 래퍼로 감쌉니다.
+        (호출 수는 지연 시간 히스토그램의 _count)
+
+        Args:
+            api (str): api 레이블 값
+            func (F): 감쌀 함수
+
+        Returns:
+            F: func와 같이 동작하는 함수 (예외가 나도 지연 시간은 기록, 입력 문자 수는 성공한 호출만)
+        """
+        labels = (api,)
+        observe = self.seconds.observe
+        count_chars = self.input_chars.inc
+        count_error = self.errors.inc
+        clock = time.perf_counter
+
+        @functools.wraps(func)
+        def timed(text, *args, **kwargs):
+            started = clock()
+            try:
+                result = func(text, *args, **kwargs)
+            except Exception:
+                observe(clock() - started, labels)
+                count_error(labels)
+                raise
+            observe(clock() - started, labels)
+            # 카운팅 메서드는 None도, format_to는 청크 목록도 받으므로 문자열만 셈
+            count_chars(labels, len(text) if isinstance(text, str) else 0)
+            return result
+
+        return timed
+
+
+class DocumentMetrics:
+    """문서 단위 처리(일괄 처리 파일, 파이프 모드 줄)의 문서 수, 입출력 바이트 수, 처리 시간"""
+
+    def __init__(self, registry: MetricsRegistry, source: str):
+        """
+        Args:
+            registry (MetricsRegistry): 기록할 지표 모음
+            source (str): source 레이블 값 (예: "batch", "pipe")
+        """
+        self._ok = (source, "ok")
+        self._error = (source, "error")
+        self._source = (source,)
+        self.documents = registry.counter(
+            DOCUMENTS, "처리한 문서 수", ("source", "status")
+        )
+        self.input_bytes = registry.counter(
+            DOCUMENT_INPUT_BYTES, "처리한 문서의 입력 바이트 수", ("source",)
+        )
+        self.output_bytes = registry.counter(
+            DOCUMENT_OUTPUT_BYTES, "처리한 문서의 출력 바이트 수", ("source",)
+        )
+        self.seconds = registry.histogram(
+            DOCUMENT_SECONDS, "문서 하나의 처리 시간 (초)", ("source",)
+        )
+
+    def record(
+        self,
+        documents: int,
+        errors: int,
+        input_bytes: int,
+        output_bytes: int,
+        seconds: Optional[float] = None,
+    ) -> None:
+        """
+        처리한 문서들을 기록합니다.
+
+        Args:
+            documents (int): 처리한 문서 수 (실패 포함)
+            errors (int): 그중 실패한 문서 수
+            input_bytes (int): 입력 바이트 수
+            output_bytes (int): 출력 바이트 수
+            seconds (Optional[float]): 문서 하나의 처리 시간 (문서 하나씩 기록할 때만)
+        """
+        if documents > errors:
+            self.documents.inc(self._ok, documents - errors)
+        if errors:
+            self.documents.inc(self._error, errors)
+        self.input_bytes.inc(self._source, input_bytes)
+        self.output_bytes.inc(self._source, output_bytes)
+        if seconds is not None:
+            self.seconds.observe(seconds, self._source)
+
+
+class HttpMetrics:
+    """가다듬기 서비스의 HTTP 요청 지표 (경로와 상태 코드별 요청 수, 경로별 응답 시간, 주고받은 바이트 수)"""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.requests = registry.counter(
+            HTTP_REQUESTS, "HTTP 요청 수", ("path", "status")
+        )
+        self.seconds = registry.histogram(
+            HTTP_SECONDS, "요청을 받은 뒤 응답을 다 보내기까지의 시간 (초)", ("path",)
+        )
+        self.received_bytes = registry.counter(
+            HTTP_RECEIVED_BYTES, "받은 요청 본문의 바이트 수"
+        )
+        self.sent_bytes = registry.counter(
+            HTTP_SENT_BYTES, "보낸 응답의 바이트 수 (머리글 포함)"
+        )
+
+    def record(
+        self, path: str, status: int, received: int, sent: int, seconds: float
+    ) -> None:
+        """
+        요청 하나를 기록합니다.
+
+        Args:
+            path (str): path 레이블 값 (레이블 수가 늘지 않도록 정해진 경로만 넘김)
+            status (int): 응답 상태 코드
+            received (int): 받은 본문 바이트 수
+            sent (int): 보낸 바이트 수
+            seconds (float): 응답 시간
+        """
+        self.requests.inc((path, str(status)))
+        self.seconds.observe(seconds, (path,))
+        self.received_bytes.inc((), received)
+        self.sent_bytes.inc((), sent)
+
+
+def cache_collector(caches: Dict[str, object]) -> Callable[[], List[MetricFamily]]:
+    """
+    캐시 통계(적중, 미스, 적중률, 항목 수)를 내보낼 때 읽는 수집기를 만듭니다.
+
+    Args:
+        caches (Dict[str, object]): cache 레이블 값 → stats 속성으로 CacheStats를 돌려주는 캐시
+
+    Returns:
+        Callable[[], List[MetricFamily]]: MetricsRegistry.add_collector에 넘길 수집기
+    """
+
+    def collect() -> List[MetricFamily]:
+        stats = {(name,): cache.stats for name, cache in caches.items()}
+        labelnames = ("cache",)
+        return [
+            MetricFamily(
+                CACHE_HITS,
+                "counter",
+                "캐시 적중 수",
+                labelnames,
+                {labels: s.hits for labels, s in stats.items()},
+            ),
+            MetricFamily(
+                CACHE_MISSES,
+                "counter",
+                "캐시 미스 수",
+                labelnames,
+                {labels: s.misses for labels, s in stats.items()},
+            ),
+            MetricFamily(
+                CACHE_HIT_RATIO,
+                "gauge",
+                "캐시 조회 중 적중 비율",
+                labelnames,
+                {labels: s.hit_rate for labels, s in stats.items()},
+            ),
+            MetricFamily(
+                CACHE_ENTRIES,
+                "gauge",
+                "캐시에 보관한 항목 수",
+                labelnames,
+                {labels: s.entries for labels, s in stats.items()},
+            ),
+        ]
+
+    return collect
+
+
+def _accumulate(counts: List[float]) -> List[int]:
+    """구간별 관측 수를 누적 관측 수로 바꿉니다."""
+    total = 0
+    cumulative = []
+    for count in counts:
+        total += count
+        cumulative.append(total)
+    return cumulative
+
+
+def _number(value: float) -> str:
+    """값을 Prometheus 텍스트 형식의 수로 씁니다. (정수는 소수점 없이)"""
+    if isinstance(value, int) or (math.isfinite(value) and value.is_integer()):
+        return str(int(value))
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _labels(names: Labels, values: Labels) -> str:
+    """레이블 부분 ({name="value",...}, 레이블이 없으면 빈 문자열)"""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
@@ -0,0 +1,89 @@
+"""
+문서 하나를 여러 코어에서 나눠 가다듬기
+마침표 분리 후의 텍스트를 문단 경계에서 잘라 작업자에게 나누고, 결과를 순서대로 다시 잇습니다.
+"""
+
+import re
+import sys
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from core.text_processor import TextProcessor
+
+
+# 이보다 짧은 텍스트는 작업 분배 비용이 더 크므로 한 스레드에서 처리 (문자 수)
+PARALLEL_MIN_LENGTH = 1 << 20
+
+# 작업자당 조각 수 (조각마다 처리 시간이 달라도 고르게 끝나도록 잘게 나눔)
+CHUNKS_PER_WORKER = 4
+
+# 단어 바로 뒤의 빈 행: 여기서 자르면 앞 조각은 단어로 끝나고 뒤 조각은 문단 경계로 시작하므로
+# 조각별 결과를 이어 붙인 것이 전체를 한 번에 나눈 결과와 같습니다.
+_PARAGRAPH_CUT = re.compile(r"(?<=\S)\n\n")
+
+# 작업 프로세스마다 하나씩 생성되는 처리기 (worker_processor)
+_processor: Optional["TextProcessor"] = None
+
+
+def split_at_paragraphs(text: str, count: int) -> List[str]:
+    """
+    텍스트를 문단 경계(단어 바로 뒤의 빈 행)에서 길이가 비슷한 count개 안팎의 조각으로 나눕니다.
+
+    Args:
+        text (str): 마침표 분리된 텍스트
+        count (int): 목표 조각 수
+
+    Returns:
+        List[str]: 이어 붙이면 원문이 되는 조각 목록
+    """
+    target = len(text) // count
+    chunks = []
+    start = 0
+    for index in range(1, count):
+        match = _PARAGRAPH_CUT.search(text, max(start + 1, index * target))
+        if match is None:
+            break
+        chunks.append(text[start : match.start()])
+        start = match.start()
+    chunks.append(text[start:])
+    return chunks
+
+
+def worker_processor() -> "TextProcessor":
+    """
+    현재 작업자에서 재사용하는 처리기를 돌려줍니다. (처음 부를 때 생성)
+    작업 함수들이 이 처리기를 함께 쓰므로 작업을 맡을 때마다 처리기와 캐시를 새로 만들지 않으며,
+    같은 텍스트를 같은 옵션으로 다시 맡으면 결과 캐시에서 바로 돌려줍니다.
+    """
+    global _processor
+    if _processor is None:
+        # text_processor가 이 모듈을 가져오므로 처음 쓸 때 가져옴
+        from core.cache import ResultCache
+        from core.text_processor import TextProcessor
+
+        _processor = TextProcessor(result_cache=ResultCache())
+    return _processor
+
+
+def wrap_paragraph_chunk(text: str, length: int, balanced: bool = False) -> str:
+    """
+    조각 하나를 빈 행을 문단 경계로 보존하며 나누고 줄을 개행으로 이어 반환합니다. (작업자에서 실행)
+    줄 목록 대신 문자열 하나로 돌려주어 프로세스 간 전달 비용을 줄입니다.
+    """
+    return worker_processor()._split_missed_paragraphs(text, length, balanced).join()
+
+
+def create_executor(workers: int) -> "Executor":
+    """
+    작업자 풀을 생성합니다.
+    GIL 없는 빌드(3.13t 등)에서는 스레드로, 그 외에는 프로세스로 병렬 처리합니다.
+    """
+    # 프로세스 풀 모듈은 multiprocessing까지 불러오므로 병렬 처리를 처음 할 때 가져옴
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    if not gil_enabled:
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
@@ -0,0 +1,285 @@
+"""
+JSON lines 파이프 모드
+셸 파이프라인에서 문서마다 파이썬을 새로 띄우지 않도록, 한 프로세스가 표준 입력에서
+한 줄에 JSON 객체 하나({"id", "text", "width", "all_chars", "sentence_split", "balanced"})를 읽어
+가다듬고 결과를 한 줄에 하나씩({"id", "text"} 또는 {"id", "error"}) 표준 출력에 씁니다.
+
+    - 입력은 그때 읽을 수 있는 만큼(최대 1MB) 한꺼번에 읽고, 그 안의 줄을 모두 처리한 뒤
+      결과를 한 번에 씁니다. 처리량이 많을 때는 큰 단위로 쓰고, 한 줄씩 주고받는
+      대화형 사용에서도 바로 응답합니다.
+    - 작업자 수를 2 이상으로 주면 줄 묶음을 작업자 풀에 맡기고 끝나는 대로 씁니다. (id로 구별)
+      ordered를 켜면 입력 순서대로 씁니다.
+    - id가 없는 줄은 입력 줄 번호(0부터)를 id로 씁니다.
+
+실행:
+    python cli.py pipe --workers 4 < requests.jsonl > results.jsonl
+"""
+
+import json
+import threading
+import time
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from core.metrics import DocumentMetrics, MetricsRegistry
+from core.parallel import create_executor, worker_processor
+from core.service import parse_format_options
+from core.text_processor import TextProcessor
+
+
+# 한 번에 읽는 최대 입력 크기 (바이트)
+READ_CHUNK_BYTES = 1024 * 1024
+
+# 작업자 하나에 한 번에 맡기는 입력 크기 (바이트, 이보다 긴 줄은 혼자 맡김)
+BATCH_BYTES = 256 * 1024
+
+# 작업자당 동시에 맡겨 둘 수 있는 묶음 수 (입력을 너무 앞서 읽지 않도록 제한)
+BATCHES_PER_WORKER = 2
+
+
+class PipeSummary(NamedTuple):
+    """파이프 모드 처리 결과"""
+
+    records: int  # 처리한 줄 수 (빈 줄 제외)
+    errors: int  # 실패한 줄 수
+    input_bytes: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리한 입력 바이트 수"""
+        return self.input_bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+def format_records(
+    lines: List[bytes], first_number: int, processor: Optional[TextProcessor] = None
+) -> Tuple[bytes, int, int]:
+    """
+    입력 줄 묶음을 가다듬어 결과 줄들을 이어 붙인 바이트열로 돌려줍니다. (작업자에서 실행)
+    한 줄의 실패는 그 줄의 오류 결과로 쓰고 다른 줄은 계속 처리합니다.
+    UTF-8로 쓸 수 없는 문자(짝 없는 서로게이트 등)가 든 결과도 그 줄만 오류가 됩니다.
+
+    Args:
+        lines (List[bytes]): 입력 줄들 (개행 제외, 빈 줄 포함)
+        first_number (int): 첫 줄의 입력 줄 번호 (id가 없는 줄의 id)
+        processor (Optional[TextProcessor]): 사용할 처리기 (None: 작업자마다 하나씩 만든 처리기)
+
+    Returns:
+        Tuple[bytes, int, int]: (결과 JSON 줄들, 결과 줄 수, 실패한 줄 수) (빈 줄은 결과 없음)
+    """
+    if processor is None:
+        processor = worker_processor()
+    output = []
+    errors = 0
+    for number, line in enumerate(lines, first_number):
+        if not line.strip():
+            continue
+        record_id = number
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("JSON 객체여야 합니다")
+            record_id = record.get("id", number)
+            text = record["text"]
+            if not isinstance(text, str):
+                raise ValueError("text는 문자열이어야 합니다")
+            result = {
+                "id": record_id,
+                "text": processor.format_text_with_options(
+                    text, *parse_format_options(record)
+                ),
+            }
+            data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        except Exception as e:
+            # 오류 결과는 ASCII로만 써서 id에 든 문자와 무관하게 항상 쓸 수 있게 함
+            error = {"id": record_id, "error": f"{type(e).__name__}: {e}"}
+            data = json.dumps(error).encode("ascii")
+            errors += 1
+        output.append(data + b"\n")
+    return b"".join(output), len(output), errors
+
+
+def _iter_batches(lines: List[bytes]) -> Iterator[Tuple[int, List[bytes]]]:
+    """줄 목록을 BATCH_BYTES 안팎의 묶음으로 나눕니다. (시작 위치, 묶음)"""
+    start = 0
+    size = 0
+    for index, line in enumerate(lines):
+        size += len(line)
+        if size >= BATCH_BYTES:
+            yield start, lines[start : index + 1]
+            start = index + 1
+            size = 0
+    if start < len(lines):
+        yield start, lines[start:]
+
+
+def run_pipe(
+    source: BinaryIO,
+    output: BinaryIO,
+    workers: int = 1,
+    ordered: bool = False,
+    metrics: Optional[MetricsRegistry] = None,
+) -> PipeSummary:
+    """
+    입력이 끝날 때까지 JSON 줄을 읽어 가다듬고 결과를 씁니다.
+
+    Args:
+        source (BinaryIO): 입력 스트림 (read1 지원, 예: sys.stdin.buffer)
+        output (BinaryIO): 출력 스트림 (예: sys.stdout.buffer)
+        workers (int): 작업자 수 (1: 현재 프로세스에서 입력 순서대로 처리)
+        ordered (bool): 작업자가 여럿일 때도 입력 순서대로 쓸지 여부
+        metrics (Optional[MetricsRegistry]): 처리 지표 모음
+            지정하면 묶음을 쓸 때마다 줄 수, 실패 수, 입출력 바이트 수를 기록합니다. (source="pipe")
+            작업자가 하나면 처리기의 API 지표도 기록합니다. (작업 프로세스의 지표는 모이지 않음)
+
+    Returns:
+        PipeSummary: 처리한 줄 수, 실패한 줄 수, 입력 크기, 소요 시간
+
+    Raises:
+        OSError: 출력에 쓰지 못한 경우 (예: 읽는 쪽이 닫혀 BrokenPipeError)
+            작업자가 여럿이면 남은 묶음을 취소하고 입력 읽기를 멈춘 뒤 올립니다.
+    """
+    started = time.perf_counter()
+    documents = None if metrics is None else DocumentMetrics(metrics, "pipe")
+    if workers <= 1:
+        records, errors, input_bytes = _run_serial(source, output, documents, metrics)
+    else:
+        records, errors, input_bytes = _run_parallel(
+            source, output, workers, ordered, documents
+        )
+    return PipeSummary(records, errors, input_bytes, time.perf_counter() - started)
+
+
+def _iter_chunks(source: BinaryIO) -> Iterator[Tuple[int, List[bytes]]]:
+    """
+    입력을 그때 읽을 수 있는 만큼 읽어 완성된 줄 목록으로 내보냅니다.
+    (읽은 바이트 수, 줄 목록)
+    개행이 올 때까지의 조각은 목록에 모았다가 한 번만 이어 붙이므로 아주 긴 줄도 선형 시간에 읽습니다.
+    """
+    pending: List[bytes] = []  # 아직 개행이 오지 않은 줄의 조각들
+    unreported = 0  # 줄 목록으로 내보내지 않은 읽은 바이트 수
+    while True:
+        chunk = source.read1(READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        unreported += len(chunk)
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:end])
+        lines = b"".join(pending).split(b"\n")
+        pending = [chunk[end + 1 :]]
+        yield unreported, lines
+        unreported = 0
+    rest = b"".join(pending)
+    if rest:
+        yield unreported, [rest]
+
+
+def _run_serial(
+    source: BinaryIO,
+    output: BinaryIO,
+    documents: Optional[DocumentMetrics] = None,
+    metrics: Optional[MetricsRegistry] = None,
+) -> Tuple[int, int, int]:
+    """
+    현재 프로세스에서 입력 순서대로 처리합니다. (metrics를 주면 처리기의 API 지표도 기록)
+    (처리한 줄 수, 실패한 줄 수, 입력 크기)
+    """
+    processor = None if metrics is None else TextProcessor(metrics=metrics)
+    records = errors = input_bytes = 0
+    number = 0
+    for size, lines in _iter_chunks(source):
+        input_bytes += size
+        data, count, failed = format_records(lines, number, processor)
+        number += len(lines)
+        records += count
+        errors += failed
+        output.write(data)
+        output.flush()
+        if documents is not None:
+            documents.record(count, failed, size, len(data))
+    return records, errors, input_bytes
+
+
+def _run_parallel(
+    source: BinaryIO,
+    output: BinaryIO,
+    workers: int,
+    ordered: bool,
+    documents: Optional[DocumentMetrics] = None,
+) -> Tuple[int, int, int]:
+    """
+    줄 묶음을 작업자 풀에 맡기고, 묶음이 끝나면 작업자 풀의 콜백에서 바로 씁니다.
+    (입력을 기다리는 동안에도 끝난 결과를 내보내도록)
+    출력에 쓰지 못하면 그 오류를 기록해 두고, 입력 읽기를 멈추고 남은 묶음을 취소한 뒤 올립니다.
+    """
+    lock = threading.Lock()
+    slots = threading.Semaphore(workers * BATCHES_PER_WORKER)
+    done: Dict[int, bytes] = {}
+    state = {"next": 0, "records": 0, "errors": 0}
+    failures: List[OSError] = []  # 출력 쓰기 오류 (처음 것만 올림)
+
+    def write(sequence: int, data: bytes, count: int, failed: int) -> None:
+        with lock:
+            if failures:
+                # 출력이 이미 실패했으면 남은 결과는 버림
+                return
+            state["records"] += count
+            state["errors"] += failed
+            try:
+                if not ordered:
+                    output.write(data)
+                else:
+                    done[sequence] = data
+                    while state["next"] in done:
+                        output.write(done.pop(state["next"]))
+                        state["next"] += 1
+                output.flush()
+            except OSError as e:
+                failures.append(e)
+                return
+        if documents is not None:
+            # 입력 바이트는 읽을 때 기록
+            documents.record(count, failed, 0, len(data))
+
+    def finished(sequence: int, future) -> None:
+        try:
+            result = future.result()
+        except Exception as e:
+            # 작업자가 죽은 경우 등 묶음 전체의 실패 (어느 줄인지 알 수 없음)
+            message = json.dumps({"id": None, "error": f"{type(e).__name__}: {e}"})
+            result = ((message + "\n").encode("utf-8"), 1, 1)
+        try:
+            write(sequence, *result)
+        finally:
+            # 쓰기가 실패해도 자리를 돌려줘야 입력을 읽는 쪽이 멈추지 않음
+            slots.release()
+
+    input_bytes = 0
+    number = 0
+    sequence = 0
+    executor = create_executor(workers)
+    try:
+        for size, lines in _iter_chunks(source):
+            input_bytes += size
+            if documents is not None:
+                documents.record(0, 0, size, 0)
+            for start, batch in _iter_batches(lines):
+                slots.acquire()
+                if failures:
+                    break
+                future = executor.submit(format_records, batch, number + start)
+                future.add_done_callback(
+                    lambda future, sequence=sequence: finished(sequence, future)
+                )
+                sequence += 1
+            if failures:
+                break
+            number += len(lines)
+    finally:
+        # 출력이 실패했으면 아직 시작하지 않은 묶음은 취소
+        executor.shutdown(wait=True, cancel_futures=bool(failures))
+    if failures:
+        raise failures[0]
+    return state["records"], state["errors"], input_bytes
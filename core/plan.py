@@ -0,0 +1,250 @@
+"""
+미리 정해 둔 가다듬기 계획 (TextProcessor.compile)
+옵션 조합 하나에 대해 카운팅 함수, 긴 단어 분할 함수, 줄 나누기 함수와 인자,
+결과 캐시 키에 쓸 옵션을 만들 때 한 번만 정해 두고, 호출마다 옵션 분기 없이 바로 가다듬습니다.
+같은 옵션 조합이 많은 요청을 처리하는 서버 등에서 계획 하나를 여러 스레드가 함께 씁니다.
+"""
+
+from functools import partial
+from typing import Optional
+
+from core.advances import AdvanceTable
+from core.cancellation import (
+    CancellationToken,
+    Checkpoint,
+    ProgressCallback,
+    checkpoint_for,
+)
+from core.text_processor import (
+    _PROGRESS_SEPARATED,
+    COUNTING_ALL_CHARS,
+    COUNTING_KOREAN,
+    COUNTING_MODES,
+    COUNTING_PIXELS,
+    FormatResult,
+    TextProcessor,
+)
+from core.wrapping import Lines, WrapStats
+from utils.text_counter import count_all_chars, count_display_width, count_korean
+
+
+class FormatPlan:
+    """
+    옵션 조합 하나에 맞춰 미리 정해 둔 가다듬기 방법
+    만든 뒤에는 바꿀 수 없고 호출마다 상태를 남기지 않으므로 여러 스레드에서 함께 써도 됩니다.
+    결과는 같은 옵션의 format_text_with_options / format_lines / format_with_stats와 같습니다.
+    표시 폭 카운팅(COUNTING_DISPLAY_WIDTH)은 모든 문자 카운팅과 같은 규칙으로 나누되 칸 수를 셉니다.
+    글꼴 픽셀 폭 카운팅(COUNTING_PIXELS)은 줄 길이를 픽셀로 받아 전진 폭 표로 줄의 실제 폭을 셉니다.
+
+    만든 TextProcessor의 결과 캐시(잠금으로 보호됨)는 함께 쓰고,
+    호출마다 상태가 바뀌는 단계 캐시와 문단 캐시, 병렬 처리용 작업자 풀은 거치지 않습니다.
+    """
+
+    __slots__ = (
+        "line_length",
+        "counting",
+        "sentence_split",
+        "balanced",
+        "_separate",
+        "_wrap",
+        "_wrap_from",
+        "_result_cache",
+        "_cache_options",
+    )
+
+    def __init__(
+        self,
+        processor: TextProcessor,
+        line_length: int,
+        counting: str = COUNTING_ALL_CHARS,
+        sentence_split: bool = True,
+        balanced: bool = False,
+        advances: Optional[AdvanceTable] = None,
+    ):
+        """
+        Args:
+            processor (TextProcessor): 마침표 분리 함수와 결과 캐시를 가져올 처리기
+            line_length (int): 한 줄당 문자 수 (COUNTING_PIXELS이면 픽셀 폭)
+            counting (str): 카운팅 방식 (COUNTING_MODES 중 하나)
+            sentence_split (bool): 마침표 분리 여부
+            balanced (bool): 균형 배치 여부
+            advances (Optional[AdvanceTable]): 글꼴 전진 폭 표 (COUNTING_PIXELS에 필요)
+
+        Raises:
+            ValueError: 줄 길이가 1보다 작거나 알 수 없는 카운팅 방식인 경우,
+                COUNTING_PIXELS인데 전진 폭 표가 없는 경우
+        """
+        if line_length < 1:
+            raise ValueError("줄 길이는 1 이상이어야 합니다")
+        if counting not in COUNTING_MODES:
+            raise ValueError(f"알 수 없는 카운팅 방식입니다: {counting}")
+        if counting == COUNTING_PIXELS and advances is None:
+            raise ValueError("픽셀 폭 카운팅에는 글꼴 전진 폭 표가 필요합니다")
+
+        wrap = processor._wrap_balanced if balanced else processor._wrap_spans
+        if counting == COUNTING_KOREAN:
+            wrap = partial(
+                wrap,
+                length=line_length,
+                count=count_korean,
+                split_long_word=processor._split_long_word,
+            )
+            # format_text_with_options(use_all_chars=False)와 같은 결과 캐시 키
+            cache_counting = False
+        else:
+            if counting == COUNTING_ALL_CHARS:
+                count = count_all_chars
+                split_long_word = processor._split_long_word_by_all_chars
+                cache_counting = True
+            elif counting == COUNTING_PIXELS:
+                count = advances.count
+                split_long_word = advances.split_long_word
+                # 같은 픽셀 폭이라도 글꼴마다 결과가 다름
+                cache_counting = (counting, advances.key)
+            else:
+                count = count_display_width
+                split_long_word = processor._split_long_word_by_display_width
+                cache_counting = counting
+            # 마침표 분리를 하면 빈 행(\n\n)을 문단 경계로 보존
+            wrap = partial(
+                wrap,
+                length=(
+                    advances.length_for(line_length)
+                    if counting == COUNTING_PIXELS
+                    else line_length
+                ),
+                count=count,
+                split_long_word=split_long_word,
+                paragraphs=sentence_split,
+            )
+
+        assign = object.__setattr__
+        assign(self, "line_length", line_length)
+        assign(self, "counting", counting)
+        assign(self, "sentence_split", sentence_split)
+        assign(self, "balanced", balanced)
+        assign(self, "_separate", processor._separate if sentence_split else None)
+        assign(self, "_wrap", wrap)
+        assign(self, "_wrap_from", _PROGRESS_SEPARATED if sentence_split else 0.0)
+        assign(self, "_result_cache", processor.result_cache)
+        # format_text_with_options와 같은 결과 캐시 키를 쓰도록 옵션 순서를 맞춤
+        assign(
+            self,
+            "_cache_options",
+            (line_length, cache_counting, sentence_split, balanced),
+        )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("FormatPlan은 만든 뒤에 바꿀 수 없습니다")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("FormatPlan은 만든 뒤에 바꿀 수 없습니다")
+
+    def __repr__(self) -> str:
+        return (
+            f"FormatPlan(line_length={self.line_length}, counting={self.counting!r}, "
+            f"sentence_split={self.sentence_split}, balanced={self.balanced})"
+        )
+
+    def format(
+        self,
+        text: str,
+        progress: Optional[ProgressCallback] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> str:
+        """
+        텍스트를 가다듬습니다. (format_text_with_options와 같은 결과)
+
+        Args:
+            text (str): 가다듬을 텍스트
+            progress (Optional[ProgressCallback]): 진행 상황 콜백 (처리한 문자 수, 전체 문자 수)
+            token (Optional[CancellationToken]): 취소 토큰 (구간과 문단마다 확인)
+
+        Returns:
+            str: 가다듬어진 텍스트
+
+        Raises:
+            OperationCancelled: 처리 중 취소가 요청된 경우
+        """
+        cache = self._result_cache
+        if cache is None:
+            return self.format_lines(text, progress=progress, token=token).join()
+
+        key = cache.key(text, *self._cache_options)
+        result = cache.get(key)
+        if result is None:
+            result = self.format_lines(text, progress=progress, token=token).join()
+            cache.put(key, result)
+        elif progress is not None:
+            progress(len(text), len(text))
+        return result
+
+    def format_lines(
+        self,
+        text: str,
+        stats: Optional[WrapStats] = None,
+        progress: Optional[ProgressCallback] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> Lines:
+        """
+        텍스트를 가다듬어 지연 줄 목록으로 반환합니다. (format_lines와 같은 결과)
+
+        Args:
+            text (str): 가다듬을 텍스트
+            stats (Optional[WrapStats]): 지정하면 줄을 나누는 중에 통계를 채움
+            progress (Optional[ProgressCallback]): 진행 상황 콜백 (처리한 문자 수, 전체 문자 수)
+            token (Optional[CancellationToken]): 취소 토큰 (구간과 문단마다 확인)
+
+        Returns:
+            Lines: 가다듬어진 줄 목록
+
+        Raises:
+            OperationCancelled: 처리 중 취소가 요청된 경우
+        """
+        checkpoint = checkpoint_for(len(text), progress, token)
+        lines = self._lines(text, stats, checkpoint)
+        if checkpoint is not None:
+            checkpoint.finish()
+        return lines
+
+    def format_with_stats(
+        self,
+        text: str,
+        progress: Optional[ProgressCallback] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> FormatResult:
+        """
+        텍스트를 가다듬고 나누는 중에 센 통계를 함께 반환합니다. (format_with_stats와 같은 결과)
+
+        Args:
+            text (str): 가다듬을 텍스트
+            progress (Optional[ProgressCallback]): 진행 상황 콜백 (처리한 문자 수, 전체 문자 수)
+            token (Optional[CancellationToken]): 취소 토큰 (구간과 문단마다 확인)
+
+        Returns:
+            FormatResult: 가다듬은 텍스트와 통계
+
+        Raises:
+            OperationCancelled: 처리 중 취소가 요청된 경우
+        """
+        if not text or text.isspace():
+            return FormatResult("")
+        stats = WrapStats()
+        return FormatResult.from_stats(
+            self.format_lines(text, stats, progress, token), stats
+        )
+
+    def _lines(
+        self,
+        text: str,
+        stats: Optional[WrapStats],
+        checkpoint: Optional[Checkpoint],
+    ) -> Lines:
+        """마침표 분리(설정된 경우)와 줄 나누기를 차례로 합니다."""
+        if not text or text.isspace():
+            return Lines.empty()
+        if self._separate is not None:
+            text = self._separate(text, checkpoint)
+        if checkpoint is not None:
+            checkpoint.stage(self._wrap_from, 1.0, len(text))
+        return self._wrap(text, stats=stats, checkpoint=checkpoint)
@@ -0,0 +1,761 @@
+"""
+로컬 HTTP/JSON 가다듬기 서비스 (표준 라이브러리 asyncio만 사용)
+여러 도구가 각자 TextProcessor를 품지 않고 localhost의 서비스 하나에 요청하도록 합니다.
+
+    POST /format  {"text", "width", "all_chars", "sentence_split", "balanced"} → {"text"}
+    POST /count   {"text"} → {"all_chars", "all_chars_with_period", "korean", "display_width"}
+    GET  /health  → 대기열 길이와 처리 통계
+    GET  /metrics → Prometheus 텍스트 형식의 처리 지표 (지표 모음을 지정한 경우)
+
+요청 처리 흐름:
+    - 같은 작업(같은 텍스트와 옵션)이 이미 처리 중이면 새로 맡기지 않고 그 결과를 함께 기다립니다.
+    - 요청은 크기가 정해진 대기열에 넣고, 대기열이 가득 차면 잠시 기다린 뒤 503으로 거절합니다.
+    - 작업자가 비면 대기열에 쌓인 작은 요청을 묶어 한 번에 작업자 풀에 맡깁니다.
+      (작업자 하나에 묶음 하나만 맡기므로 대기열이 곧 배압이 됩니다)
+    - 큰 결과는 청크 전송 인코딩으로 나눠 보내며 조각마다 클라이언트가 받기를 기다립니다.
+
+실행:
+    python cli.py serve --port 8765 --workers 4
+"""
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import suppress
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from core.cache import ResultCache
+from core.metrics import (
+    CONTENT_TYPE,
+    HttpMetrics,
+    MetricFamily,
+    MetricsRegistry,
+)
+from core.parallel import create_executor, worker_processor
+from core.text_processor import DEFAULT_LINE_LENGTH, TextProcessor
+
+
+# 기본 주소 (localhost에서만 받음)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# 대기열에 둘 수 있는 요청 수
+QUEUE_SIZE = 256
+
+# 대기열이 가득 찼을 때 자리가 나기를 기다리는 시간 (초, 넘으면 503)
+QUEUE_WAIT_SECONDS = 1.0
+
+# 한 묶음에 넣는 최대 요청 수와 최대 문자 수 (이보다 큰 요청은 혼자 처리)
+BATCH_MAX_ITEMS = 64
+BATCH_MAX_CHARS = 64 * 1024
+
+# 이보다 긴 결과는 청크 전송 인코딩으로 나눠 보냄 (문자 수)
+STREAM_MIN_CHARS = 256 * 1024
+STREAM_CHUNK_CHARS = 64 * 1024
+
+# 받을 수 있는 최대 요청 본문 크기 (바이트)
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# 응답 상태 문구
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+# 경로 → 받는 메서드
+_ROUTES = {"/format": "POST", "/count": "POST", "/health": "GET", "/metrics": "GET"}
+
+# 정해진 경로가 아닌 요청의 지표 path 레이블 값
+_OTHER_PATH = "other"
+
+# JSON 응답의 Content-Type
+_JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+
+# 작업: (작업 이름, 텍스트, 옵션)
+Job = Tuple[str, str, tuple]
+
+
+class ServiceBusy(Exception):
+    """대기열이 가득 차 요청을 받지 못함"""
+
+
+class JobFailed(Exception):
+    """작업자에서 요청을 처리하다 실패함"""
+
+
+class _HttpError(Exception):
+    """요청을 해석할 수 없어 오류 응답을 보냄"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ServiceStats(NamedTuple):
+    """서비스 처리 통계"""
+
+    requests: int  # 받은 작업 수
+    coalesced: int  # 처리 중인 같은 작업의 결과를 함께 기다린 수
+    rejected: int  # 대기열이 가득 차 거절한 수
+    batches: int  # 작업자 풀에 맡긴 묶음 수
+    batched: int  # 묶음으로 처리한 작업 수
+    queued: int  # 지금 대기열의 작업 수
+
+    @property
+    def batch_size(self) -> float:
+        """묶음 하나의 평균 작업 수"""
+        return self.batched / self.batches if self.batches else 0.0
+
+
+def parse_format_options(payload: Dict[str, Any]) -> Tuple[int, bool, bool, bool]:
+    """
+    요청 JSON에서 가다듬기 옵션을 꺼냅니다.
+
+    Args:
+        payload (Dict[str, Any]): 요청 JSON
+            ({"width", "all_chars", "sentence_split", "balanced"}, 모두 생략 가능)
+
+    Returns:
+        Tuple[int, bool, bool, bool]: format_text_with_options의
+            (line_length, use_all_chars, separate_sentences, balanced)
+
+    Raises:
+        ValueError: 옵션 형식이 잘못된 경우
+    """
+    width = payload.get("width", DEFAULT_LINE_LENGTH)
+    if type(width) is not int or width < 1:
+        raise ValueError("width는 1 이상의 정수여야 합니다")
+
+    flags = []
+    defaults = (("all_chars", True), ("sentence_split", True), ("balanced", False))
+    for name, default in defaults:
+        value = payload.get(name, default)
+        if not isinstance(value, bool):
+            raise ValueError(f"{name}는 true 또는 false여야 합니다")
+        flags.append(value)
+    return (width, *flags)
+
+
+def _format(processor: TextProcessor, text: str, *options) -> str:
+    return processor.format_text_with_options(text, *options)
+
+
+def _count(processor: TextProcessor, text: str) -> Dict[str, int]:
+    return {
+        "all_chars": processor.count_all_chars(text),
+        "all_chars_with_period": processor.count_all_chars_with_period(text),
+        "korean": processor.count_korean_chars(text),
+        "display_width": processor.count_display_width(text),
+    }
+
+
+# 작업 이름 → 처리 함수
+OPERATIONS = {"format": _format, "count": _count}
+
+
+def run_batch(
+    jobs: List[Job], processor: Optional[TextProcessor] = None
+) -> List[Tuple[bool, Any]]:
+    """
+    묶음 하나를 차례로 처리합니다. (작업자에서 실행)
+    한 작업의 실패가 묶음의 다른 작업에 번지지 않도록 작업마다 결과나 오류를 따로 돌려줍니다.
+    processor를 주지 않으면 작업자마다 하나씩 만든 처리기(worker_processor)를 씁니다.
+
+    Returns:
+        List[Tuple[bool, Any]]: 작업마다 (성공 여부, 결과 또는 오류 메시지)
+    """
+    if processor is None:
+        processor = worker_processor()
+    results = []
+    for operation, text, options in jobs:
+        try:
+            results.append((True, OPERATIONS[operation](processor, text, *options)))
+        except Exception as e:
+            results.append((False, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class _Pending(NamedTuple):
+    """대기열의 작업 하나 (결과를 기다리는 퓨처와 함께)"""
+
+    operation: str
+    text: str
+    options: tuple
+    future: asyncio.Future
+
+
+class FormatService:
+    """
+    요청 묶기, 같은 작업 합치기, 대기열 배압을 갖춘 가다듬기 서비스
+    HTTP 없이 submit으로 바로 써도 같은 흐름을 거칩니다.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        queue_size: int = QUEUE_SIZE,
+        queue_wait: float = QUEUE_WAIT_SECONDS,
+        batch_items: int = BATCH_MAX_ITEMS,
+        batch_chars: int = BATCH_MAX_CHARS,
+        stream_min_chars: int = STREAM_MIN_CHARS,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Args:
+            workers (Optional[int]): 작업자 수 (None: CPU 수), 동시에 맡기는 묶음 수도 같음
+            executor (Optional[Executor]): 작업자 풀 (None이면 작업자 수만큼 새로 만들고 close에서 닫음)
+            queue_size (int): 대기열에 둘 수 있는 요청 수
+            queue_wait (float): 대기열이 가득 찼을 때 기다리는 시간 (초)
+            batch_items (int): 한 묶음의 최대 요청 수
+            batch_chars (int): 한 묶음의 최대 문자 수
+            stream_min_chars (int): 이보다 긴 결과는 나눠 보냄 (문자 수)
+            metrics (Optional[MetricsRegistry]): 처리 지표 모음
+                지정하면 HTTP 요청 지표와 처리 통계를 모으고 GET /metrics로 내보냅니다.
+                작업자 풀이 스레드 풀이면 처리기의 API 지표도 기록합니다.
+                (프로세스 풀의 작업자에서 기록한 지표는 부모 프로세스로 모이지 않음)
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1 or queue_size < 1 or batch_items < 1:
+            raise ValueError("작업자 수, 대기열 크기, 묶음 크기는 1 이상이어야 합니다")
+
+        self.workers = workers
+        self.queue_wait = queue_wait
+        self.batch_items = batch_items
+        self.batch_chars = batch_chars
+        self.stream_min_chars = stream_min_chars
+        self._owns_executor = executor is None
+        self._executor = create_executor(workers) if executor is None else executor
+        self._queue: "asyncio.Queue[_Pending]" = asyncio.Queue(queue_size)
+        self._slots = asyncio.Semaphore(workers)
+        self._in_flight: Dict[Tuple[str, str, tuple], asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.Server] = None
+        self._requests = 0
+        self._coalesced = 0
+        self._rejected = 0
+        self._batches = 0
+        self._batched = 0
+        self.metrics = metrics
+        self._http_metrics = None if metrics is None else HttpMetrics(metrics)
+        # 같은 프로세스에서 처리하는 스레드 풀에만 지표를 기록하는 처리기를 넘김
+        self._processor = (
+            TextProcessor(result_cache=ResultCache(), metrics=metrics)
+            if metrics is not None and isinstance(self._executor, ThreadPoolExecutor)
+            else None
+        )
+        if metrics is not None:
+            metrics.add_collector("service", self._collect_stats)
+
+    @property
+    def stats(self) -> ServiceStats:
+        """현재 처리 통계"""
+        return ServiceStats(
+            self._requests,
+            self._coalesced,
+            self._rejected,
+            self._batches,
+            self._batched,
+            self._queue.qsize(),
+        )
+
+    def _collect_stats(self) -> List[MetricFamily]:
+        """처리 통계를 지표로 내보냅니다. (지표를 내보낼 때 호출)"""
+        stats = self.stats
+        counters = (
+            ("requests", "받은 작업 수"),
+            ("coalesced", "처리 중인 같은 작업의 결과를 함께 기다린 작업 수"),
+            ("rejected", "대기열이 가득 차 거절한 작업 수"),
+            ("batches", "작업자 풀에 맡긴 묶음 수"),
+            ("batched", "묶음으로 처리한 작업 수"),
+        )
+        families = [
+            MetricFamily(
+                f"word_breaker_service_{name}_total",
+                "counter",
+                help,
+                (),
+                {(): getattr(stats, name)},
+            )
+            for name, help in counters
+        ]
+        families.append(
+            MetricFamily(
+                "word_breaker_service_queued",
+                "gauge",
+                "지금 대기열의 작업 수",
+                (),
+                {(): stats.queued},
+            )
+        )
+        return families
+
+    async def submit(self, operation: str, text: str, options: tuple = ()) -> Any:
+        """
+        작업 하나를 맡기고 결과를 기다립니다.
+
+        Args:
+            operation (str): 작업 이름 (OPERATIONS 중 하나)
+            text (str): 텍스트
+            options (tuple): 처리 함수에 넘길 옵션 (format은 parse_format_options의 결과)
+
+        Returns:
+            Any: 처리 결과
+
+        Raises:
+            ServiceBusy: 대기열이 가득 차 기다리는 시간 안에 자리가 나지 않은 경우
+            JobFailed: 작업자에서 처리하다 실패한 경우
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"알 수 없는 작업입니다: {operation}")
+        self._ensure_dispatcher()
+        self._requests += 1
+
+        # 문자열 해시는 캐시되므로 텍스트를 그대로 키로 씀 (같은 해시일 때만 내용 비교)
+        key = (operation, text, options)
+        future = self._in_flight.get(key)
+        if future is not None:
+            self._coalesced += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            pending = _Pending(operation, text, options, future)
+            try:
+                self._queue.put_nowait(pending)
+            except asyncio.QueueFull:
+                # 자리를 기다리는 일은 요청과 따로 돌려, 이 요청이 끊겨도
+                # 같은 작업을 기다리는 다른 요청을 위해 계속 기다림
+                self._spawn(self._enqueue(pending))
+
+        # 한 요청이 끊겨도 같은 결과를 기다리는 다른 요청은 계속 기다림
+        return await asyncio.shield(future)
+
+    async def _enqueue(self, pending: _Pending) -> None:
+        """대기열에 자리가 나기를 기다려 넣고, 기다리는 시간을 넘으면 ServiceBusy로 끝냅니다."""
+        try:
+            await asyncio.wait_for(self._queue.put(pending), self.queue_wait)
+        except TimeoutError:
+            self._rejected += 1
+            pending.future.set_exception(ServiceBusy("대기열이 가득 찼습니다"))
+
+    def _spawn(self, coroutine) -> None:
+        """백그라운드 작업을 시작합니다. (close에서 끝나기를 기다림)"""
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> int:
+        """
+        HTTP 서버를 시작합니다.
+
+        Args:
+            host (str): 받을 주소
+            port (int): 받을 포트 (0이면 비어 있는 포트)
+
+        Returns:
+            int: 실제로 받는 포트
+        """
+        self._ensure_dispatcher()
+        # 작업 프로세스를 연결을 받기 전에 띄움 (나중에 fork하면 열린 연결 소켓이 자식에게
+        # 복제되어 서버가 닫아도 클라이언트가 연결 종료를 받지 못함)
+        await asyncio.get_running_loop().run_in_executor(self._executor, run_batch, [])
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """서버가 닫힐 때까지 요청을 받습니다."""
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """서버와 묶음 배정을 멈추고, 직접 만든 작업자 풀을 닫습니다."""
+        if self._server is not None:
+            # 요청을 기다리며 열려 있는 연결 유지 연결도 닫음
+            self._server.close()
+            self._server.close_clients()
+            await self._server.wait_closed()
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._dispatcher
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        """
+        작업자가 비면 대기열에 쌓인 요청을 묶어 맡깁니다.
+        묶음을 기다리며 시간을 끌지 않고 그때 쌓여 있는 만큼만 묶으므로,
+        한가할 때는 요청 하나씩 바로 처리되고 바쁠수록 묶음이 커집니다.
+        넣으면 batch_chars를 넘는 요청은 다음 묶음의 첫 요청으로 미루므로,
+        batch_chars보다 큰 요청은 항상 혼자 처리됩니다.
+        """
+        queue = self._queue
+        held: Optional[_Pending] = None  # 앞 묶음에 넣지 못해 미룬 요청
+        while True:
+            await self._slots.acquire()
+            if held is None:
+                batch = [await queue.get()]
+            else:
+                batch = [held]
+                held = None
+            chars = len(batch[0].text)
+            while not queue.empty() and len(batch) < self.batch_items:
+                item = queue.get_nowait()
+                if chars + len(item.text) > self.batch_chars:
+                    held = item
+                    break
+                batch.append(item)
+                chars += len(item.text)
+
+            self._spawn(self._run(batch))
+
+    async def _run(self, batch: List[_Pending]) -> None:
+        """묶음 하나를 작업자 풀에서 처리하고 요청마다 결과를 전달합니다."""
+        self._batches += 1
+        self._batched += len(batch)
+        jobs = [(item.operation, item.text, item.options) for item in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, run_batch, jobs, self._processor
+            )
+        except Exception as e:
+            results = [(False, f"{type(e).__name__}: {e}")] * len(batch)
+        finally:
+            self._slots.release()
+
+        for item, (ok, value) in zip(batch, results):
+            if item.future.done():
+                continue
+            if ok:
+                item.future.set_result(value)
+            else:
+                item.future.set_exception(JobFailed(value))
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """연결 하나에서 요청을 차례로 받아 응답합니다. (HTTP/1.1 연결 유지)"""
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except _HttpError as e:
+                    await _write_response(writer, e.status, {"error": str(e)}, False)
+                    break
+                if request is None:
+                    break
+
+                method, path, body, keep_alive = request
+                started = time.perf_counter()
+                status, payload = await self._route(method, path, body)
+                if isinstance(payload, str):
+                    sent = await _write_text(writer, status, payload, keep_alive)
+                else:
+                    text = payload.get("text") if status == 200 else None
+                    if text is not None and len(text) >= self.stream_min_chars:
+                        sent = await _stream_text(writer, text, keep_alive)
+                    else:
+                        sent = await _write_response(
+                            writer, status, payload, keep_alive
+                        )
+                if self._http_metrics is not None:
+                    route = path.split("?", 1)[0]
+                    self._http_metrics.record(
+                        route if route in _ROUTES else _OTHER_PATH,
+                        status,
+                        len(body),
+                        sent,
+                        time.perf_counter() - started,
+                    )
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _route(
+        self, method: str, path: str, body: bytes
+    ) -> Tuple[int, Union[Dict[str, Any], str]]:
+        """요청 하나를 처리해 (상태 코드, 응답 JSON 또는 /metrics의 지표 텍스트)를 돌려줍니다."""
+        path = path.split("?", 1)[0]
+        if path not in _ROUTES or (path == "/metrics" and self.metrics is None):
+            return 404, {"error": f"없는 경로입니다: {path}"}
+        if method != _ROUTES[path]:
+            return 405, {"error": f"{path}는 {_ROUTES[path]}만 받습니다"}
+        if path == "/health":
+            return 200, {"status": "ok", **self.stats._asdict()}
+        if path == "/metrics":
+            return 200, self.metrics.render()
+
+        try:
+            payload = json.loads(body)
+            text = payload["text"]
+            if not isinstance(text, str):
+                raise ValueError("text는 문자열이어야 합니다")
+            if path == "/format":
+                operation, options = "format", parse_format_options(payload)
+            else:
+                operation, options = "count", ()
+        except (ValueError, KeyError, TypeError) as e:
+            return 400, {"error": f"잘못된 요청입니다: {e}"}
+
+        try:
+            result = await self.submit(operation, text, options)
+        except ServiceBusy as e:
+            return 503, {"error": str(e)}
+        except JobFailed as e:
+            return 500, {"error": str(e)}
+        return 200, {"text": result} if operation == "format" else result
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[str, str, bytes, bool]]:
+    """
+    요청 하나를 읽습니다.
+
+    Returns:
+        Optional[Tuple[str, str, bytes, bool]]: (메서드, 경로, 본문, 연결 유지 여부),
+            요청 사이에 연결이 닫혔으면 None
+
+    Raises:
+        _HttpError: 요청 형식이 잘못되었거나 본문이 너무 큰 경우
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if not e.partial.strip():
+            return None
+        raise _HttpError(400, "요청 머리글이 끝나지 않았습니다")
+    except asyncio.LimitOverrunError:
+        raise _HttpError(400, "요청 머리글이 너무 깁니다")
+
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, path, version = request_line.split(" ")
+    except ValueError:
+        raise _HttpError(400, "요청 줄 형식이 잘못되었습니다")
+
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if "transfer-encoding" in headers:
+        raise _HttpError(411, "본문은 Content-Length로 보내야 합니다")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise _HttpError(400, "Content-Length 형식이 잘못되었습니다")
+    if length < 0:
+        raise _HttpError(400, "Content-Length는 0 이상이어야 합니다")
+    if length > MAX_BODY_BYTES:
+        raise _HttpError(413, f"본문은 {MAX_BODY_BYTES}바이트까지 받습니다")
+    body = await reader.readexactly(length) if length else b""
+
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" and (
+        version == "HTTP/1.1" or connection == "keep-alive"
+    )
+    return method, path, body, keep_alive
+
+
+def _head(
+    status: int,
+    keep_alive: bool,
+    *headers: str,
+    content_type: str = _JSON_CONTENT_TYPE,
+) -> bytes:
+    lines = [
+        f"HTTP/1.1 {status} {_REASONS[status]}",
+        f"Content-Type: {content_type}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        *headers,
+    ]
+    if status == 503:
+        lines.append("Retry-After: 1")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def _json_bytes(value: Any) -> bytes:
+    """
+    값을 UTF-8 JSON으로 인코딩합니다.
+    UTF-8로 쓸 수 없는 문자(짝 없는 서로게이트 등)가 있으면 \\u 이스케이프(ASCII)로 씁니다.
+    """
+    try:
+        return json.dumps(value, ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        return json.dumps(value).encode("ascii")
+
+
+async def _write_response(
+    writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool
+) -> int:
+    """JSON 응답을 보내고 보낸 바이트 수를 돌려줍니다."""
+    body = _json_bytes(payload)
+    data = _head(status, keep_alive, f"Content-Length: {len(body)}") + body
+    writer.write(data)
+    await writer.drain()
+    return len(data)
+
+
+async def _write_text(
+    writer: asyncio.StreamWriter, status: int, text: str, keep_alive: bool
+) -> int:
+    """지표 텍스트 응답을 보내고 보낸 바이트 수를 돌려줍니다."""
+    body = text.encode("utf-8")
+    data = (
+        _head(
+            status,
+            keep_alive,
+            f"Content-Length: {len(body)}",
+            content_type=CONTENT_TYPE,
+        )
+        + body
+    )
+    writer.write(data)
+    await writer.drain()
+    return len(data)
+
+
+async def _stream_text(
+    writer: asyncio.StreamWriter, text: str, keep_alive: bool
+) -> int:
+    """
+    {"text": ...} 응답을 청크 전송 인코딩으로 나눠 보내고 보낸 바이트 수를 돌려줍니다.
+    응답 전체를 인코딩한 사본을 만들지 않고, 조각마다 클라이언트가 받기를 기다립니다.
+    """
+    head = _head(200, keep_alive, "Transfer-Encoding: chunked") + b'A\r\n{"text": "\r\n'
+    writer.write(head)
+    sent = len(head)
+    for start in range(0, len(text), STREAM_CHUNK_CHARS):
+        # 조각마다 JSON 문자열로 이스케이프하고 양쪽 따옴표를 뗌
+        data = _json_bytes(text[start : start + STREAM_CHUNK_CHARS])[1:-1]
+        chunk = b"%X\r\n%s\r\n" % (len(data), data)
+        writer.write(chunk)
+        sent += len(chunk)
+        await writer.drain()
+    tail = b'2\r\n"}\r\n0\r\n\r\n'
+    writer.write(tail)
+    await writer.drain()
+    return sent + len(tail)
+
+
+class ServiceClient:
+    """
+    서비스에 연결 하나를 유지하며 요청을 보내는 클라이언트 (asyncio)
+
+    사용 예:
+        async with ServiceClient(port=8765) as client:
+            status, result = await client.request("POST", "/format", {"text": text})
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def __aenter__(self) -> "ServiceClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            with suppress(ConnectionError):
+                await self._writer.wait_closed()
+            self._writer = None
+
+    async def request(
+        self, method: str, path: str, payload: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Any]:
+        """
+        요청을 보내고 응답을 받습니다.
+
+        Returns:
+            Tuple[int, Any]: (상태 코드, 응답 JSON)
+        """
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self._writer.write(
+            (
+                f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+            ).encode("latin-1")
+            + body
+        )
+        await self._writer.drain()
+        status, body = await _read_response(self._reader)
+        return status, json.loads(body)
+
+
+async def _read_response(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """응답 하나를 읽습니다. (Content-Length 또는 청크 전송 인코딩)"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding") == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).strip(), 16)
+            chunk = await reader.readexactly(size + 2)
+            if not size:
+                break
+            chunks.append(chunk[:-2])
+        body = b"".join(chunks)
+    else:
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+    return int(status_line.split(" ")[1]), body
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: Optional[int] = None,
+    queue_size: int = QUEUE_SIZE,
+    metrics: Optional[MetricsRegistry] = None,
+) -> None:
+    """서비스를 시작하고 중단될 때까지(Ctrl+C) 요청을 받습니다. (metrics를 주면 GET /metrics)"""
+
+    async def run() -> None:
+        service = FormatService(workers, queue_size=queue_size, metrics=metrics)
+        bound = await service.start(host, port)
+        print(
+            f"http://{host}:{bound} 에서 요청을 받습니다 (작업자 {service.workers}개)"
+        )
+        try:
+            await service.serve_forever()
+        finally:
+            await service.close()
+
+    with suppress(KeyboardInterrupt):
+        asyncio.run(run())
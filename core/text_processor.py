@@ -1,19 +1,383 @@
-from typing import List
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Union,
+)
 from utils.text_counter import (
+    char_width,
     count_korean,
     count_all_chars,
     count_all_chars_with_period,
+    count_display_width,
+    count_many,
 )
+from itertools import batched
+import os
 import re
 
+from core.balanced import wrap_balanced
+from core.cache import ParagraphCache, ResultCache, StageCache
+from core.cancellation import (
+    CancellationToken,
+    Checkpoint,
+    ProgressCallback,
+    checkpoint_for,
+)
+from core.instrumentation import (
+    TIMER_COUNT,
+    TIMER_NORMALIZE,
+    TIMER_SEPARATE,
+    TIMER_SPLIT_LONG_WORD,
+    TIMER_STRIP_INVISIBLE,
+    TIMER_TOKENIZE,
+    TIMER_WRAP,
+    Instrumentation,
+)
+from core.metrics import ApiMetrics, MetricsRegistry, cache_collector
+from core.parallel import (
+    CHUNKS_PER_WORKER,
+    PARALLEL_MIN_LENGTH,
+    create_executor,
+    split_at_paragraphs,
+    wrap_paragraph_chunk,
+)
+from core.tokens import Tokens
+from core.wrapping import Lines, WrapStats, iter_windows, wrap_spans
+
+if TYPE_CHECKING:
+    from core.advances import AdvanceTable
+    from core.plan import FormatPlan
+
 
 # 기본 줄 길이 설정
 DEFAULT_LINE_LENGTH = 18
 
+# 화면에서 고를 수 있는 줄 길이 범위 (format_multi 기본값)
+LINE_LENGTH_RANGE = range(10, 101)
+
+# format_to가 한 번에 이어 붙여 쓰는 줄 수
+OUTPUT_BATCH_LINES = 4096
+
+# 마침표 분리 시 제거하는 보이지 않는 문자들
+INVISIBLE_CHARS = (
+    "\u200b",  # Zero Width Space
+    "\u200c",  # Zero Width Non-Joiner
+    "\u200d",  # Zero Width Joiner
+    "\u200e",  # Left-to-Right Mark
+    "\u200f",  # Right-to-Left Mark
+    "\ufeff",  # Zero Width No-Break Space
+    "\u2060",  # Word Joiner
+)
+
+# 마침표 바로 뒤에 공백이 아닌 문자가 오는 위치
+_PERIOD_BEFORE_CHAR = re.compile(r"\.(\S)")
+
+# 청크 안의 마지막 단어 끝 (바로 뒤에 공백이 오는 위치, 스트리밍 구간 경계)
+_LAST_WORD_END = re.compile(r".*\S(?=\s)", re.DOTALL)
+
+# compile에서 고르는 카운팅 방식 (모든 문자 / 한글만 / 표시 폭 / 글꼴 픽셀 폭)
+COUNTING_ALL_CHARS = "all_chars"
+COUNTING_KOREAN = "korean"
+COUNTING_DISPLAY_WIDTH = "display_width"
+COUNTING_PIXELS = "pixels"
+COUNTING_MODES = (
+    COUNTING_ALL_CHARS,
+    COUNTING_KOREAN,
+    COUNTING_DISPLAY_WIDTH,
+    COUNTING_PIXELS,
+)
+
+# 문단 캐시 키에 쓰는 카운팅 방식 이름
+_ALL_CHARS_MODE = "all_chars"
+_ALL_CHARS_BALANCED_MODE = "all_chars_balanced"
+
+# 결과 캐시에서 format_with_stats의 결과(FormatResult)를 문자열 결과와 구분하는 키 옵션
+_WITH_STATS = "with_stats"
+
+# 단계 캐시를 쓸 때의 처리 단계 (순서대로)
+# 공백 정리 → 마침표 분리 → 단어/문자 수 배열 → 줄 나눌 위치 → 결과 문자열
+STAGE_NORMALIZE = "normalize"
+STAGE_SEPARATE = "separate"
+STAGE_TOKENIZE = "tokenize"
+STAGE_WRAP = "wrap"
+STAGE_JOIN = "join"
+STAGES = (STAGE_NORMALIZE, STAGE_SEPARATE, STAGE_TOKENIZE, STAGE_WRAP, STAGE_JOIN)
+
+# 진행 상황 보고 시 단계가 끝나는 비율 (나머지는 줄 나누기)
+_PROGRESS_SEPARATED = 0.2  # 마침표 분리 (공백 정리와 빈 행 넣기가 절반씩)
+_PROGRESS_TOKENIZED = 0.8  # 단계 캐시 경로의 단어 배열 만들기
+
+# 계측할 때 시간을 재는 래퍼로 바꾸는 메서드와 계측 구간
+_INSTRUMENTED_METHODS = (
+    ("_strip_invisible", TIMER_STRIP_INVISIBLE),
+    ("normalize_whitespace", TIMER_NORMALIZE),
+    ("_split_at_periods", TIMER_SEPARATE),
+    ("_tokenize", TIMER_TOKENIZE),
+    ("_wrap_spans", TIMER_WRAP),
+    ("_wrap_balanced", TIMER_WRAP),
+    ("_count_korean_word", TIMER_COUNT),
+    ("count_korean_chars", TIMER_COUNT),
+    ("count_all_chars", TIMER_COUNT),
+    ("count_all_chars_with_period", TIMER_COUNT),
+    ("count_display_width", TIMER_COUNT),
+    ("_split_long_word", TIMER_SPLIT_LONG_WORD),
+    ("_split_long_word_by_all_chars", TIMER_SPLIT_LONG_WORD),
+    ("_split_long_word_by_display_width", TIMER_SPLIT_LONG_WORD),
+)
+
+# 지표를 모을 때 호출 지표를 기록하는 래퍼로 바꾸는 공개 API (api 레이블 값은 메서드 이름)
+_METERED_APIS = (
+    "format_text_with_options",
+    "format_with_stats",
+    "format_lines",
+    "format_multi",
+    "format_to",
+    "separate_sentences_by_period",
+    "split_by_korean_count",
+    "split_by_all_chars_simple",
+    "split_by_all_chars",
+    "split_by_display_width",
+    "count_korean_chars",
+    "count_all_chars",
+    "count_all_chars_with_period",
+    "count_display_width",
+)
+
+
+class FormatResult(NamedTuple):
+    """
+    가다듬은 텍스트와 줄을 나누는 중에 함께 모은 통계
+    줄 문자 수(longest_line, shortest_line)는 나눌 때 쓴 카운팅 방식 기준이며 빈 행은 제외합니다.
+    """
+
+    text: str
+    line_count: int = 0  # 빈 행을 포함한 전체 줄 수
+    paragraph_count: int = (
+        0  # 단어가 있는 문단 수 (마침표 분리를 끄면 텍스트 전체가 한 문단)
+    )
+    all_chars: int = 0  # count_all_chars 기준 문자 수
+    all_chars_with_period: int = 0  # count_all_chars_with_period 기준 문자 수
+    korean_chars: int = 0  # 한글 문자 수
+    forced_splits: int = 0  # 줄 길이보다 길어 강제로 나눈 단어 수
+    longest_line: int = 0
+    shortest_line: int = 0
+
+    @classmethod
+    def from_stats(cls, lines: Lines, stats: WrapStats) -> "FormatResult":
+        """나눈 줄 목록과 나누는 중에 채운 통계로 결과를 만듭니다."""
+        return cls(
+            lines.join(),
+            len(lines),
+            stats.paragraphs,
+            stats.all_chars,
+            stats.all_chars_with_period,
+            stats.korean_chars,
+            stats.forced_splits,
+            stats.longest,
+            stats.shortest,
+        )
+
+
+def _stage(
+    checkpoint: Optional[Checkpoint], start: float, end: float, length: int
+) -> Optional[Checkpoint]:
+    """확인 지점이 있으면 전체 진행량의 [start, end) 비율을 다음 단계에 배정합니다."""
+    if checkpoint is None:
+        return None
+    return checkpoint.stage(start, end, length)
+
+
+def _checked_windows(text: str, checkpoint: Optional[Checkpoint]) -> Iterator[str]:
+    """iter_windows의 구간 문자열 (구간마다 취소 확인과 진행 상황 보고)"""
+    for start, window in iter_windows(text):
+        if checkpoint is not None:
+            checkpoint(start)
+        yield window
+
+
+def _normalize_windows(windows: Iterable[str]) -> Iterator[str]:
+    """
+    이어진 구간들의 연속된 공백(개행 포함)을 한 칸으로 정리합니다. (앞뒤 공백은 한 칸으로 남김)
+    구간 경계는 단어 바로 뒤여야 하며(iter_windows와 같음), 내보낸 조각을 이으면
+    구간 전체를 한 번에 정리한 결과와 같습니다.
+    """
+    started = emitted = False  # 구간 / 단어가 하나라도 있었는지 여부
+    separator = ""  # 다음 조각 앞에 붙일 공백
+    ends_with_space = False
+    for window in windows:
+        if not window:
+            continue
+        if not started:
+            started = True
+            separator = " " if window[0].isspace() else ""
+        ends_with_space = window[-1].isspace()
+        # 단어 목록은 단어 수만큼 문자열 객체를 만들므로 구간별로 만듦
+        piece = " ".join(window.split())
+        if piece:
+            yield separator + piece
+            separator = " "
+            emitted = True
+    if started and (ends_with_space or not emitted):
+        # 끝의 공백 (공백만 있으면 한 칸)
+        yield " "
+
+
+def _split_windows_at_periods(windows: Iterable[str]) -> Iterator[str]:
+    """
+    공백이 정리된 구간들의 마침표 뒤에 빈 행을 넣습니다.
+    구간 경계는 단어 바로 뒤이므로 단어 안의 마침표는 한 구간에서 모두 처리되고,
+    구간 경계에 걸친 ". "만 다음 구간 맨 앞의 공백을 바꿔 처리합니다.
+    """
+    after_period = False  # 앞 구간이 마침표로 끝났는지 여부
+    for window in windows:
+        if after_period and window[0] == " ":
+            window = "\n\n" + window[1:]
+        after_period = window[-1] == "."
+
+        # 마침표 뒤에 공백이나 줄바꿈이 있는 경우 빈 행 추가 (공백은 한 칸뿐)
+        window = window.replace(". ", ".\n\n")
+
+        # 마침표 뒤에 바로 문자가 오는 경우도 처리
+        yield _PERIOD_BEFORE_CHAR.sub(".\n\n\\1", window)
+
+
+def _remove_invisible_chars(text: str) -> str:
+    """보이지 않는 문자들을 제거합니다. (들어 있는 문자만 치환)"""
+    for char in INVISIBLE_CHARS:
+        if char in text:
+            text = text.replace(char, "")
+    return text
+
 
 class TextProcessor:
     """텍스트 가다듬기 처리 클래스"""
 
+    # 줄 나누기 함수 (계측할 때 인스턴스의 래퍼로 가려짐)
+    _wrap_spans = staticmethod(wrap_spans)
+    _wrap_balanced = staticmethod(wrap_balanced)
+
+    # 줄 나누기 안에서 단어마다 부르는 한글 카운팅 (공개 API 지표에 단어마다 기록되지 않도록 따로 둠)
+    _count_korean_word = staticmethod(count_korean)
+
+    def __init__(
+        self,
+        paragraph_cache: Optional[ParagraphCache] = None,
+        workers: Optional[int] = 1,
+        result_cache: Optional[ResultCache] = None,
+        stage_cache: Optional[StageCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Args:
+            paragraph_cache (Optional[ParagraphCache]): 문단 단위 결과 캐시
+                지정하면 마침표 분리 + 모든 문자 카운팅 경로에서 바뀐 문단만 다시 나눕니다.
+                format_text_with_options, format_with_stats, format_lines(문자열 입력의 format_to 포함),
+                split_by_all_chars에 적용되며, 단어 배열을 공유하는 format_multi와
+                구간 단위로 흘려 보내는 iter_format은 쓰지 않습니다.
+            workers (Optional[int]): 큰 문서를 나눠 처리할 작업자 수 (None: CPU 수, 1: 병렬 처리 안 함)
+                마침표 분리 + 모든 문자 카운팅 경로에서 PARALLEL_MIN_LENGTH 이상인 텍스트에 적용되며,
+                결과는 한 스레드로 처리한 것과 같습니다.
+            result_cache (Optional[ResultCache]): 가다듬기 결과 캐시
+                같은 텍스트를 같은 옵션으로 다시 가다듬으면 저장된 결과를 그대로 반환합니다.
+                format_text_with_options와 format_with_stats(통계와 함께 따로 저장)에 적용되며,
+                format_lines(문자열 입력의 format_to 포함)는 format_text_with_options가 저장한 결과를
+                찾기만 합니다. format_multi와 iter_format은 쓰지 않습니다.
+            stage_cache (Optional[StageCache]): format_text_with_options 단계별 중간 결과 캐시
+                지정하면 단계(STAGES)별 결과를 보관해 줄 길이만 바꾸면 단어 배열을,
+                카운팅 방식만 바꾸면 마침표 분리 결과를 재사용합니다. (문단 캐시보다 우선)
+            instrumentation (Optional[Instrumentation]): 처리 구간 계측
+                지정하면 구간(보이지 않는 문자 제거, 마침표 분리, 단어 배열, 줄 나누기,
+                문자 수 세기, 강제 분할)마다 누적 시간, 호출 수, 문자 수를 모읍니다.
+                지정하지 않으면 계측 비용이 전혀 없습니다.
+            metrics (Optional[MetricsRegistry]): 처리 지표 모음
+                지정하면 공개 API(_METERED_APIS)마다 지연 시간 히스토그램, 입력 문자 수,
+                실패 수를 기록하고, 캐시의 적중률을 내보냅니다.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("작업자 수는 1 이상이어야 합니다")
+        self.paragraph_cache = paragraph_cache
+        self.result_cache = result_cache
+        self.stage_cache = stage_cache
+        self.workers = workers
+        self.instrumentation = instrumentation
+        self.metrics = metrics
+        self._executor = None
+        if instrumentation is not None:
+            # 클래스 메서드를 인스턴스의 래퍼로 가려, 계측하지 않는 처리기는 확인 없이 그대로 부름
+            for name, timer in _INSTRUMENTED_METHODS:
+                setattr(self, name, instrumentation.timed(timer, getattr(self, name)))
+        if metrics is not None:
+            api = ApiMetrics(metrics)
+            for name in _METERED_APIS:
+                setattr(self, name, api.timed(name, getattr(self, name)))
+            caches = {
+                name: cache
+                for name, cache in (
+                    ("result", result_cache),
+                    ("paragraph", paragraph_cache),
+                    ("stage", stage_cache),
+                )
+                if cache is not None
+            }
+            if caches:
+                metrics.add_collector("text_processor_caches", cache_collector(caches))
+
+    def close(self) -> None:
+        """병렬 처리용 작업자 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "TextProcessor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def compile(
+        self,
+        line_length: int = DEFAULT_LINE_LENGTH,
+        counting: str = COUNTING_ALL_CHARS,
+        sentence_split: bool = True,
+        balanced: bool = False,
+        advances: Optional["AdvanceTable"] = None,
+    ) -> "FormatPlan":
+        """
+        옵션 조합 하나에 맞는 가다듬기 방법을 미리 정해 둔 FormatPlan을 만듭니다.
+        같은 옵션으로 여러 번 가다듬을 때 옵션에 따른 분기와 함수 선택을 호출마다 반복하지 않습니다.
+
+        Args:
+            line_length (int): 한 줄당 문자 수 (COUNTING_PIXELS이면 픽셀 폭)
+            counting (str): 카운팅 방식
+                (COUNTING_ALL_CHARS: 모든 문자, COUNTING_KOREAN: 한글만, COUNTING_DISPLAY_WIDTH: 표시 폭,
+                COUNTING_PIXELS: 글꼴 픽셀 폭)
+            sentence_split (bool): 마침표 분리 여부
+            balanced (bool): 균형 배치 여부
+            advances (Optional[AdvanceTable]): 글꼴 전진 폭 표 (COUNTING_PIXELS에 필요)
+
+        Returns:
+            FormatPlan: 여러 스레드에서 함께 써도 되는 바꿀 수 없는 가다듬기 계획
+
+        Raises:
+            ValueError: 줄 길이가 1보다 작거나 알 수 없는 카운팅 방식인 경우,
+                COUNTING_PIXELS인데 전진 폭 표가 없는 경우
+        """
+        from core.plan import FormatPlan
+
+        return FormatPlan(
+            self, line_length, counting, sentence_split, balanced, advances
+        )
+
     def format_text(self, text: str, line_length: int = DEFAULT_LINE_LENGTH) -> str:
         """
         deprecated
@@ -50,55 +414,11 @@ class TextProcessor:
         if not text.strip():
             return []
 
-        # 공백으로 단어 분리
-        words = text.split()
-        if not words:
-            return []
-
-        lines = []
-        current_line = ""
-        current_korean_count = 0
-
-        for word in words:
-            word_korean_count = self.count_korean_chars(word)
-
-            # 현재 줄에 단어를 추가했을 때의 한글 문자 수 계산
-            if current_line:
-                # 공백 1개 추가
-                total_korean_count = current_korean_count + word_korean_count
-            else:
-                # 첫 번째 단어
-                total_korean_count = word_korean_count
-
-            # 길이 제한 확인
-            if total_korean_count <= length:
-                # 현재 줄에 추가
-                if current_line:
-                    current_line += " " + word
-                else:
-                    current_line = word
-                current_korean_count = total_korean_count
-            else:
-                # 새로운 줄 시작
-                if current_line:
-                    lines.append(current_line)
-
-                # 단어 자체가 길이 제한을 초과하는 경우
-                if word_korean_count > length:
-                    # 단어를 강제로 분할
-                    split_word = self._split_long_word(word, length)
-                    lines.extend(split_word[:-1])  # 마지막 부분 제외하고 추가
-                    current_line = split_word[-1]  # 마지막 부분을 현재 줄로
-                    current_korean_count = self.count_korean_chars(current_line)
-                else:
-                    current_line = word
-                    current_korean_count = word_korean_count
-
-        # 마지막 줄 추가
-        if current_line:
-            lines.append(current_line)
-
-        return lines
+        return list(
+            self._wrap_spans(
+                text, length, self._count_korean_word, self._split_long_word
+            )
+        )
 
     def _split_long_word(self, word: str, max_length: int) -> List[str]:
         """긴 단어를 강제로 분할합니다."""
@@ -154,12 +474,27 @@ class TextProcessor:
     def count_all_chars_with_period(self, text: str) -> int:
         return count_all_chars_with_period(text)
 
+    def count_display_width(self, text: str) -> int:
+        """
+        텍스트의 표시 폭을 카운트합니다. (전각 2, 반각 1, 폭 없음/결합 문자 0)
+
+        Args:
+            text (str): 카운트할 텍스트
+
+        Returns:
+            int: 터미널과 자막 렌더러에서 차지하는 칸 수
+        """
+        return count_display_width(text)
+
     def format_text_with_options(
         self,
         text: str,
         line_length: int,
         use_all_chars: bool = True,
         separate_sentences: bool = True,
+        balanced: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        token: Optional[CancellationToken] = None,
     ) -> str:
         """
         옵션을 고려한 텍스트 가다듬기
@@ -169,29 +504,645 @@ class TextProcessor:
             line_length (int): 한 줄당 문자 수
             use_all_chars (bool): 모든 문자 카운팅 여부 (True: 모든 문자, False: 한글만)
             separate_sentences (bool): 마침표 분리 여부
+            balanced (bool): 균형 배치 여부 (True: 문단마다 줄 길이를 고르게, False: 줄을 꽉 채움)
+            progress (Optional[ProgressCallback]): 진행 상황 콜백 (처리한 문자 수, 전체 문자 수)
+            token (Optional[CancellationToken]): 취소 토큰 (구간과 문단마다 확인)
 
         Returns:
             str: 가다듬어진 텍스트
+
+        Raises:
+            OperationCancelled: 처리 중 취소가 요청된 경우
         """
+        if self.stage_cache is not None:
+            # 결과 캐시에서 찾은 경우에도 이전 실행의 단계 기록이 남지 않도록 먼저 초기화
+            self.stage_cache.begin()
+        checkpoint = checkpoint_for(len(text), progress, token)
+        cache = self.result_cache
+        if cache is None:
+            result = self._format_text_with_options(
+                text,
+                line_length,
+                use_all_chars,
+                separate_sentences,
+                balanced,
+                checkpoint,
+            )
+        else:
+            key = cache.key(
+                text, line_length, use_all_chars, separate_sentences, balanced
+            )
+            result = cache.get(key)
+            if result is None:
+                result = self._format_text_with_options(
+                    text,
+                    line_length,
+                    use_all_chars,
+                    separate_sentences,
+                    balanced,
+                    checkpoint,
+                )
+                cache.put(key, result)
+
+        if checkpoint is not None:
+            checkpoint.finish()
+        return result
+
+    def _format_text_with_options(
+        self,
+        text: str,
+        line_length: int,
+        use_all_chars: bool,
+        separate_sentences: bool,
+        balanced: bool = False,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> str:
+        """format_text_with_options 본체 (결과 캐시를 거치지 않음)"""
+        if self.stage_cache is not None and not self._use_parallel(text):
+            return self._format_staged(
+                text,
+                line_length,
+                use_all_chars,
+                separate_sentences,
+                balanced,
+                checkpoint,
+            )
+
+        if self.paragraph_cache is not None and use_all_chars and separate_sentences:
+            if not text.strip():
+                return ""
+            separated = self._separate(text, checkpoint)
+            return "\n".join(
+                self._split_paragraphs_cached(
+                    separated,
+                    line_length,
+                    balanced,
+                    _stage(checkpoint, _PROGRESS_SEPARATED, 1.0, len(separated)),
+                )
+            )
+
+        if self._use_parallel(text) and use_all_chars and separate_sentences:
+            separated = self._separate(text, checkpoint)
+            return "\n".join(
+                self._wrap_paragraphs_parallel(
+                    separated,
+                    line_length,
+                    balanced,
+                    _stage(checkpoint, _PROGRESS_SEPARATED, 1.0, len(separated)),
+                )
+            )
+
+        return self._format_lines(
+            text,
+            line_length,
+            use_all_chars,
+            separate_sentences,
+            balanced,
+            checkpoint=checkpoint,
+        ).join()
+
+    def _format_staged(
+        self,
+        text: str,
+        line_length: int,
+        use_all_chars: bool,
+        separate_sentences: bool,
+        balanced: bool,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> str:
+        """
+        format_text_with_options를 단계별로 나눠 처리하고 단계마다 결과를 단계 캐시에 보관합니다.
+        각 단계는 앞 단계 결과와 자신이 쓰는 옵션만으로 찾으므로,
+        바뀐 옵션을 쓰는 단계와 그 뒤 단계만 다시 계산합니다.
+        """
+        cache = self.stage_cache
         if not text.strip():
             return ""
 
+        tokens = self._staged_tokens(
+            text, use_all_chars, separate_sentences, checkpoint
+        )
+        lines = cache.lookup(
+            STAGE_WRAP,
+            tokens,
+            (line_length, balanced),
+            lambda source: source.wrap(
+                line_length,
+                balanced,
+                checkpoint=_stage(
+                    checkpoint, _PROGRESS_TOKENIZED, 1.0, len(source.text)
+                ),
+            ),
+        )
+        return cache.lookup(STAGE_JOIN, lines, (), Lines.join)
+
+    def _staged_tokens(
+        self,
+        text: str,
+        use_all_chars: bool,
+        separate_sentences: bool,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> Tokens:
+        """공백 정리 → 마침표 분리 → 단어 배열 단계를 단계 캐시를 거쳐 처리합니다."""
+        cache = self.stage_cache
+        tokenize_from = 0.0
+        if separate_sentences:
+            half = _PROGRESS_SEPARATED / 2
+            text = cache.lookup(
+                STAGE_NORMALIZE,
+                text,
+                (),
+                lambda source: self.normalize_whitespace(
+                    source, _stage(checkpoint, 0.0, half, len(source))
+                ),
+            )
+            text = cache.lookup(
+                STAGE_SEPARATE,
+                text,
+                (),
+                lambda source: self._split_at_periods(
+                    source, _stage(checkpoint, half, _PROGRESS_SEPARATED, len(source))
+                ),
+            )
+            tokenize_from = _PROGRESS_SEPARATED
+        return cache.lookup(
+            STAGE_TOKENIZE,
+            text,
+            (use_all_chars, separate_sentences),
+            lambda source: self._tokenize(
+                source,
+                use_all_chars,
+                separate_sentences,
+                _stage(checkpoint, tokenize_from, _PROGRESS_TOKENIZED, len(source)),
+            ),
+        )
+
+    def format_with_stats(
+        self,
+        text: str,
+        line_length: int,
+        use_all_chars: bool = True,
+        separate_sentences: bool = True,
+        balanced: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> FormatResult:
+        """
+        format_text_with_options와 같이 가다듬고, 결과를 다시 훑지 않도록
+        단어를 나누고 줄을 배치하는 중에 센 문자 수와 줄 통계를 함께 반환합니다.
+
+        Args:
+            text (str): 가다듬을 텍스트
+            line_length (int): 한 줄당 문자 수
+            use_all_chars (bool): 모든 문자 카운팅 여부 (True: 모든 문자, False: 한글만)
+            separate_sentences (bool): 마침표 분리 여부
+            balanced (bool): 균형 배치 여부
+            progress (Optional[ProgressCallback]): 진행 상황 콜백 (처리한 문자 수, 전체 문자 수)
+            token (Optional[CancellationToken]): 취소 토큰 (구간과 문단마다 확인)
+
+        Returns:
+            FormatResult: 가다듬은 텍스트와 통계
+
+        Raises:
+            OperationCancelled: 처리 중 취소가 요청된 경우
+        """
+        if self.stage_cache is not None:
+            self.stage_cache.begin()
+        if not text.strip():
+            return FormatResult("")
+
+        checkpoint = checkpoint_for(len(text), progress, token)
+        cache = self.result_cache
+        if cache is None:
+            result = self._format_with_stats(
+                text,
+                line_length,
+                use_all_chars,
+                separate_sentences,
+                balanced,
+                checkpoint,
+            )
+        else:
+            key = cache.key(
+                text,
+                line_length,
+                use_all_chars,
+                separate_sentences,
+                balanced,
+                _WITH_STATS,
+            )
+            result = cache.get(key)
+            if result is None:
+                result = self._format_with_stats(
+                    text,
+                    line_length,
+                    use_all_chars,
+                    separate_sentences,
+                    balanced,
+                    checkpoint,
+                )
+                cache.put(key, result)
+
+        if checkpoint is not None:
+            checkpoint.finish()
+        return result
+
+    def _format_with_stats(
+        self,
+        text: str,
+        line_length: int,
+        use_all_chars: bool,
+        separate_sentences: bool,
+        balanced: bool,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> FormatResult:
+        """format_with_stats 본체 (결과 캐시를 거치지 않음)"""
+        stats = WrapStats()
+        if self.stage_cache is not None:
+            # 줄 길이만 바꿔 다시 부르면 단어 배열과 문자 수 합계를 재사용
+            tokens = self._staged_tokens(
+                text, use_all_chars, separate_sentences, checkpoint
+            )
+            lines = tokens.wrap(
+                line_length,
+                balanced,
+                stats,
+                _stage(checkpoint, _PROGRESS_TOKENIZED, 1.0, len(tokens.text)),
+            )
+        else:
+            lines = self._format_lines(
+                text,
+                line_length,
+                use_all_chars,
+                separate_sentences,
+                balanced,
+                stats,
+                checkpoint,
+            )
+        return FormatResult.from_stats(lines, stats)
+
+    def format_lines(
+        self,
+        text: str,
+        line_length: int,
+        use_all_chars: bool = True,
+        separate_sentences: bool = True,
+        balanced: bool = False,
+        stats: Optional[WrapStats] = None,
+        progress: Optional[ProgressCallback] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> Lines:
+        """
+        format_text_with_options와 같은 처리를 하되, 줄 문자열을 만들지 않고
+        원문 위치만 담은 지연 줄 목록을 반환합니다.
+        결과 캐시에 format_text_with_options의 결과가 있으면 그 결과 위에 줄 목록을 만들고,
+        없을 때는 결과 문자열을 만들지 않으므로 저장하지 않습니다. (stats를 지정하면 찾지 않음)
+
+        Args:
+            text (str): 가다듬을 텍스트
+            line_length (int): 한 줄당 문자 수
+            use_all_chars (bool): 모든 문자 카운팅 여부 (True: 모든 문자, False: 한글만)
+            separate_sentences (bool): 마침표 분리 여부
+            balanced (bool): 균형 배치 여부 (마침표 분리 시 문단마다, 아니면 텍스트 전체를 고르게)
+            stats (Optional[WrapStats]): 지정하면 줄을 나누는 중에 통계를 채움
+            progress (Optional[ProgressCallback]): 진행 상황 콜백 (처리한 문자 수, 전체 문자 수)
+            token (Optional[CancellationToken]): 취소 토큰 (구간마다 확인)
+
+        Returns:
+            Lines: 가다듬어진 줄 목록 (접근할 때 원문을 잘라 반환)
+
+        Raises:
+            OperationCancelled: 처리 중 취소가 요청된 경우
+        """
+        checkpoint = checkpoint_for(len(text), progress, token)
+        cache = self.result_cache
+        result = None
+        if cache is not None and stats is None:
+            result = cache.get(
+                cache.key(
+                    text, line_length, use_all_chars, separate_sentences, balanced
+                )
+            )
+        if result is not None:
+            lines = Lines.from_text(result)
+        else:
+            lines = self._format_lines(
+                text,
+                line_length,
+                use_all_chars,
+                separate_sentences,
+                balanced,
+                stats,
+                checkpoint,
+            )
+        if checkpoint is not None:
+            checkpoint.finish()
+        return lines
+
+    def _format_lines(
+        self,
+        text: str,
+        line_length: int,
+        use_all_chars: bool,
+        separate_sentences: bool,
+        balanced: bool,
+        stats: Optional[WrapStats] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> Lines:
+        """format_lines 본체 (확인 지점을 단계별로 배정하여 넘김)"""
+        if not text.strip():
+            return Lines.empty()
+
         # 마침표 분리 처리
+        wrap_from = 0.0
         if separate_sentences:
-            text = self.separate_sentences_by_period(text)
+            text = self._separate(text, checkpoint)
+            wrap_from = _PROGRESS_SEPARATED
+        checkpoint = _stage(checkpoint, wrap_from, 1.0, len(text))
+
+        if self.paragraph_cache is not None and use_all_chars and separate_sentences:
+            # 캐시된 문단은 줄 배치를 건너뛰고, 이어 붙인 결과 위에 줄 목록을 만듦
+            return Lines.from_text(
+                "\n".join(
+                    self._split_paragraphs_cached(
+                        text, line_length, balanced, checkpoint, stats
+                    )
+                )
+            )
+
+        wrap = self._wrap_balanced if balanced else self._wrap_spans
 
         # 문자 카운팅 방식에 따른 분할
         if use_all_chars:
-            if separate_sentences:
-                # 마침표 분리가 활성화된 경우: 빈 행을 보존하는 방식
-                lines = self.split_by_all_chars(text, line_length)
-            else:
-                # 마침표 분리가 비활성화된 경우: 기존 방식과 동일한 개행 처리
-                lines = self.split_by_all_chars_simple(text, line_length)
-        else:
-            lines = self.split_by_korean_count(text, line_length)
+            # 마침표 분리가 활성화된 경우: 빈 행을 보존하는 방식
+            # 마침표 분리가 비활성화된 경우: 기존 방식과 동일한 개행 처리
+            return wrap(
+                text,
+                line_length,
+                count_all_chars,
+                self._split_long_word_by_all_chars,
+                paragraphs=separate_sentences,
+                stats=stats,
+                checkpoint=checkpoint,
+            )
+        return wrap(
+            text,
+            line_length,
+            self._count_korean_word,
+            self._split_long_word,
+            stats=stats,
+            checkpoint=checkpoint,
+        )
+
+    def format_multi(
+        self,
+        text: str,
+        widths: Iterable[int] = LINE_LENGTH_RANGE,
+        use_all_chars: bool = True,
+        separate_sentences: bool = True,
+        balanced: bool = False,
+    ) -> Dict[int, Lines]:
+        """
+        여러 줄 길이로 한 번에 가다듬습니다.
+        마침표 분리, 단어 나누기, 문자 수 세기는 한 번만 하고,
+        줄 길이마다 공유된 단어 배열에서 나눌 위치만 다시 구합니다.
+        각 결과는 format_lines(text, width, ...)와 같습니다.
 
-        return "\n".join(lines)
+        Args:
+            text (str): 가다듬을 텍스트
+            widths (Iterable[int]): 한 줄당 문자 수 목록 (기본값: 10~100)
+            use_all_chars (bool): 모든 문자 카운팅 여부 (True: 모든 문자, False: 한글만)
+            separate_sentences (bool): 마침표 분리 여부
+            balanced (bool): 균형 배치 여부
+
+        Returns:
+            Dict[int, Lines]: 줄 길이별 줄 목록 (len()이 줄 수, 줄 문자열은 접근할 때 생성)
+        """
+        if not text.strip():
+            return {width: Lines.empty() for width in widths}
+
+        if separate_sentences:
+            text = self._separate(text)
+        tokens = self._tokenize(text, use_all_chars, separate_sentences)
+        return {width: tokens.wrap(width, balanced) for width in widths}
+
+    def _tokenize(
+        self,
+        text: str,
+        use_all_chars: bool,
+        separate_sentences: bool,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> Tokens:
+        """format_lines와 같은 카운팅 방식과 문단 규칙으로 단어 배열을 만듭니다."""
+        if use_all_chars:
+            return Tokens(
+                text,
+                count_all_chars,
+                self._split_long_word_by_all_chars,
+                paragraphs=separate_sentences,
+                checkpoint=checkpoint,
+            )
+        return Tokens(
+            text,
+            self._count_korean_word,
+            self._split_long_word,
+            checkpoint=checkpoint,
+        )
+
+    def iter_format(
+        self,
+        chunks: Iterable[str],
+        line_length: int,
+        use_all_chars: bool = True,
+        separate_sentences: bool = True,
+        token: Optional[CancellationToken] = None,
+    ) -> Iterator[str]:
+        """
+        청크 단위로 들어오는 텍스트를 스트리밍 방식으로 가다듬습니다.
+        청크를 단어 끝에서 끊은 구간마다 format_text_with_options와 같은 공백 정리/마침표 분리 규칙과
+        줄 나누기 엔진(wrap_spans)을 적용하고, 구간 경계에 걸친 미완성 줄만 다음 구간으로 넘기므로
+        입력 크기와 무관하게 일정한 메모리로 동작합니다.
+
+        "\\n".join(iter_format(chunks, ...))의 결과는
+        format_text_with_options("".join(chunks), ...)와 동일합니다.
+
+        Args:
+            chunks (Iterable[str]): 가다듬을 텍스트 조각들
+            line_length (int): 한 줄당 문자 수
+            use_all_chars (bool): 모든 문자 카운팅 여부 (True: 모든 문자, False: 한글만)
+            separate_sentences (bool): 마침표 분리 여부
+            token (Optional[CancellationToken]): 취소 토큰 (청크마다 확인)
+
+        Yields:
+            str: 완성된 줄 (개행 문자 미포함)
+
+        Raises:
+            OperationCancelled: 처리 중 취소가 요청된 경우
+        """
+        windows = self._iter_chunk_windows(
+            chunks, strip_invisible=separate_sentences, token=token
+        )
+        if separate_sentences:
+            windows = _split_windows_at_periods(_normalize_windows(windows))
+
+        # 카운팅 방식과 문단 규칙은 _format_lines와 같음
+        if use_all_chars:
+            return self._wrap_windows(
+                windows,
+                line_length,
+                count_all_chars,
+                self._split_long_word_by_all_chars,
+                paragraphs=separate_sentences,
+            )
+        return self._wrap_windows(
+            windows, line_length, self._count_korean_word, self._split_long_word
+        )
+
+    def _iter_chunk_windows(
+        self,
+        chunks: Iterable[str],
+        strip_invisible: bool,
+        token: Optional[CancellationToken] = None,
+    ) -> Iterator[str]:
+        """
+        청크들을 iter_windows와 같이 단어 바로 뒤에서 끊은 구간으로 다시 나눕니다.
+        청크마다 마지막 단어 끝까지를 내보내고, 청크 경계에 걸친 나머지는 다음 청크와 이어 붙입니다.
+
+        Yields:
+            str: 구간 문자열 (마지막 구간을 빼면 단어로 끝나고, 다음 구간은 공백으로 시작)
+        """
+        pending = []  # 아직 단어 끝이 오지 않은 나머지 조각
+
+        for chunk in chunks:
+            if token is not None:
+                token.raise_if_cancelled()
+            if strip_invisible:
+                chunk = self._strip_invisible(chunk)
+            match = _LAST_WORD_END.match(chunk)
+            if match is None:
+                if chunk:
+                    pending.append(chunk)
+                continue
+
+            end = match.end()
+            pending.append(chunk[:end])
+            # 큰 청크는 iter_windows로 다시 나눠 구간별 단어 목록이 커지지 않게 함
+            for _, window in iter_windows("".join(pending)):
+                yield window
+            pending = [chunk[end:]]
+
+        for _, window in iter_windows("".join(pending)):
+            yield window
+
+    def _wrap_windows(
+        self,
+        windows: Iterable[str],
+        length: int,
+        count: Callable[[str], int],
+        split_long_word: Callable[[str, int], List[str]],
+        paragraphs: bool = False,
+    ) -> Iterator[str]:
+        """
+        구간마다 wrap_spans로 나누고 완성된 줄을 순서대로 내보냅니다.
+        마지막 줄은 다음 구간의 단어가 더 들어갈 수 있으므로 다음 구간 앞에 붙여 다시 나눕니다.
+        (구간 경계는 단어 바로 뒤이므로 넘긴 줄은 문단 경계 없이 한 칸 공백으로만 이어짐)
+
+        Args:
+            windows (Iterable[str]): _iter_chunk_windows와 같이 단어 바로 뒤에서 끊은 구간들
+            length (int): 한 줄당 최대 문자 수 (공백 제외)
+            count (Callable[[str], int]): 단어의 문자 수를 세는 함수
+            split_long_word (Callable[[str, int], List[str]]): 긴 단어 강제 분할 함수
+            paragraphs (bool): 빈 행(\\n\\n)을 문단 경계로 보존할지 여부
+
+        Yields:
+            str: 완성된 줄 (문단 경계는 빈 문자열)
+        """
+        carry = None  # 아직 끝나지 않은 마지막 줄
+        for window in windows:
+            if carry is not None:
+                window = carry + window
+            lines = self._wrap_spans(
+                window, length, count, split_long_word, paragraphs=paragraphs
+            )
+            if not lines:
+                # 단어가 없는 구간 (넘긴 줄이 없을 때만 생김)
+                continue
+            yield from lines[:-1]
+            carry = lines[-1]
+
+        if carry is not None:
+            yield carry
+
+    def format_to(
+        self,
+        source: Union[str, Iterable[str]],
+        sink: Union[TextIO, Callable[[str], None]],
+        line_length: int,
+        use_all_chars: bool = True,
+        separate_sentences: bool = True,
+        balanced: bool = False,
+        batch_lines: int = OUTPUT_BATCH_LINES,
+        progress: Optional[ProgressCallback] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> int:
+        """
+        가다듬은 결과를 하나의 문자열로 만들지 않고, 완성된 줄을 batch_lines개씩 이어 붙여 sink에 씁니다.
+        sink에 쓴 내용을 모두 이으면 format_text_with_options의 결과와 같습니다.
+
+        문자열은 format_lines로 원문 위치만 구한 뒤 묶음마다 잘라 쓰고,
+        청크 목록은 iter_format으로 스트리밍하므로 입력 전체도 메모리에 두지 않습니다.
+        균형 배치는 문단 전체를 모아야 하므로 청크 목록도 이어 붙여 처리합니다.
+
+        Args:
+            source (Union[str, Iterable[str]]): 가다듬을 텍스트 또는 텍스트 조각들
+            sink (Union[TextIO, Callable[[str], None]]): 쓰기 대상 (write 메서드가 있는 객체 또는 함수)
+            line_length (int): 한 줄당 문자 수
+            use_all_chars (bool): 모든 문자 카운팅 여부 (True: 모든 문자, False: 한글만)
+            separate_sentences (bool): 마침표 분리 여부
+            balanced (bool): 균형 배치 여부
+            batch_lines (int): 한 번에 쓰는 줄 수
+            progress (Optional[ProgressCallback]): 진행 상황 콜백 (처리한 문자 수, 전체 문자 수)
+                청크 목록은 전체 크기를 알 수 없으므로 부르지 않음 (청크를 만드는 쪽에서 보고)
+            token (Optional[CancellationToken]): 취소 토큰 (구간 또는 청크마다 확인)
+
+        Returns:
+            int: 쓴 문자 수
+
+        Raises:
+            OperationCancelled: 처리 중 취소가 요청된 경우 (그때까지 쓴 내용은 sink에 남음)
+        """
+        if batch_lines <= 0:
+            raise ValueError("한 번에 쓰는 줄 수는 1 이상이어야 합니다")
+        write = getattr(sink, "write", sink)
+
+        checkpoint = None
+        if isinstance(source, str) or balanced:
+            if not isinstance(source, str):
+                source = "".join(source)
+            checkpoint = checkpoint_for(len(source), progress, token)
+            lines = self._format_lines(
+                source,
+                line_length,
+                use_all_chars,
+                separate_sentences,
+                balanced,
+                checkpoint=checkpoint,
+            )
+        else:
+            lines = self.iter_format(
+                source, line_length, use_all_chars, separate_sentences, token
+            )
+
+        written = 0
+        separator = ""
+        for batch in batched(lines, batch_lines):
+            data = separator + "\n".join(batch)
+            write(data)
+            written += len(data)
+            separator = "\n"
+        if checkpoint is not None:
+            checkpoint.finish()
+        return written
 
     def split_by_all_chars_simple(self, text: str, length: int) -> List[str]:
         """
@@ -209,62 +1160,70 @@ class TextProcessor:
             return []
 
         # 공백으로 단어 분리 (기존 방식과 동일)
-        words = text.split()
-        if not words:
-            return []
+        return list(
+            self._wrap_spans(
+                text, length, count_all_chars, self._split_long_word_by_all_chars
+            )
+        )
 
-        lines = []
-        current_line = ""
-        current_char_count = 0
+    def split_by_all_chars(
+        self,
+        text: str,
+        length: int,
+        progress: Optional[ProgressCallback] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> List[str]:
+        """
+        텍스트를 모든 문자 수 기준으로 분할합니다.
+
+        Args:
+            text (str): 분할할 텍스트
+            length (int): 한 줄당 최대 문자 수 (공백 제외)
+            progress (Optional[ProgressCallback]): 진행 상황 콜백 (처리한 문자 수, 전체 문자 수)
+            token (Optional[CancellationToken]): 취소 토큰 (구간 또는 조각마다 확인)
 
-        for word in words:
-            word_char_count = count_all_chars(word)
+        Returns:
+            List[str]: 분할된 문자열 리스트
 
-            # 현재 줄에 단어를 추가했을 때의 문자 수 계산
-            if current_line:
-                # 공백 1개 추가하지만 공백은 카운트하지 않음
-                total_char_count = current_char_count + word_char_count
-            else:
-                # 첫 번째 단어
-                total_char_count = word_char_count
-
-            # 길이 제한 확인
-            if total_char_count <= length:
-                # 현재 줄에 추가
-                if current_line:
-                    current_line += " " + word
-                else:
-                    current_line = word
-                current_char_count = total_char_count
-            else:
-                # 새로운 줄 시작
-                if current_line:
-                    lines.append(current_line)
-
-                # 단어 자체가 길이 제한을 초과하는 경우
-                if word_char_count > length:
-                    # 단어를 강제로 분할
-                    split_word = self._split_long_word_by_all_chars(word, length)
-                    lines.extend(split_word[:-1])  # 마지막 부분 제외하고 추가
-                    current_line = split_word[-1]  # 마지막 부분을 현재 줄로
-                    current_char_count = count_all_chars(current_line)
-                else:
-                    current_line = word
-                    current_char_count = word_char_count
-
-        # 마지막 줄 추가
-        if current_line:
-            lines.append(current_line)
+        Raises:
+            OperationCancelled: 처리 중 취소가 요청된 경우
+        """
+        if not text.strip():
+            return []
 
-        return lines
+        checkpoint = checkpoint_for(len(text), progress, token)
+        if self.paragraph_cache is not None:
+            result = self._split_paragraphs_cached(text, length, checkpoint=checkpoint)
+        elif self._use_parallel(text):
+            result = []
+            for chunk in self._wrap_paragraphs_parallel(
+                text, length, checkpoint=checkpoint
+            ):
+                result.extend(chunk.split("\n"))
+        else:
+            # 빈 행(\n\n)을 문단 경계로 보존
+            result = list(
+                self._wrap_spans(
+                    text,
+                    length,
+                    count_all_chars,
+                    self._split_long_word_by_all_chars,
+                    paragraphs=True,
+                    checkpoint=checkpoint,
+                )
+            )
+
+        if checkpoint is not None:
+            checkpoint.finish()
+        return result
 
-    def split_by_all_chars(self, text: str, length: int) -> List[str]:
+    def split_by_display_width(self, text: str, length: int) -> List[str]:
         """
-        텍스트를 모든 문자 수 기준으로 분할합니다.
+        텍스트를 표시 폭 기준으로 분할합니다. (split_by_all_chars와 같이 빈 행을 문단 경계로 보존)
 
         Args:
             text (str): 분할할 텍스트
-            length (int): 한 줄당 최대 문자 수 (공백 제외)
+            length (int): 한 줄당 최대 칸 수 (단어 사이 공백 제외)
 
         Returns:
             List[str]: 분할된 문자열 리스트
@@ -272,73 +1231,153 @@ class TextProcessor:
         if not text.strip():
             return []
 
-        # 빈 행(\n\n)을 보존하기 위해 먼저 빈 행으로 분할
+        return list(
+            self._wrap_spans(
+                text,
+                length,
+                count_display_width,
+                self._split_long_word_by_display_width,
+                paragraphs=True,
+            )
+        )
+
+    def _split_paragraphs_cached(
+        self,
+        text: str,
+        length: int,
+        balanced: bool = False,
+        checkpoint: Optional[Checkpoint] = None,
+        stats: Optional[WrapStats] = None,
+    ) -> List[str]:
+        """
+        split_by_all_chars와 같은 결과를 문단 캐시를 거쳐 만듭니다.
+        캐시에 없는 문단만 모아 한 번에 나눈 뒤 캐시에 저장하고, 나머지는 캐시된 줄을 이어 붙입니다.
+
+        Args:
+            text (str): 분할할 텍스트 (공백만 있는 텍스트는 아님)
+            length (int): 한 줄당 최대 문자 수 (공백 제외)
+            balanced (bool): 균형 배치 여부
+            checkpoint (Optional[Checkpoint]): 캐시에 없는 문단을 나누는 동안 구간마다 확인
+            stats (Optional[WrapStats]): 지정하면 문단과 캐시된 줄에서 통계를 셈 (줄 배치 없이)
+
+        Returns:
+            List[str]: 분할된 문자열 리스트
+        """
+        cache = self.paragraph_cache
+        mode = _ALL_CHARS_BALANCED_MODE if balanced else _ALL_CHARS_MODE
         paragraphs = text.split("\n\n")
-        result = []
+        cached = [
+            None
+            if not paragraph or paragraph.isspace()
+            else cache.get(paragraph, length, mode)
+            for paragraph in paragraphs
+        ]
+
+        missed = [
+            paragraph
+            for paragraph, lines in zip(paragraphs, cached)
+            if lines is None and paragraph and not paragraph.isspace()
+        ]
+        if missed:
+            # 바뀐 문단들을 빈 행으로 이어 한 번에 나누고, 빈 줄(문단 경계) 기준으로 되돌림
+            # (문단에는 \n\n이 없으므로 이어 붙인 경계마다 빈 줄이 정확히 하나씩 생김)
+            wrapped = iter(
+                self._split_missed_paragraphs(
+                    "\n\n".join(missed), length, balanced, checkpoint
+                )
+            )
+            for index, paragraph in enumerate(paragraphs):
+                if cached[index] is None and paragraph and not paragraph.isspace():
+                    lines = []
+                    for line in wrapped:
+                        if not line:
+                            break
+                        lines.append(line)
+                    lines = tuple(lines)
+                    cache.put(paragraph, length, mode, lines)
+                    cached[index] = lines
+
+        if stats is not None:
+            # 캐시된 문단은 나누지 않았으므로 모든 문단의 통계를 문단과 줄에서 같은 방식으로 셈
+            for paragraph, lines in zip(paragraphs, cached):
+                if lines is None:
+                    continue
+                words = paragraph.split()
+                stats.add_words(words)
+                stats.forced_splits += sum(
+                    count > length for count in count_many(words, count_all_chars)
+                )
+                stats.line_counts.extend(count_many(lines, count_all_chars))
+                stats.paragraphs += 1
 
-        for i, paragraph in enumerate(paragraphs):
-            if not paragraph.strip():
+        result = []
+        last = len(paragraphs) - 1
+        for index, lines in enumerate(cached):
+            if lines is None:
                 # 빈 문단은 빈 행으로 추가
                 result.append("")
                 continue
-
-            # 각 문단을 단어로 분할하여 처리
-            words = paragraph.split()
-            if not words:
+            result.extend(lines)
+            if index < last:
                 result.append("")
-                continue
+        return result
 
-            lines = []
-            current_line = ""
-            current_char_count = 0
-
-            for word in words:
-                word_char_count = count_all_chars(word)
-
-                # 현재 줄에 단어를 추가했을 때의 문자 수 계산
-                if current_line:
-                    # 공백 1개 추가하지만 공백은 카운트하지 않음
-                    total_char_count = current_char_count + word_char_count
-                else:
-                    # 첫 번째 단어
-                    total_char_count = word_char_count
-
-                # 길이 제한 확인
-                if total_char_count <= length:
-                    # 현재 줄에 추가
-                    if current_line:
-                        current_line += " " + word
-                    else:
-                        current_line = word
-                    current_char_count = total_char_count
-                else:
-                    # 새로운 줄 시작
-                    if current_line:
-                        lines.append(current_line)
-
-                    # 단어 자체가 길이 제한을 초과하는 경우
-                    if word_char_count > length:
-                        # 단어를 강제로 분할
-                        split_word = self._split_long_word_by_all_chars(word, length)
-                        lines.extend(split_word[:-1])  # 마지막 부분 제외하고 추가
-                        current_line = split_word[-1]  # 마지막 부분을 현재 줄로
-                        current_char_count = count_all_chars(current_line)
-                    else:
-                        current_line = word
-                        current_char_count = word_char_count
-
-            # 마지막 줄 추가
-            if current_line:
-                lines.append(current_line)
-
-            # 처리된 문단을 결과에 추가
-            result.extend(lines)
+    def _use_parallel(self, text: str) -> bool:
+        """병렬 처리할 만큼 큰 텍스트인지 여부"""
+        return self.workers > 1 and len(text) >= PARALLEL_MIN_LENGTH
 
-            # 마지막 문단이 아니라면 빈 행 추가 (원래 \n\n을 보존)
-            if i < len(paragraphs) - 1:
-                result.append("")
+    def _wrap_paragraphs_parallel(
+        self,
+        text: str,
+        length: int,
+        balanced: bool = False,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> List[str]:
+        """
+        텍스트를 문단 경계에서 조각내어 작업자 풀에서 나눈 뒤 순서대로 반환합니다.
+        checkpoint가 있으면 조각 결과를 받을 때마다 확인하며, 취소되면 남은 조각은 버립니다.
 
-        return result
+        Returns:
+            List[str]: 조각별 결과 (줄을 개행으로 이은 문자열). 개행으로 이으면 전체 결과가 됩니다.
+        """
+        if self._executor is None:
+            self._executor = create_executor(self.workers)
+        chunks = split_at_paragraphs(text, self.workers * CHUNKS_PER_WORKER)
+        results = self._executor.map(
+            wrap_paragraph_chunk,
+            chunks,
+            [length] * len(chunks),
+            [balanced] * len(chunks),
+        )
+        if checkpoint is None:
+            return list(results)
+
+        wrapped = []
+        position = 0
+        for chunk, result in zip(chunks, results):
+            position += len(chunk)
+            # 취소되면 map의 결과 반복자가 닫히며 아직 시작하지 않은 조각을 취소함
+            checkpoint(position)
+            wrapped.append(result)
+        return wrapped
+
+    def _split_missed_paragraphs(
+        self,
+        text: str,
+        length: int,
+        balanced: bool = False,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> Lines:
+        """캐시에 없는 문단들을 빈 행을 문단 경계로 보존하며 나눕니다."""
+        wrap = self._wrap_balanced if balanced else self._wrap_spans
+        return wrap(
+            text,
+            length,
+            count_all_chars,
+            self._split_long_word_by_all_chars,
+            paragraphs=True,
+            checkpoint=checkpoint,
+        )
 
     def _split_long_word_by_all_chars(self, word: str, max_length: int) -> List[str]:
         """긴 단어를 모든 문자 기준으로 강제 분할합니다."""
@@ -366,49 +1405,111 @@ class TextProcessor:
 
         return result if result else [word]
 
-    def separate_sentences_by_period(self, text: str) -> str:
+    def _split_long_word_by_display_width(
+        self, word: str, max_length: int
+    ) -> List[str]:
+        """긴 단어를 표시 폭 기준으로 강제 분할합니다. (폭 없는 문자는 앞 글자에 붙임)"""
+        if not word:
+            return []
+
+        result = []
+        current_part = ""
+        current_width = 0
+
+        for char in word:
+            width = char_width(char)
+
+            if current_width + width <= max_length:
+                current_part += char
+                current_width += width
+            else:
+                if current_part:
+                    result.append(current_part)
+                current_part = char
+                current_width = width
+
+        if current_part:
+            result.append(current_part)
+
+        return result if result else [word]
+
+    def separate_sentences_by_period(
+        self,
+        text: str,
+        progress: Optional[ProgressCallback] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> str:
         """
         마침표 기준 문장 분리 (마침표 뒤에 빈 행 추가하고 공백 정리)
 
         Args:
             text (str): 분리할 텍스트
+            progress (Optional[ProgressCallback]): 진행 상황 콜백 (처리한 문자 수, 전체 문자 수)
+            token (Optional[CancellationToken]): 취소 토큰 (구간마다 확인)
 
         Returns:
             str: 마침표로 분리되고 공백이 정리된 텍스트
+
+        Raises:
+            OperationCancelled: 처리 중 취소가 요청된 경우
+        """
+        checkpoint = checkpoint_for(len(text), progress, token)
+        result = self._separate(text, checkpoint, 1.0)
+        if checkpoint is not None:
+            checkpoint.finish()
+        return result
+
+    def _separate(
+        self,
+        text: str,
+        checkpoint: Optional[Checkpoint] = None,
+        end: float = _PROGRESS_SEPARATED,
+    ) -> str:
+        """
+        separate_sentences_by_period 본체
+        공백 정리와 빈 행 넣기에 전체 진행량의 [0, end) 비율을 절반씩 배정합니다.
         """
         if not text.strip():
             return ""
+        normalized = self.normalize_whitespace(
+            text, _stage(checkpoint, 0.0, end / 2, len(text))
+        )
+        return self._split_at_periods(
+            normalized, _stage(checkpoint, end / 2, end, len(normalized))
+        )
+
+    def normalize_whitespace(
+        self, text: str, checkpoint: Optional[Checkpoint] = None
+    ) -> str:
+        """
+        보이지 않는 문자를 지우고 연속된 공백(개행 포함)을 한 칸으로 정리합니다.
+        (separate_sentences_by_period의 첫 단계, 앞뒤 공백은 한 칸으로 남김)
 
-        # 보이지 않는 문자들 제거 (Zero-Width Space 등)
-        invisible_chars = [
-            "\u200b",  # Zero Width Space
-            "\u200c",  # Zero Width Non-Joiner
-            "\u200d",  # Zero Width Joiner
-            "\u200e",  # Left-to-Right Mark
-            "\u200f",  # Right-to-Left Mark
-            "\ufeff",  # Zero Width No-Break Space
-            "\u2060",  # Word Joiner
-        ]
-
-        for char in invisible_chars:
-            text = text.replace(char, "")
-
-        # 마침표가 나오기 전까지의 개행을 공백으로 변경
-        # 마침표 앞의 개행들을 공백으로 치환
-        text = re.sub(r"\n+(?=[^.]*\.)", " ", text)
-
-        # 연속된 공백을 하나로 정리
-        text = re.sub(r"\s+", " ", text)
+        Args:
+            text (str): 정리할 텍스트
+            checkpoint (Optional[Checkpoint]): 구간마다 취소 확인과 진행 상황 보고
 
-        # 마침표 뒤에 공백이나 줄바꿈이 있는 경우 빈 행 추가
-        pattern = r"(\.)(\s+)"
-        result = re.sub(pattern, r"\1\n\n", text)
+        Returns:
+            str: 공백이 정리된 텍스트
+        """
+        # 보이지 않는 문자들 제거 (Zero-Width Space 등)
+        text = self._strip_invisible(text)
 
-        # 마침표 뒤에 바로 문자가 오는 경우도 처리
-        pattern2 = r"(\.)([^\s\n])"
-        result = re.sub(pattern2, r"\1\n\n\2", result)
+        # 연속된 공백(개행 포함)을 하나로 정리
+        # 예전의 "마침표 앞 개행을 공백으로" 치환(\n+(?=[^.]*\.))은 이 단계에 포함되며,
+        # 개행마다 다음 마침표까지 다시 훑어 마침표 없는 긴 텍스트에서 제곱 시간이 걸렸습니다.
+        # (iter_format도 같은 규칙을 청크 구간마다 적용)
+        return "".join(_normalize_windows(_checked_windows(text, checkpoint)))
 
-        # 빈 행 뒤의 앞쪽 공백 제거
-        result = re.sub(r"\n\n\s+", "\n\n", result)
+    def _strip_invisible(self, text: str) -> str:
+        """보이지 않는 문자들을 제거합니다. (계측 구간으로 쓰기 위한 메서드)"""
+        return _remove_invisible_chars(text)
 
-        return result
+    def _split_at_periods(
+        self, text: str, checkpoint: Optional[Checkpoint] = None
+    ) -> str:
+        """
+        공백이 정리된 텍스트의 마침표 뒤에 빈 행을 넣습니다.
+        (separate_sentences_by_period의 둘째 단계, 구간마다 취소 확인과 진행 상황 보고)
+        """
+        return "".join(_split_windows_at_periods(_checked_windows(text, checkpoint)))
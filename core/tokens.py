@@ -0,0 +1,97 @@
+"""
+구간별 단어 정보 캐시
+텍스트를 한 번만 단어로 나누고 문자 수를 세어 두었다가(count_blocks), 줄 길이를 바꿔 가며 여러 번 나눌 때 재사용합니다.
+줄 배치는 wrap_spans / wrap_balanced와 같은 엔진(place_greedy, place_balanced)이 맡습니다.
+"""
+
+from typing import Callable, List, Optional
+
+from core.balanced import place_balanced
+from core.cancellation import Checkpoint
+from core.wrapping import Lines, WrapStats, count_blocks, place_greedy
+
+
+class Tokens:
+    """
+    원문과 구간별 단어 길이/무게(문자 수)
+    wrap(length)의 결과는 같은 규칙의 wrap_spans / wrap_balanced 결과와 같습니다.
+    """
+
+    __slots__ = (
+        "text",
+        "count",
+        "split_long_word",
+        "paragraphs",
+        "_blocks",
+        "_totals",
+    )
+
+    def __init__(
+        self,
+        text: str,
+        count: Callable[[str], int],
+        split_long_word: Callable[[str, int], List[str]],
+        paragraphs: bool = False,
+        checkpoint: Optional[Checkpoint] = None,
+    ):
+        """
+        Args:
+            text (str): 나눌 텍스트
+            count (Callable[[str], int]): 단어의 문자 수를 세는 함수
+            split_long_word (Callable[[str, int], List[str]]): 긴 단어 강제 분할 함수
+            paragraphs (bool): 빈 행(\\n\\n)을 문단 경계로 보존할지 여부
+            checkpoint (Optional[Checkpoint]): 구간마다 취소 확인과 진행 상황 보고
+        """
+        self.text = text
+        self.count = count
+        self.split_long_word = split_long_word
+        self.paragraphs = paragraphs
+
+        # 원문에 따라 정해지는 카운팅 방식별 문자 수 (줄 길이마다 다시 세지 않도록 한 번만 셈)
+        totals = WrapStats()
+        blocks = []
+        for block in count_blocks(text, count, totals):
+            if checkpoint is not None:
+                checkpoint(block.position)
+            blocks.append(block)
+        self._blocks = blocks
+        self._totals = totals
+
+    def __len__(self) -> int:
+        return sum(len(block.lengths) for block in self._blocks)
+
+    def wrap(
+        self,
+        length: int,
+        balanced: bool = False,
+        stats: Optional[WrapStats] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> Lines:
+        """
+        한 줄당 최대 문자 수에 맞춰 나눕니다.
+
+        Args:
+            length (int): 한 줄당 최대 문자 수 (공백 제외)
+            balanced (bool): 균형 배치 여부 (False: 탐욕적 배치)
+            stats (Optional[WrapStats]): 지정하면 나누는 중에 통계를 채움
+            checkpoint (Optional[Checkpoint]): 구간마다 취소 확인과 진행 상황 보고
+
+        Returns:
+            Lines: 원문 위의 줄 구간 목록
+        """
+        if stats is not None:
+            totals = self._totals
+            stats.all_chars += totals.all_chars
+            stats.all_chars_with_period += totals.all_chars_with_period
+            stats.korean_chars += totals.korean_chars
+        place = place_balanced if balanced else place_greedy
+        return place(
+            self.text,
+            self._blocks,
+            length,
+            self.count,
+            self.split_long_word,
+            self.paragraphs,
+            stats,
+            checkpoint,
+        )
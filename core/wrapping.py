@@ -0,0 +1,443 @@
+"""
+구간(span) 기반 줄 나누기 엔진
+줄을 문자열로 만들지 않고 원문 안의 (시작, 끝) 위치로만 기록해 두었다가,
+줄에 접근할 때 원문을 잘라 돌려줍니다.
+"""
+
+import re
+from array import array
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from core.cancellation import Checkpoint
+from utils.text_counter import (
+    count_all_chars,
+    count_all_chars_with_period,
+    count_korean,
+    count_many,
+)
+
+
+# 연속된 공백문자 (str.split()과 같은 공백 기준)
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+# 단어 바로 뒤의 공백 위치 (구간 경계)
+_WORD_END = re.compile(r"(?<=\S)\s")
+
+# 한 번에 단어 목록으로 만드는 구간 크기 (문자 수)
+BLOCK_SIZE = 1 << 16
+
+
+def _whitespace_runs(window: str, lengths: List[int]) -> List[str]:
+    """
+    구간 안의 연속된 공백문자 목록을 반환합니다. (_WHITESPACE_RUN.findall과 같은 결과)
+    공백이 모두 " " 또는 "\n\n" 한 묶음씩인 흔한 경우는 정규식 없이 개수 세기만으로 만듭니다.
+    """
+    whitespace = len(window) - sum(lengths)
+    spaces = window.count(" ")
+    pairs = window.count("\n\n")
+    runs = spaces + pairs
+    edges = window[:1].isspace() + window[-1:].isspace()
+    if (
+        spaces + 2 * pairs != whitespace
+        or runs != len(lengths) - 1 + edges
+        or window.count("\n") != 2 * pairs
+    ):
+        return _WHITESPACE_RUN.findall(window)
+
+    # 공백 묶음 수가 단어 사이 수와 같으므로 묶음마다 " " 한 칸 또는 "\n\n"
+    result = [" "] * runs
+    position = window.find("\n\n")
+    previous = 0
+    index = 0
+    while position != -1:
+        index += window.count(" ", previous, position)
+        result[index] = "\n\n"
+        index += 1
+        previous = position + 2
+        position = window.find("\n\n", previous)
+    return result
+
+
+def iter_windows(text: str) -> Iterator[Tuple[int, str]]:
+    """
+    텍스트를 단어 끝 위치에서 끊어 BLOCK_SIZE 안팎의 구간으로 나눕니다.
+    구간 경계는 항상 단어 바로 뒤이므로 단어 사이 공백은 다음 구간의 맨 앞에 온전히 들어갑니다.
+
+    Returns:
+        Iterator[Tuple[int, str]]: (구간 시작 위치, 구간 문자열)
+    """
+    text_length = len(text)
+    start = 0
+    while start < text_length:
+        end = start + BLOCK_SIZE
+        match = _WORD_END.search(text, end) if end < text_length else None
+        end = match.start() if match else text_length
+        yield start, text[start:end]
+        start = end
+
+
+def iter_blocks(text: str) -> Iterator[Tuple[int, List[str], List[str]]]:
+    """
+    iter_windows의 구간마다 단어와 단어 앞 공백을 나눕니다.
+    단어 목록은 한 번에 한 구간만 만들므로 텍스트 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Returns:
+        Iterator[Tuple[int, List[str], List[str]]]:
+            (구간 시작 위치, 단어 목록, 단어 앞 공백 목록)
+            공백 목록은 단어보다 하나 많을 수 있으며, 마지막 항목은 구간 끝의 공백입니다.
+    """
+    for start, window in iter_windows(text):
+        words = window.split()
+        gaps = _whitespace_runs(window, list(map(len, words)))
+        if not window[:1].isspace():
+            gaps.insert(0, "")
+        yield start, words, gaps
+
+
+class WrapStats:
+    """
+    줄을 나누면서 함께 모으는 통계 (wrap_spans 등에 넘기면 채워짐)
+    줄별 문자 수는 나눌 때 쓴 카운팅 방식 기준이며 빈 행은 기록하지 않습니다.
+    """
+
+    __slots__ = (
+        "line_counts",
+        "forced_splits",
+        "paragraphs",
+        "all_chars",
+        "all_chars_with_period",
+        "korean_chars",
+    )
+
+    def __init__(self):
+        self.line_counts = array("q")
+        self.forced_splits = 0  # 줄 길이보다 길어 강제로 나눈 단어 수
+        self.paragraphs = 0  # 단어가 있는 문단 수
+        self.all_chars = 0
+        self.all_chars_with_period = 0
+        self.korean_chars = 0
+
+    def add_words(self, words: List[str]) -> None:
+        """
+        단어들의 카운팅 방식별 문자 수를 더합니다.
+        공백은 어느 방식에서도 세지 않으므로 단어만 이어 한 번에 셉니다.
+        """
+        joined = "".join(words)
+        self.all_chars += count_all_chars(joined)
+        self.all_chars_with_period += count_all_chars_with_period(joined)
+        self.korean_chars += count_korean(joined)
+
+    @property
+    def longest(self) -> int:
+        """가장 긴 줄의 문자 수 (줄이 없으면 0)"""
+        return max(self.line_counts, default=0)
+
+    @property
+    def shortest(self) -> int:
+        """가장 짧은 줄의 문자 수 (줄이 없으면 0)"""
+        return min(self.line_counts, default=0)
+
+
+class Lines(Sequence[str]):
+    """
+    원문과 줄 경계 배열만 들고 있는 지연 줄 목록
+    단어 사이 공백이 한 칸(" ")인 줄은 원문을 그대로 잘라내고,
+    개행 등 다른 공백이 섞인 줄만 접근할 때 한 칸 공백으로 정리합니다.
+    """
+
+    __slots__ = ("_source", "_starts", "_ends", "_joins")
+
+    def __init__(self, source: str, starts: array, ends: array, joins: bytearray):
+        self._source = source
+        self._starts = starts
+        self._ends = ends
+        self._joins = joins
+
+    @classmethod
+    def empty(cls) -> "Lines":
+        """빈 줄 목록을 생성합니다."""
+        return cls("", array("q"), array("q"), bytearray())
+
+    @classmethod
+    def from_text(cls, text: str) -> "Lines":
+        """
+        줄을 개행으로 이어 붙인 결과 문자열을 줄마다 잘라 보는 줄 목록을 만듭니다.
+        (단어가 있는 결과는 줄이 하나 이상이므로 빈 문자열은 빈 목록으로 봄)
+        """
+        if not text:
+            return cls.empty()
+        breaks = [match.start() for match in re.finditer("\n", text)]
+        starts = array("q", [0])
+        starts.extend(position + 1 for position in breaks)
+        ends = array("q", breaks)
+        ends.append(len(text))
+        return cls(text, starts, ends, bytearray(len(starts)))
+
+    def _line(self, index: int) -> str:
+        line = self._source[self._starts[index] : self._ends[index]]
+        if self._joins[index]:
+            return " ".join(line.split())
+        return line
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self._line(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("줄 번호가 범위를 벗어났습니다")
+        return self._line(index)
+
+    def __iter__(self) -> Iterator[str]:
+        source = self._source
+        for start, end, join in zip(self._starts, self._ends, self._joins):
+            if join:
+                yield " ".join(source[start:end].split())
+            else:
+                yield source[start:end]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Lines, list, tuple)):
+            return len(self) == len(other) and all(
+                line == other_line for line, other_line in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Lines({len(self)} lines)"
+
+    def spans(self) -> Iterator[Tuple[int, int]]:
+        """각 줄의 원문 내 (시작, 끝) 위치를 반환합니다."""
+        return zip(self._starts, self._ends)
+
+    def join(self, separator: str = "\n") -> str:
+        """모든 줄을 구분자로 이어 붙입니다."""
+        return separator.join(self)
+
+
+class Block(NamedTuple):
+    """줄 나누기 엔진(place_greedy, place_balanced)이 쓰는 구간 하나의 단어 정보 (count_blocks가 만듦)"""
+
+    position: int  # 구간 시작 위치
+    lengths: List[int]  # 단어 길이
+    counts: List[int]  # 단어 문자 수 (카운팅 방식 기준)
+    gaps: List[str]  # 단어 앞 공백 (iter_blocks와 같음)
+
+
+def count_blocks(
+    text: str, count: Callable[[str], int], stats: Optional[WrapStats] = None
+) -> Iterator[Block]:
+    """
+    iter_blocks의 구간마다 단어 길이와 문자 수를 구합니다.
+    단어 문자열 대신 길이만 남기므로, 모아 두어도 단어 수만큼 문자열 객체가 생기지 않습니다.
+
+    Args:
+        text (str): 나눌 텍스트
+        count (Callable[[str], int]): 단어의 문자 수를 세는 함수
+        stats (Optional[WrapStats]): 지정하면 카운팅 방식별 문자 수를 더함
+
+    Returns:
+        Iterator[Block]: 구간별 단어 정보
+    """
+    for position, words, gaps in iter_blocks(text):
+        if stats is not None:
+            stats.add_words(words)
+        yield Block(position, list(map(len, words)), count_many(words, count), gaps)
+
+
+def place_greedy(
+    text: str,
+    blocks: Iterable[Block],
+    length: int,
+    count: Callable[[str], int],
+    split_long_word: Callable[[str, int], List[str]],
+    paragraphs: bool = False,
+    stats: Optional[WrapStats] = None,
+    checkpoint: Optional[Checkpoint] = None,
+) -> Lines:
+    """
+    구간별 단어 정보로 줄 나눌 위치를 탐욕적으로 정합니다. (wrap_spans와 Tokens.wrap의 엔진)
+    단어를 한 번씩만 훑으며 줄마다 원문 위치만 기록하고, 줄은 구간 경계를 넘어 이어질 수 있습니다.
+
+    Args:
+        text (str): 나눌 텍스트 (blocks를 만든 원문)
+        blocks (Iterable[Block]): count_blocks로 만든 구간별 단어 정보
+        length (int): 한 줄당 최대 문자 수 (공백 제외)
+        count (Callable[[str], int]): 단어의 문자 수를 세는 함수 (강제 분할한 조각에 사용)
+        split_long_word (Callable[[str, int], List[str]]): 긴 단어 강제 분할 함수
+        paragraphs (bool): 빈 행(\\n\\n)을 문단 경계로 보존할지 여부
+        stats (Optional[WrapStats]): 지정하면 줄별 문자 수, 강제 분할 수, 문단 수를 채움
+        checkpoint (Optional[Checkpoint]): 구간마다 취소 확인과 진행 상황 보고
+
+    Returns:
+        Lines: 원문 위의 줄 구간 목록 (문단 경계는 빈 줄, 단어가 없으면 빈 목록)
+    """
+    line_starts = array("q")
+    line_ends = array("q")
+    line_joins = bytearray()
+    add_start = line_starts.append
+    add_end = line_ends.append
+    add_join = line_joins.append
+
+    line_start = line_end = 0
+    line_count = 0
+    line_join = False
+    has_line = False
+    seen_break = False
+    # 통계를 모을 때만 줄별 문자 수 기록 (줄을 내보낼 때마다 확인하는 비용만 듦)
+    add_count = stats.line_counts.append if stats is not None else None
+
+    for position, word_lengths, word_counts, gaps in blocks:
+        if checkpoint is not None:
+            checkpoint(position)
+        for word_length, word_count, gap in zip(word_lengths, word_counts, gaps):
+            if gap == " ":
+                position += 1
+            else:
+                position += len(gap)
+                if paragraphs and "\n\n" in gap:
+                    # 문단 경계: 현재 줄을 내보내고 경계 수만큼 빈 행 추가
+                    if has_line:
+                        add_start(line_start)
+                        add_end(line_end)
+                        add_join(line_join)
+                        if add_count:
+                            add_count(line_count)
+                            stats.paragraphs += 1
+                        has_line = False
+                    for _ in range(gap.count("\n\n")):
+                        add_start(position)
+                        add_end(position)
+                        add_join(False)
+                    seen_break = True
+                elif has_line:
+                    # 개행 등 " "가 아닌 공백은 줄에 접근할 때 한 칸으로 정리
+                    line_join = True
+
+            word_start = position
+            position += word_length
+
+            if has_line and line_count + word_count <= length:
+                line_end = position
+                line_count += word_count
+                continue
+
+            if has_line:
+                # 새로운 줄 시작
+                add_start(line_start)
+                add_end(line_end)
+                add_join(line_join)
+                if add_count:
+                    add_count(line_count)
+
+            if word_count > length:
+                # 단어 자체가 길이 제한을 초과하는 경우 강제로 분할
+                split_word = split_long_word(text[word_start:position], length)
+                for part in split_word[:-1]:
+                    add_start(word_start)
+                    word_start += len(part)
+                    add_end(word_start)
+                    add_join(False)
+                    if add_count:
+                        add_count(count(part))
+                if stats is not None:
+                    stats.forced_splits += 1
+                line_count = count(split_word[-1])
+            else:
+                line_count = word_count
+            line_start = word_start
+            line_end = position
+            line_join = False
+            has_line = True
+
+        if paragraphs and len(gaps) > len(word_lengths) and "\n\n" in gaps[-1]:
+            # 텍스트 끝의 문단 경계 (구간 끝 공백은 텍스트 끝에만 남음)
+            if has_line:
+                add_start(line_start)
+                add_end(line_end)
+                add_join(line_join)
+                if add_count:
+                    add_count(line_count)
+                    stats.paragraphs += 1
+                has_line = False
+            for _ in range(gaps[-1].count("\n\n")):
+                add_start(len(text))
+                add_end(len(text))
+                add_join(False)
+            seen_break = True
+
+    # 마지막 줄 추가
+    if has_line:
+        add_start(line_start)
+        add_end(line_end)
+        add_join(line_join)
+        if add_count:
+            add_count(line_count)
+            stats.paragraphs += 1
+    elif seen_break:
+        # 마지막 문단이 비어 있으면 빈 행으로 보존
+        add_start(len(text))
+        add_end(len(text))
+        add_join(False)
+
+    return Lines(text, line_starts, line_ends, line_joins)
+
+
+def wrap_spans(
+    text: str,
+    length: int,
+    count: Callable[[str], int],
+    split_long_word: Callable[[str, int], List[str]],
+    paragraphs: bool = False,
+    stats: Optional[WrapStats] = None,
+    checkpoint: Optional[Checkpoint] = None,
+) -> Lines:
+    """
+    텍스트를 줄 길이에 맞춰 나눌 위치를 찾습니다. (탐욕적 배치)
+
+    텍스트를 일정 크기 구간으로 나눠 구간 단위로 단어 목록과 문자 수를 한꺼번에 구한 뒤(count_blocks),
+    place_greedy로 단어를 한 번씩만 훑으며 줄마다 원문 위치만 기록합니다.
+    줄 문자열을 이어 붙이지 않으므로 처리 중 메모리가 원문 크기에 비례해 늘지 않습니다.
+
+    Args:
+        text (str): 나눌 텍스트
+        length (int): 한 줄당 최대 문자 수 (공백 제외)
+        count (Callable[[str], int]): 단어의 문자 수를 세는 함수
+        split_long_word (Callable[[str, int], List[str]]): 긴 단어 강제 분할 함수
+        paragraphs (bool): 빈 행(\\n\\n)을 문단 경계로 보존할지 여부
+        stats (Optional[WrapStats]): 지정하면 나누는 중에 통계를 채움
+        checkpoint (Optional[Checkpoint]): 구간마다 취소 확인과 진행 상황 보고
+
+    Returns:
+        Lines: 원문 위의 줄 구간 목록 (문단 경계는 빈 줄, 단어가 없으면 빈 목록)
+    """
+    return place_greedy(
+        text,
+        count_blocks(text, count, stats),
+        length,
+        count,
+        split_long_word,
+        paragraphs,
+        stats,
+        checkpoint,
+    )
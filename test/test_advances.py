@@ -0,0 +1,89 @@
+from collections import Counter
+
+import pytest
+
+from core.advances import ADVANCE_UNITS, AdvanceTable
+from core.cache import ResultCache
+from core.text_processor import COUNTING_PIXELS, TextProcessor
+
+
+def fake_advance(char: str) -> float:
+    """한글 12.5px, 공백 3.25px, 그 밖 6.75px인 가짜 글꼴"""
+    if "가" <= char <= "힣":
+        return 12.5
+    if char == " ":
+        return 3.25
+    return 6.75
+
+
+class TestAdvanceTable:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.measured = Counter()
+
+        def measure(char):
+            self.measured[char] += 1
+            return fake_advance(char)
+
+        self.table = AdvanceTable(measure, key="fake")
+        self.processor = TextProcessor()
+
+    def pixel_width(self, line: str) -> float:
+        return sum(map(fake_advance, line))
+
+    def test_measures_each_char_once(self):
+        """문자마다 한 번만 재는지 테스트"""
+        assert self.table.width("안녕 안녕 hello") == self.table.width(
+            "안녕 안녕 hello"
+        )
+        assert self.table.measure_missing("안녕하세요 hello") == 3
+        assert set(self.measured.values()) == {1}
+        assert len(self.table) == len(set("안녕하세요 hello"))
+
+    def test_fixed_point_units(self):
+        """전진 폭을 1/64픽셀 단위 정수로 세는지 테스트"""
+        assert self.table.advance("가") == 12.5 * ADVANCE_UNITS
+        assert self.table.count("가a") == (12.5 + 6.75 + 3.25) * ADVANCE_UNITS
+        assert self.table.length_for(100) == (100 + 3.25) * ADVANCE_UNITS
+
+    def test_split_long_word(self):
+        """긴 단어 조각이 줄 폭을 넘지 않고 원래 단어를 이루는지 테스트"""
+        word = "가나다라마바사아자차카타파하"
+        parts = self.table.split_long_word(word, self.table.length_for(40))
+
+        assert "".join(parts) == word
+        assert [len(part) for part in parts] == [3] * 4 + [2]
+        assert self.table.split_long_word("가", self.table.length_for(1)) == ["가"]
+
+    @pytest.mark.parametrize("balanced", [False, True])
+    def test_lines_fit_pixel_width(self, balanced):
+        """픽셀 폭 계획의 줄이 공백까지 포함해 줄 폭을 넘지 않는지 테스트"""
+        text = (
+            "안녕하세요. 저는 개발자입니다. Hello world, 긴단어가나다라마바사아자 끝. "
+            * 5
+        )
+        plan = self.processor.compile(
+            100, COUNTING_PIXELS, balanced=balanced, advances=self.table
+        )
+        lines = plan.format(text).split("\n")
+
+        assert all(self.pixel_width(line) <= 100 for line in lines)
+        assert any(self.pixel_width(line) > 90 for line in lines)
+        assert set(self.measured.values()) == {1}
+
+    def test_requires_table(self):
+        """픽셀 폭 카운팅에 전진 폭 표가 없으면 ValueError를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            self.processor.compile(100, COUNTING_PIXELS)
+
+    def test_cache_key_includes_font(self):
+        """같은 픽셀 폭이라도 글꼴이 다르면 결과 캐시를 함께 쓰지 않는지 테스트"""
+        processor = TextProcessor(result_cache=ResultCache())
+        narrow = AdvanceTable(lambda char: 4.0, key="narrow")
+        text = "안녕하세요 저는 개발자입니다"
+
+        wide = processor.compile(60, COUNTING_PIXELS, advances=self.table)
+        narrow_plan = processor.compile(60, COUNTING_PIXELS, advances=narrow)
+
+        assert wide.format(text) != narrow_plan.format(text)
+        assert processor.result_cache.stats.hits == 0
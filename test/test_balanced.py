@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+from core.balanced import balanced_breaks, wrap_balanced
+from core.cache import ParagraphCache, ResultCache
+from core.text_processor import TextProcessor
+from core.wrapping import wrap_spans
+from utils.text_counter import count_all_chars
+
+
+def _naive_cost(counts, length):
+    """모든 줄 시작을 비교하는 제곱 시간 동적 계획법 (검증용)"""
+    prefix = [0]
+    for count in counts:
+        prefix.append(prefix[-1] + count)
+    best = [0] + [float("inf")] * len(counts)
+    for end in range(1, len(counts) + 1):
+        for begin in range(end):
+            width = prefix[end] - prefix[begin]
+            if width <= length:
+                best[end] = min(best[end], best[begin] + (length - width) ** 2)
+    return best[-1]
+
+
+def _cost(counts, breaks, length):
+    total = 0
+    begin = 0
+    for end in breaks:
+        width = sum(counts[begin:end])
+        assert width <= length
+        total += (length - width) ** 2
+        begin = end
+    return total
+
+
+class TestBalanced:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+
+    def _wrap(self, wrap, text, length, paragraphs=False):
+        return list(
+            wrap(
+                text,
+                length,
+                count_all_chars,
+                self.processor._split_long_word_by_all_chars,
+                paragraphs=paragraphs,
+            )
+        )
+
+    def test_breaks_empty(self):
+        """단어가 없을 때 테스트"""
+        assert balanced_breaks([], 10) == []
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_breaks_are_optimal(self, seed):
+        """제곱 시간 동적 계획법과 같은 최소 비용을 찾는지 테스트"""
+        rng = random.Random(seed)
+        length = rng.randint(1, 20)
+        counts = [rng.randint(0, min(length, 6)) for _ in range(rng.randint(1, 60))]
+
+        breaks = balanced_breaks(counts, length)
+
+        assert breaks[-1] == len(counts)
+        assert _cost(counts, breaks, length) == _naive_cost(counts, length)
+
+    def test_balanced_lines_are_even(self):
+        """탐욕적 배치보다 줄 길이가 고르게 나뉘는지 테스트"""
+        text = "aaa bb cc ddddd"
+
+        assert self._wrap(wrap_spans, text, 6) == ["aaa bb", "cc", "ddddd"]
+        assert self._wrap(wrap_balanced, text, 6) == ["aaa", "bb cc", "ddddd"]
+
+    def test_same_words_and_paragraphs_as_greedy(self):
+        """단어 순서와 문단 경계, 긴 단어 분할이 탐욕적 배치와 같은지 테스트"""
+        text = self.processor.separate_sentences_by_period(
+            "안녕하세요. 저는 개발자입니다.\n가나다라마바사아자차카타파하 abc, def! "
+            "짧은 문장. 조금 더 긴 문장이 여기에 있습니다.\n\n"
+        )
+
+        greedy = self._wrap(wrap_spans, text, 5, paragraphs=True)
+        balanced = self._wrap(wrap_balanced, text, 5, paragraphs=True)
+
+        assert [line == "" for line in greedy].count(True) == balanced.count("")
+        assert " ".join(greedy).split() == " ".join(balanced).split()
+        assert all(count_all_chars(line) <= 5 or " " not in line for line in balanced)
+
+    def test_lines_normalize_other_whitespace(self):
+        """개행 등이 섞인 줄은 한 칸 공백으로 정리되는지 테스트"""
+        assert self._wrap(wrap_balanced, "가\n나\t\t다 라", 10) == ["가 나 다 라"]
+
+    @pytest.mark.parametrize("use_all_chars", [True, False])
+    @pytest.mark.parametrize("separate_sentences", [True, False])
+    def test_format_text_with_options_balanced(self, use_all_chars, separate_sentences):
+        """균형 배치 옵션이 줄 목록 경로와 같은 결과를 내는지 테스트"""
+        text = "첫 번째 문장입니다. 두 번째 문장은 조금 더 깁니다. 세 번째!" * 3
+
+        result = self.processor.format_text_with_options(
+            text, 8, use_all_chars, separate_sentences, balanced=True
+        )
+
+        assert (
+            result
+            == self.processor.format_lines(
+                text, 8, use_all_chars, separate_sentences, balanced=True
+            ).join()
+        )
+
+    def test_balanced_with_caches(self):
+        """캐시를 쓰는 처리기에서도 균형 배치와 탐욕적 배치가 섞이지 않는지 테스트"""
+        text = "aaa bb cc ddddd. aaa bb cc ddddd."
+        cached = TextProcessor(
+            paragraph_cache=ParagraphCache(), result_cache=ResultCache()
+        )
+
+        for balanced in (False, True, False, True):
+            assert cached.format_text_with_options(
+                text, 6, balanced=balanced
+            ) == self.processor.format_text_with_options(text, 6, balanced=balanced)
+        assert cached.format_text_with_options(
+            text, 6, balanced=True
+        ) != cached.format_text_with_options(text, 6)
@@ -0,0 +1,276 @@
+import mmap
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import cli
+import core.batch as batch
+from core.batch import (
+    collect_jobs,
+    format_directory,
+    format_file,
+    iter_decoded_chunks,
+    write_atomic,
+)
+from core.cancellation import CancellationToken, OperationCancelled
+from core.text_processor import TextProcessor
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestBatch:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+
+    def _make_inputs(self, root: Path) -> dict:
+        texts = {
+            "a.txt": "안녕하세요. 저는 개발자입니다. " * 50,
+            "b.txt": "짧은 글.",
+            "sub/c.txt": "Hello World 123 안녕 " * 200,
+        }
+        for name, text in texts.items():
+            path = root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+        return texts
+
+    def test_collect_jobs_largest_first(self, tmp_path):
+        """큰 파일부터 배정되는지 테스트"""
+        self._make_inputs(tmp_path / "in")
+        jobs = collect_jobs(tmp_path / "in", tmp_path / "out")
+
+        sizes = [size for _, _, size in jobs]
+        assert sizes == sorted(sizes, reverse=True)
+        assert jobs[-1][1] == tmp_path / "out" / "b.txt"
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_format_directory_matches_processor(self, tmp_path, jobs):
+        """일괄 처리 결과가 format_text_with_options와 같은지 테스트"""
+        texts = self._make_inputs(tmp_path / "in")
+        summary = format_directory(
+            tmp_path / "in",
+            tmp_path / "out",
+            line_length=12,
+            separate_sentences=False,
+            jobs=jobs,
+        )
+
+        assert len(summary.results) == 3
+        assert not summary.failed
+        for name, text in texts.items():
+            expected = self.processor.format_text_with_options(
+                text, 12, separate_sentences=False
+            )
+            assert (tmp_path / "out" / name).read_text(encoding="utf-8") == expected
+
+    def test_format_directory_reports_failure(self, tmp_path):
+        """디코딩할 수 없는 파일은 실패로 기록되고 나머지는 처리되는지 테스트"""
+        self._make_inputs(tmp_path / "in")
+        (tmp_path / "in" / "bad.txt").write_bytes(b"\xff\xfe\xfa")
+
+        summary = format_directory(tmp_path / "in", tmp_path / "out", jobs=1)
+
+        assert [result.source.name for result in summary.failed] == ["bad.txt"]
+        assert not (tmp_path / "out" / "bad.txt").exists()
+        assert (tmp_path / "out" / "a.txt").exists()
+
+    def test_write_atomic_leaves_no_temp_files(self, tmp_path):
+        """원자적 쓰기 후 임시 파일이 남지 않는지 테스트"""
+        target = tmp_path / "out" / "result.txt"
+        written = write_atomic(target, "안녕")
+
+        assert written == len("안녕".encode("utf-8"))
+        assert target.read_text(encoding="utf-8") == "안녕"
+        assert list(target.parent.iterdir()) == [target]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX 권한 비트")
+    def test_write_atomic_follows_umask(self, tmp_path):
+        """원자적 쓰기 결과가 umask를 적용한 일반 파일 권한인지 테스트"""
+        old = os.umask(0o027)
+        try:
+            write_atomic(tmp_path / "result.txt", "안녕")
+        finally:
+            os.umask(old)
+
+        assert (tmp_path / "result.txt").stat().st_mode & 0o777 == 0o640
+
+    def test_write_atomic_syncs_before_rename(self, tmp_path, monkeypatch):
+        """이름을 바꾸기 전에 임시 파일을 디스크에 내려 쓰는지 테스트"""
+        calls = []
+        fsync = os.fsync
+        replace = os.replace
+        monkeypatch.setattr(os, "fsync", lambda fd: calls.append("fsync") or fsync(fd))
+        monkeypatch.setattr(
+            os, "replace", lambda *args: calls.append("replace") or replace(*args)
+        )
+        write_atomic(tmp_path / "result.txt", "안녕")
+
+        assert calls == ["fsync", "replace"]
+
+    def test_cli_format(self, tmp_path, capsys):
+        """format 명령 실행 테스트"""
+        self._make_inputs(tmp_path / "in")
+        exit_code = cli.main(
+            [
+                "format",
+                "--width",
+                "10",
+                "--no-sentence-split",
+                "--jobs",
+                "1",
+                str(tmp_path / "in"),
+                str(tmp_path / "out"),
+            ]
+        )
+
+        assert exit_code == 0
+        assert "3개 파일" in capsys.readouterr().out
+        assert (tmp_path / "out" / "sub" / "c.txt").exists()
+
+    @pytest.mark.parametrize("jobs", ["0", "-2", "x"])
+    def test_cli_rejects_invalid_jobs(self, tmp_path, capsys, jobs):
+        """작업 프로세스 수가 1 미만이거나 정수가 아니면 사용법 오류로 끝나는지 테스트"""
+        self._make_inputs(tmp_path / "in")
+        with pytest.raises(SystemExit) as exit_info:
+            cli.main(
+                [
+                    "format",
+                    f"--jobs={jobs}",
+                    str(tmp_path / "in"),
+                    str(tmp_path / "out"),
+                ]
+            )
+
+        assert exit_info.value.code == 2
+        assert "--jobs" in capsys.readouterr().err
+        assert not (tmp_path / "out").exists()
+
+    def test_cli_does_not_import_pyside6(self):
+        """명령줄 모드가 PySide6를 가져오지 않는지 테스트"""
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, cli; print('PySide6' in sys.modules)",
+            ],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        assert output.strip() == "False"
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "cp949"])
+    def test_iter_decoded_chunks_multibyte_boundaries(self, tmp_path, encoding):
+        """여러 바이트 문자가 조각 경계에 걸쳐도 그대로 디코딩되는지 테스트"""
+        text = "가나다 abc 한글 텍스트입니다.\n" * 2000
+        path = tmp_path / "input.txt"
+        path.write_bytes(text.encode(encoding))
+
+        chunks = list(iter_decoded_chunks(path, encoding, mmap.PAGESIZE))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == text
+
+    def test_iter_decoded_chunks_empty_file(self, tmp_path):
+        """빈 파일 테스트"""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert list(iter_decoded_chunks(path)) == []
+
+    def test_iter_decoded_chunks_invalid_chunk_size(self, tmp_path):
+        """페이지 크기 배수가 아닌 조각 크기 테스트"""
+        path = tmp_path / "input.txt"
+        path.write_bytes(b"abc")
+        with pytest.raises(ValueError):
+            list(iter_decoded_chunks(path, chunk_bytes=mmap.PAGESIZE + 1))
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "cp949"])
+    @pytest.mark.parametrize("separate_sentences", [True, False])
+    def test_format_file_matches_processor(
+        self, tmp_path, monkeypatch, encoding, separate_sentences
+    ):
+        """스트리밍 파일 처리 결과가 전체를 읽어 처리한 것과 같은지 테스트"""
+        monkeypatch.setattr(batch, "DECODE_CHUNK_BYTES", mmap.PAGESIZE)
+        monkeypatch.setattr(batch, "WRITE_BATCH_LINES", 7)
+        text = "안녕하세요. 저는 개발자입니다.\r\n반갑습니다. Hello World " * 500
+        source = tmp_path / "input.txt"
+        source.write_bytes(text.encode(encoding))
+
+        written = format_file(
+            source,
+            tmp_path / "out" / "result.txt",
+            line_length=12,
+            separate_sentences=separate_sentences,
+            encoding=encoding,
+        )
+
+        expected = self.processor.format_text_with_options(
+            source.read_text(encoding=encoding), 12, True, separate_sentences
+        ).encode(encoding)
+        assert (tmp_path / "out" / "result.txt").read_bytes() == expected
+        assert written == len(expected)
+
+    def test_format_directory_streams_large_files(self, tmp_path, monkeypatch):
+        """큰 파일은 스트리밍 경로로 처리해도 결과가 같은지 테스트"""
+        monkeypatch.setattr(batch, "STREAMING_MIN_BYTES", 0)
+        texts = self._make_inputs(tmp_path / "in")
+        summary = format_directory(tmp_path / "in", tmp_path / "out", jobs=1)
+
+        assert not summary.failed
+        for name, text in texts.items():
+            expected = self.processor.format_text_with_options(text, 18)
+            assert (tmp_path / "out" / name).read_text(encoding="utf-8") == expected
+
+    def test_format_file_progress_and_cancel(self, tmp_path, monkeypatch):
+        """파일 처리 진행 상황을 바이트 단위로 알리고, 취소하면 출력 파일을 남기지 않는지 테스트"""
+        monkeypatch.setattr(batch, "DECODE_CHUNK_BYTES", mmap.PAGESIZE)
+        source = tmp_path / "input.txt"
+        source.write_text("안녕하세요. 저는 개발자입니다. " * 2000, encoding="utf-8")
+        size = source.stat().st_size
+        reports = []
+        format_file(
+            source, tmp_path / "done.txt", progress=lambda *args: reports.append(args)
+        )
+
+        assert reports[-1] == (size, size)
+        assert [done for done, _ in reports] == sorted(done for done, _ in reports)
+
+        token = CancellationToken()
+        with pytest.raises(OperationCancelled):
+            format_file(
+                source,
+                tmp_path / "cancelled.txt",
+                progress=lambda done, total: token.cancel(),
+                token=token,
+            )
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "done.txt",
+            "input.txt",
+        ]
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_format_directory_cancelled(self, tmp_path, jobs):
+        """취소된 토큰으로 일괄 처리하면 OperationCancelled가 발생하는지 테스트"""
+        self._make_inputs(tmp_path / "in")
+        token = CancellationToken()
+        token.cancel()
+
+        with pytest.raises(OperationCancelled):
+            format_directory(tmp_path / "in", tmp_path / "out", jobs=jobs, token=token)
+
+    def test_cli_timeout(self, tmp_path, capsys):
+        """제한 시간을 넘으면 중단 메시지와 함께 실패 코드를 반환하는지 테스트"""
+        self._make_inputs(tmp_path / "in")
+        code = cli.main(
+            ["format", str(tmp_path / "in"), str(tmp_path / "out"), "--timeout", "0"]
+        )
+
+        assert code == 1
+        assert "제한 시간" in capsys.readouterr().err
@@ -0,0 +1,153 @@
+import json
+
+import pytest
+
+from benchmarks.corpus import (
+    format_size,
+    generate_corpus,
+    generate_line_list,
+    parse_size,
+)
+from benchmarks.bench_startup import QT_FREE_MODULES, measure_import
+from benchmarks.bench_startup import compare as compare_startup
+from benchmarks.suite import build_cases, compare, percentile, run_suite
+
+
+class TestCorpus:
+    def test_parse_size(self):
+        """크기 표기 변환 테스트"""
+        assert parse_size("512") == 512
+        assert parse_size("1KB") == 1024
+        assert parse_size("10mb") == 10 * 1024**2
+        assert parse_size("1.5K") == 1536
+
+    def test_parse_size_invalid(self):
+        """잘못된 크기 표기 테스트"""
+        with pytest.raises(ValueError):
+            parse_size("ten megabytes")
+
+    def test_format_size(self):
+        """크기 표기 테스트"""
+        assert format_size(1024) == "1KB"
+        assert format_size(100 * 1024**2) == "100MB"
+        assert format_size(1000) == "1000B"
+
+    def test_generate_corpus_deterministic(self):
+        """같은 시드로 같은 말뭉치가 생성되는지 테스트"""
+        first = generate_corpus(4096, seed=3)
+        assert first == generate_corpus(4096, seed=3)
+        assert first != generate_corpus(4096, seed=4)
+        assert len(first.encode("utf-8")) <= 4096
+        assert len(first.encode("utf-8")) > 4000
+
+    def test_generate_corpus_mixed_content(self):
+        """한글, 영문, 마침표, 빈 행이 섞여 있는지 테스트"""
+        text = generate_corpus(16 * 1024)
+        assert any("가" <= char <= "힣" for char in text)
+        assert any(char.isascii() and char.isalpha() for char in text)
+        assert "." in text
+        assert "\n\n" in text
+
+    def test_generate_line_list_has_no_period(self):
+        """줄 목록 텍스트에 마침표 없이 개행만 있는지 테스트"""
+        text = generate_line_list(8 * 1024, seed=1)
+        assert text == generate_line_list(8 * 1024, seed=1)
+        assert "." not in text
+        assert text.count("\n") > 100
+
+
+class TestSuite:
+    def test_build_cases_cover_entry_points(self):
+        """모든 옵션 조합과 카운터가 측정 항목에 들어 있는지 테스트"""
+        names = {case.name for case in build_cases()}
+
+        assert sum(name.startswith("format_text_with_options[") for name in names) == 8
+        assert sum(name.endswith(",balanced=True]") for name in names) == 4
+        for name in (
+            "FormatPlan.format",
+            "split_by_korean_count",
+            "split_by_all_chars_simple",
+            "split_by_all_chars",
+            "split_by_display_width",
+            "separate_sentences_by_period",
+            "count_all_chars",
+            "count_all_chars_with_period",
+            "count_visible_chars",
+            "count_korean",
+            "count_display_width",
+        ):
+            assert name in names
+
+    def test_percentile(self):
+        """최근접 순위 백분위수 테스트"""
+        values = [5.0, 1.0, 3.0, 2.0, 4.0]
+        assert percentile(values, 0.5) == 3.0
+        assert percentile(values, 0.95) == 5.0
+        assert percentile([7.0], 0.95) == 7.0
+
+    def test_run_suite_report(self):
+        """측정 결과가 JSON으로 쓸 수 있는 형태인지 테스트"""
+        report = run_suite([1024], repeat=2, name_filter="count_korean", memory=False)
+
+        assert [result["name"] for result in report["results"]] == [
+            "count_korean",
+            "count_many[count_korean]",
+        ]
+        result = report["results"][0]
+        assert result["size"] == "1KB"
+        assert result["p50"] <= result["p95"]
+        assert result["throughput_mb_s"] > 0
+        assert json.loads(json.dumps(report)) == report
+
+    def test_compare_flags_regressions(self):
+        """허용치를 넘게 느려진 항목만 표시되는지 테스트"""
+        baseline = {
+            "results": [
+                {"name": "a", "size": "1KB", "p50": 1.0},
+                {"name": "b", "size": "1KB", "p50": 1.0},
+            ]
+        }
+        current = {
+            "results": [
+                {"name": "a", "size": "1KB", "p50": 1.1},
+                {"name": "b", "size": "1KB", "p50": 1.5},
+                {"name": "c", "size": "1KB", "p50": 9.0},
+            ]
+        }
+
+        rows = compare(current, baseline, threshold=0.2)
+        assert [(name, regressed) for name, _, _, _, regressed in rows] == [
+            ("a", False),
+            ("b", True),
+        ]
+
+
+class TestStartup:
+    @pytest.mark.parametrize("module", ["utils.text_counter", "core.text_processor"])
+    def test_core_imports_without_qt(self, module):
+        """핵심 모듈을 가져올 때 Qt를 불러오지 않는지 테스트"""
+        timing = measure_import(module, repeat=1)
+
+        assert module in QT_FREE_MODULES
+        assert timing.seconds > 0
+        assert not timing.qt
+
+    def test_compare_flags_regressions(self):
+        """임포트 시간과 GUI 단계 시간 중 허용치를 넘은 항목만 표시되는지 테스트"""
+        baseline = {
+            "imports": [{"module": "a", "seconds": 0.01}],
+            "gui": {"첫 화면 그리기": 0.1},
+        }
+        current = {
+            "imports": [
+                {"module": "a", "seconds": 0.011},
+                {"module": "b", "seconds": 1.0},
+            ],
+            "gui": {"첫 화면 그리기": 0.2},
+        }
+
+        rows = compare_startup(current, baseline, threshold=0.2)
+        assert [(name, regressed) for name, _, _, regressed in rows] == [
+            ("a", False),
+            ("gui: 첫 화면 그리기", True),
+        ]
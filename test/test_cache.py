@@ -0,0 +1,338 @@
+import sys
+
+import pytest
+
+from core.cache import CacheStats, ParagraphCache, ResultCache, StageCache
+from core.parallel import worker_processor
+from core.text_processor import STAGES, TextProcessor
+
+
+class TestParagraphCache:
+    def test_get_put(self):
+        """저장한 줄 목록을 같은 키로만 찾는지 테스트"""
+        cache = ParagraphCache()
+        cache.put("안녕하세요 저는", 5, "all_chars", ("안녕하세요", "저는"))
+
+        assert cache.get("안녕하세요 저는", 5, "all_chars") == ("안녕하세요", "저는")
+        assert cache.get("안녕하세요 저는", 6, "all_chars") is None
+        assert cache.get("안녕하세요 저는", 5, "korean") is None
+        assert cache.stats == CacheStats(1, 2, 0, 1, 15)
+
+    def test_lru_eviction(self):
+        """용량을 넘으면 가장 오래 쓰지 않은 문단부터 버리는지 테스트"""
+        cache = ParagraphCache(max_size=8)
+        cache.put("aa", 1, "m", ("aa",))
+        cache.put("bb", 1, "m", ("bb",))
+        cache.get("aa", 1, "m")
+        cache.put("cc", 1, "m", ("cc",))
+
+        assert cache.get("bb", 1, "m") is None
+        assert cache.get("aa", 1, "m") == ("aa",)
+        assert cache.get("cc", 1, "m") == ("cc",)
+        assert cache.stats.evictions == 1
+        assert cache.stats.size <= 8
+
+    def test_oversized_entry_is_not_stored(self):
+        """용량보다 큰 문단은 다른 문단을 밀어내지 않는지 테스트"""
+        cache = ParagraphCache(max_size=8)
+        cache.put("aa", 1, "m", ("aa",))
+        cache.put("x" * 10, 1, "m", ("x" * 10,))
+
+        assert len(cache) == 1
+        assert cache.get("aa", 1, "m") == ("aa",)
+
+    def test_clear(self):
+        """초기화 테스트"""
+        cache = ParagraphCache()
+        cache.put("aa", 1, "m", ("aa",))
+        cache.get("aa", 1, "m")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats == CacheStats(0, 0, 0, 0, 0)
+
+    def test_invalid_size(self):
+        """잘못된 용량 테스트"""
+        with pytest.raises(ValueError):
+            ParagraphCache(max_size=0)
+
+
+class TestCachedProcessor:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+        self.cached = TextProcessor(paragraph_cache=ParagraphCache())
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "안녕하세요. 저는 개발자입니다. 반갑습니다.",
+            "첫 문단\n\n\n\n둘째 문단\n\n",
+            "  \n\n가나다라마바사아자차카타파하 끝.\n\n\n",
+            "같은 문장. 같은 문장. 같은 문장.",
+        ],
+    )
+    def test_matches_uncached(self, text):
+        """캐시를 거친 결과가 캐시 없는 결과와 같은지 테스트 (처음, 다시)"""
+        for _ in range(2):
+            assert self.cached.split_by_all_chars(
+                text, 5
+            ) == self.processor.split_by_all_chars(text, 5)
+            assert self.cached.format_text_with_options(
+                text, 5
+            ) == self.processor.format_text_with_options(text, 5)
+
+    @pytest.mark.parametrize("balanced", [False, True])
+    def test_stats_and_lines_match_uncached(self, balanced):
+        """format_with_stats와 format_lines도 캐시를 거쳐 같은 결과와 통계를 내는지 테스트"""
+        text = "짧은 문장. 가나다라마바사아자차카타파하 끝.\n\n\n\n둘째 문단입니다."
+        expected = self.processor.format_with_stats(text, 5, balanced=balanced)
+        for _ in range(2):
+            assert self.cached.format_with_stats(text, 5, balanced=balanced) == expected
+            assert self.cached.format_lines(
+                text, 5, balanced=balanced
+            ) == self.processor.format_lines(text, 5, balanced=balanced)
+        assert expected.forced_splits == 1
+        assert self.cached.paragraph_cache.stats.hits > 0
+
+    def test_reapply_only_rewraps_changed_paragraphs(self):
+        """다시 적용하면 바뀐 문단만 새로 나누는지 테스트"""
+        sentences = [f"{index}번째 문장입니다." for index in range(50)]
+        self.cached.format_text_with_options(" ".join(sentences), 10)
+        first = self.cached.paragraph_cache.stats
+
+        sentences[20] = "수정된 문장입니다."
+        result = self.cached.format_text_with_options(" ".join(sentences), 10)
+        second = self.cached.paragraph_cache.stats
+
+        assert result == self.processor.format_text_with_options(
+            " ".join(sentences), 10
+        )
+        assert second.misses - first.misses == 1
+        assert second.hits - first.hits == 49
+
+    def test_format_with_stats_reuses_paragraphs(self):
+        """format_with_stats로 다시 가다듬어도 바뀐 문단만 새로 나누는지 테스트"""
+        sentences = [f"{index}번째 문장입니다." for index in range(10)]
+        self.cached.format_with_stats(" ".join(sentences), 10)
+        first = self.cached.paragraph_cache.stats
+
+        sentences[3] = "수정된 문장입니다."
+        self.cached.format_with_stats(" ".join(sentences), 10)
+        second = self.cached.paragraph_cache.stats
+
+        assert second.misses - first.misses == 1
+        assert second.hits - first.hits == 9
+
+    def test_korean_mode_bypasses_cache(self):
+        """한글만 카운팅하는 경로는 캐시를 쓰지 않는지 테스트"""
+        text = "안녕하세요. 반갑습니다."
+        self.cached.format_text_with_options(text, 5, use_all_chars=False)
+        assert self.cached.paragraph_cache.stats.misses == 0
+
+
+class TestResultCache:
+    def test_key_depends_on_content_and_options(self):
+        """내용과 옵션이 같을 때만 키가 같은지 테스트"""
+        key = ResultCache.key("안녕하세요", 18, True, True)
+
+        assert key == ResultCache.key("안녕하세요", 18, True, True)
+        assert key != ResultCache.key("안녕하세요!", 18, True, True)
+        assert key != ResultCache.key("안녕하세요", 18, True, False)
+        assert ResultCache.key("\ud800", 18)  # 짝 없는 서로게이트도 처리
+
+    def test_eviction_by_bytes(self):
+        """총 바이트 수를 넘으면 오래된 결과부터 버리는지 테스트"""
+        entry_size = sys.getsizeof("a" * 100)
+        cache = ResultCache(max_bytes=entry_size * 5)
+        for index in range(6):
+            cache.put(("key", index), "a" * 100)
+
+        assert cache.get(("key", 0)) is None
+        assert cache.get(("key", 5)) == "a" * 100
+        assert cache.stats.evictions == 1
+        assert cache.stats.size <= cache.max_bytes
+
+    def test_large_result_does_not_evict_others(self):
+        """큰 결과 하나가 다른 결과를 밀어내지 않는지 테스트"""
+        cache = ResultCache(max_bytes=10_000)
+        cache.put("small", "짧은 결과")
+        cache.put("large", "가" * 5_000)
+
+        assert cache.get("large") is None
+        assert cache.get("small") == "짧은 결과"
+        assert cache.stats.evictions == 0
+
+    def test_processor_returns_same_object_on_hit(self):
+        """적중 시 저장된 결과를 그대로 반환하는지 테스트"""
+        processor = TextProcessor(result_cache=ResultCache())
+        text = "안녕하세요. 저는 개발자입니다. " * 20
+
+        first = processor.format_text_with_options(text, 10)
+        second = processor.format_text_with_options(text, 10)
+        other = processor.format_text_with_options(text, 5)
+
+        assert first == TextProcessor().format_text_with_options(text, 10)
+        assert second is first
+        assert other != first
+        assert processor.result_cache.stats[:3] == (1, 2, 0)
+
+        processor.result_cache.clear()
+        assert len(processor.result_cache) == 0
+
+    def test_format_with_stats_hit(self):
+        """format_with_stats도 결과와 통계를 함께 저장해 적중 시 그대로 반환하는지 테스트"""
+        processor = TextProcessor(result_cache=ResultCache())
+        text = "안녕하세요. 저는 개발자입니다. " * 20
+
+        first = processor.format_with_stats(text, 10)
+        second = processor.format_with_stats(text, 10)
+
+        assert first == TextProcessor().format_with_stats(text, 10)
+        assert second is first
+        # 문자열 결과와는 따로 저장하므로 format_text_with_options는 통계 결과를 받지 않음
+        assert processor.format_text_with_options(text, 10) == first.text
+        assert processor.result_cache.stats[:3] == (1, 2, 0)
+        assert processor.result_cache.stats.size > sys.getsizeof(first.text)
+
+    def test_format_lines_uses_stored_result(self):
+        """format_lines가 format_text_with_options가 저장한 결과로 줄 목록을 만드는지 테스트"""
+        processor = TextProcessor(result_cache=ResultCache())
+        text = "첫 문단입니다.\n\n\n\n둘째 문단입니다."
+
+        assert list(processor.format_lines(text, 5)) == list(
+            TextProcessor().format_lines(text, 5)
+        )
+        assert processor.result_cache.stats.hits == 0
+        assert len(processor.result_cache) == 0  # 찾기만 하고 저장하지 않음
+
+        expected = processor.format_text_with_options(text, 5)
+        lines = processor.format_lines(text, 5)
+
+        assert lines.join() == expected
+        assert len(lines) == expected.count("\n") + 1
+        assert processor.result_cache.stats.hits == 1
+
+    def test_worker_processor_has_result_cache(self):
+        """작업자 처리기(서비스, 파이프, 일괄 처리)가 결과 캐시를 쓰는지 테스트"""
+        assert worker_processor().result_cache is not None
+
+
+class TestStageCache:
+    def test_lookup_computes_once(self):
+        """같은 입력과 옵션이면 다시 계산하지 않는지 테스트"""
+        cache = StageCache()
+        calls = []
+
+        def compute(source):
+            calls.append(source)
+            return source.upper()
+
+        cache.begin()
+        assert cache.lookup("upper", "abc", (1,), compute) == "ABC"
+        assert cache.recomputed == ("upper",)
+        cache.begin()
+        assert cache.lookup("upper", "a" + "bc", (1,), compute) == "ABC"
+        assert cache.lookup("upper", "abc", (2,), compute) == "ABC"
+
+        assert calls == ["abc", "abc"]
+        assert cache.recomputed == ("upper",)
+        assert cache.stats[:3] == (1, 2, 0)
+
+    def test_objects_are_matched_by_identity(self):
+        """문자열이 아닌 입력은 같은 객체일 때만 재사용하는지 테스트"""
+        cache = StageCache()
+        first, second = [1, 2], [1, 2]
+
+        assert cache.lookup("sum", first, (), sum) == 3
+        assert cache.lookup("sum", second, (), sum) == 3
+        assert cache.lookup("sum", first, (), sum) == 3
+        assert cache.stats[:2] == (1, 2)
+
+    def test_eviction_per_stage(self):
+        """단계마다 최대 개수를 넘으면 오래된 결과부터 버리는지 테스트"""
+        cache = StageCache(max_entries=2)
+        for text in ("a", "b", "c"):
+            cache.lookup("stage", text, (), str.upper)
+        cache.lookup("other", "a", (), str.upper)
+
+        assert len(cache) == 3
+        assert cache.stats.evictions == 1
+        cache.begin()
+        cache.lookup("stage", "a", (), str.upper)
+        assert cache.recomputed == ("stage",)
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.recomputed == ()
+
+    def test_invalid_size(self):
+        """잘못된 용량 테스트"""
+        with pytest.raises(ValueError):
+            StageCache(max_entries=0)
+
+
+class TestStagedProcessor:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+        self.staged = TextProcessor(stage_cache=StageCache())
+        self.text = (
+            "안녕하세요. 저는 개발자입니다.\n반갑습니다! 가나다라마바사아자차카타 끝 "
+            * 5
+        )
+
+    def _format(self, *args, **kwargs):
+        result = self.staged.format_text_with_options(self.text, *args, **kwargs)
+        assert result == self.processor.format_text_with_options(
+            self.text, *args, **kwargs
+        )
+        return self.staged.stage_cache.recomputed
+
+    def test_first_run_computes_all_stages(self):
+        """처음 실행하면 모든 단계를 계산하는지 테스트"""
+        assert self._format(10) == STAGES
+        assert self._format(10) == ()
+
+    def test_width_change_reuses_tokens(self):
+        """줄 길이만 바꾸면 단어 배열을 재사용하는지 테스트"""
+        self._format(10)
+        assert self._format(12) == ("wrap", "join")
+        assert self._format(12, balanced=True) == ("wrap", "join")
+
+    def test_counting_mode_change_reuses_separation(self):
+        """카운팅 방식만 바꾸면 마침표 분리 결과를 재사용하는지 테스트"""
+        self._format(10)
+        assert self._format(10, use_all_chars=False) == ("tokenize", "wrap", "join")
+
+    def test_sentence_toggle_reuses_previous_stages(self):
+        """마침표 분리를 껐다 켜면 보관된 단계를 다시 쓰는지 테스트"""
+        self._format(10)
+        assert self._format(10, separate_sentences=False) == (
+            "tokenize",
+            "wrap",
+            "join",
+        )
+        assert self._format(10) == ()
+
+    def test_text_change_recomputes_all(self):
+        """원문이 바뀌면 모든 단계를 다시 계산하는지 테스트"""
+        self._format(10)
+        self.text += "추가 문장."
+        assert self._format(10) == STAGES
+
+    def test_result_cache_hit_clears_stages(self):
+        """결과 캐시에서 찾으면 다시 계산한 단계가 없다고 보고하는지 테스트"""
+        self.staged = TextProcessor(
+            result_cache=ResultCache(), stage_cache=StageCache()
+        )
+        assert self._format(10) == STAGES
+        assert self._format(12) == ("wrap", "join")
+        assert self._format(10) == ()
+        assert self.staged.result_cache.stats.hits == 1
+
+    @pytest.mark.parametrize("text", ["", "   \n "])
+    def test_empty_text(self, text):
+        """빈 텍스트는 단계 없이 빈 결과를 반환하는지 테스트"""
+        assert self.staged.format_text_with_options(text, 10) == ""
+        assert self.staged.stage_cache.recomputed == ()
@@ -0,0 +1,148 @@
+import pytest
+
+import core.wrapping as wrapping
+from core.cache import ParagraphCache, StageCache
+from core.cancellation import (
+    CancellationToken,
+    Checkpoint,
+    OperationCancelled,
+    checkpoint_for,
+)
+from core.text_processor import TextProcessor
+
+
+class TestCancellationToken:
+    def test_raise_if_cancelled(self):
+        """취소 요청 후에만 OperationCancelled가 발생하는지 테스트"""
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        token.cancel()
+        with pytest.raises(OperationCancelled):
+            token.raise_if_cancelled()
+
+    def test_timeout(self):
+        """제한 시간이 지나면 취소된 것으로 보는지 테스트"""
+        assert CancellationToken(timeout=0).cancelled
+        assert not CancellationToken(timeout=60).cancelled
+
+
+class TestCheckpoint:
+    def test_stage_maps_positions(self):
+        """단계별 텍스트 위치를 전체 진행량으로 바꿔 알리는지 테스트"""
+        reports = []
+        checkpoint = Checkpoint(1000, lambda *args: reports.append(args))
+        checkpoint.stage(0.0, 0.2, 50)
+        checkpoint(25)
+        checkpoint.stage(0.2, 1.0, 400)
+        checkpoint(0)
+        checkpoint(200)
+        checkpoint.finish()
+
+        assert reports == [(100, 1000), (200, 1000), (600, 1000), (1000, 1000)]
+
+    def test_reports_are_throttled(self):
+        """전체의 1%보다 작게 늘어난 진행량은 알리지 않는지 테스트"""
+        reports = []
+        checkpoint = Checkpoint(10_000, lambda *args: reports.append(args))
+        for position in range(0, 10_000, 10):
+            checkpoint(position)
+
+        assert len(reports) == 100
+
+    def test_checkpoint_for_unused(self):
+        """콜백과 토큰이 모두 없으면 확인 지점을 만들지 않는지 테스트"""
+        assert checkpoint_for(100) is None
+        assert checkpoint_for(100, token=CancellationToken()) is not None
+
+
+class TestEngineHooks:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.text = (
+            "안녕하세요. 저는 개발자입니다.\n반갑습니다! 가나다라마바사 끝 " * 200
+        )
+
+    @pytest.fixture(autouse=True)
+    def small_blocks(self, monkeypatch):
+        """구간을 작게 나눠 짧은 텍스트에서도 확인 지점을 여러 번 지나게 함"""
+        monkeypatch.setattr(wrapping, "BLOCK_SIZE", 256)
+
+    @pytest.mark.parametrize(
+        "processor",
+        [
+            TextProcessor(),
+            TextProcessor(stage_cache=StageCache()),
+            TextProcessor(paragraph_cache=ParagraphCache()),
+        ],
+        ids=["plain", "staged", "paragraph_cache"],
+    )
+    @pytest.mark.parametrize("separate_sentences", [True, False])
+    def test_progress_is_monotonic(self, processor, separate_sentences):
+        """진행량이 줄지 않고 전체 양에서 끝나며 결과는 그대로인지 테스트"""
+        reports = []
+        result = processor.format_text_with_options(
+            self.text,
+            10,
+            separate_sentences=separate_sentences,
+            progress=lambda *args: reports.append(args),
+        )
+
+        assert result == TextProcessor().format_text_with_options(
+            self.text, 10, separate_sentences=separate_sentences
+        )
+        assert len(reports) > 2
+        assert reports[-1] == (len(self.text), len(self.text))
+        assert [done for done, _ in reports] == sorted(done for done, _ in reports)
+
+    @pytest.mark.parametrize(
+        "run",
+        [
+            lambda processor, text, **hooks: processor.format_text_with_options(
+                text, 10, **hooks
+            ),
+            lambda processor, text, **hooks: processor.format_with_stats(
+                text, 10, balanced=True, **hooks
+            ),
+            lambda processor, text, **hooks: processor.split_by_all_chars(
+                text, 10, **hooks
+            ),
+            lambda processor, text, **hooks: processor.separate_sentences_by_period(
+                text, **hooks
+            ),
+            lambda processor, text, **hooks: processor.format_to(
+                text, [].append, 10, **hooks
+            ),
+        ],
+        ids=[
+            "format_text_with_options",
+            "format_with_stats",
+            "split_by_all_chars",
+            "separate_sentences_by_period",
+            "format_to",
+        ],
+    )
+    def test_cancel_during_run(self, run):
+        """처리 중에 취소하면 다음 확인 지점에서 OperationCancelled가 발생하는지 테스트"""
+        token = CancellationToken()
+        reports = []
+
+        def cancel_after_first(done, total):
+            reports.append(done)
+            token.cancel()
+
+        with pytest.raises(OperationCancelled):
+            run(TextProcessor(), self.text, progress=cancel_after_first, token=token)
+        assert len(reports) == 1
+
+    def test_iter_format_checks_each_chunk(self):
+        """스트리밍 처리는 청크마다 취소 토큰을 확인하는지 테스트"""
+        token = CancellationToken()
+
+        def chunks():
+            yield "안녕하세요 반갑습니다. " * 10
+            token.cancel()
+            yield "다음 청크"
+
+        lines = TextProcessor().iter_format(chunks(), 10, token=token)
+        with pytest.raises(OperationCancelled):
+            list(lines)
@@ -0,0 +1,85 @@
+from core.cancellation import CancellationToken
+from core.text_processor import COUNTING_DISPLAY_WIDTH, TextProcessor
+from ui.format_worker import FormatTask
+
+
+class TestFormatWorker:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+        self.events = []
+
+    def _make_task(self, text, token, request_id=1):
+        task = FormatTask(request_id, self.processor, text, 10, True, True, token)
+        task.signals.finished.connect(
+            lambda *args: self.events.append(("finished", *args))
+        )
+        task.signals.failed.connect(lambda *args: self.events.append(("failed", *args)))
+        task.signals.cancelled.connect(
+            lambda *args: self.events.append(("cancelled", *args))
+        )
+        return task
+
+    def test_token_cancel(self):
+        """취소 토큰 상태 테스트"""
+        token = CancellationToken()
+        assert not token.cancelled
+        token.cancel()
+        assert token.cancelled
+
+    def test_task_result_matches_processor(self):
+        """작업 결과가 format_text_with_options와 같은지 테스트"""
+        text = "안녕하세요. 저는 개발자입니다. 반갑습니다. " * 100
+        self._make_task(text, CancellationToken(), request_id=7).run()
+
+        (event,) = self.events
+        kind, request_id, result, char_count, elapsed = event
+        expected = self.processor.format_text_with_options(text, 10)
+        assert (kind, request_id, result) == ("finished", 7, expected)
+        assert char_count == self.processor.count_all_chars_with_period(expected)
+        assert elapsed >= 0
+
+    def test_cancelled_task_emits_cancelled(self):
+        """취소된 작업은 결과 대신 취소 시그널을 보내는지 테스트"""
+        token = CancellationToken()
+        token.cancel()
+        self._make_task("안녕하세요 " * 5000, token, request_id=3).run()
+
+        assert self.events == [("cancelled", 3)]
+
+    def test_task_reports_progress(self):
+        """작업 중에 진행 상황 시그널을 보내고 전체 양에서 끝나는지 테스트"""
+        text = "안녕하세요. 저는 개발자입니다. 반갑습니다. " * 100
+        task = self._make_task(text, CancellationToken(), request_id=5)
+        task.signals.progress.connect(
+            lambda *args: self.events.append(("progress", *args))
+        )
+        task.run()
+
+        progress = [event for event in self.events if event[0] == "progress"]
+        assert progress[-1] == ("progress", 5, len(text), len(text))
+        assert self.events[-1][0] == "finished"
+
+    def test_cancel_while_running(self):
+        """작업 도중 취소하면 다음 확인 지점에서 멈추고 취소 시그널을 보내는지 테스트"""
+        token = CancellationToken()
+        task = self._make_task("안녕하세요. 반갑습니다. " * 100, token, request_id=4)
+        task.signals.progress.connect(lambda *args: token.cancel())
+        task.run()
+
+        assert self.events == [("cancelled", 4)]
+
+    def test_task_uses_plan(self):
+        """계획을 주면 줄 길이와 카운팅 옵션 대신 그 계획으로 가다듬는지 테스트"""
+        text = "안녕하세요. 저는 개발자입니다. 반갑습니다. " * 20
+        plan = self.processor.compile(6, COUNTING_DISPLAY_WIDTH)
+        task = FormatTask(
+            2, self.processor, text, 10, True, True, CancellationToken(), plan
+        )
+        task.signals.finished.connect(
+            lambda *args: self.events.append(("finished", *args))
+        )
+        task.run()
+
+        (event,) = self.events
+        assert event[:3] == ("finished", 2, plan.format(text))
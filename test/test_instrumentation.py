@@ -0,0 +1,118 @@
+import threading
+
+from core.instrumentation import (
+    TIMER_COUNT,
+    TIMER_NORMALIZE,
+    TIMER_SEPARATE,
+    TIMER_STRIP_INVISIBLE,
+    TIMER_TOKENIZE,
+    TIMER_WRAP,
+    TIMERS,
+    Instrumentation,
+)
+from core.text_processor import TextProcessor
+
+
+class TestInstrumentation:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.instrumentation = Instrumentation()
+        self.processor = TextProcessor(instrumentation=self.instrumentation)
+        self.text = "안녕하세요.​반갑습니다. 아주아주아주긴단어입니다 끝. " * 10
+
+    def test_same_results(self):
+        """계측해도 계측하지 않은 처리기와 결과가 같은지 테스트"""
+        plain = TextProcessor()
+        for use_all_chars in (True, False):
+            for balanced in (False, True):
+                assert self.processor.format_text_with_options(
+                    self.text, 8, use_all_chars, True, balanced
+                ) == plain.format_text_with_options(
+                    self.text, 8, use_all_chars, True, balanced
+                )
+        assert self.processor.format_multi(self.text, [8, 12]) == plain.format_multi(
+            self.text, [8, 12]
+        )
+
+    def test_records_stages(self):
+        """가다듬기 한 번에 구간마다 호출 수와 문자 수가 쌓이는지 테스트"""
+        self.processor.format_text_with_options(self.text, 8)
+        snapshot = self.instrumentation.snapshot()
+
+        assert set(snapshot) == set(TIMERS)
+        for timer in (TIMER_STRIP_INVISIBLE, TIMER_NORMALIZE, TIMER_SEPARATE):
+            assert snapshot[timer]["calls"] == 1
+        assert snapshot[TIMER_STRIP_INVISIBLE]["chars"] == len(self.text)
+        assert snapshot[TIMER_WRAP]["calls"] == 1
+        assert snapshot[TIMER_WRAP]["seconds"] > 0
+        # 모든 문자 카운팅은 줄 나누기 안에서 일괄로 셈
+        assert snapshot[TIMER_COUNT]["calls"] == 0
+        assert snapshot[TIMER_TOKENIZE]["calls"] == 0
+
+    def test_counts_forced_splits(self):
+        """강제 분할 수가 통계의 강제 분할 수와 같은지 테스트"""
+        result = self.processor.format_with_stats(self.text, 8)
+
+        assert result.forced_splits == 10
+        assert self.instrumentation.forced_splits == 10
+
+    def test_per_word_counting_and_tokenize(self):
+        """한글 카운팅은 단어마다, 여러 줄 길이는 단어 배열 한 번으로 세는지 테스트"""
+        self.processor.format_text_with_options(self.text, 8, use_all_chars=False)
+        words = len(self.processor.separate_sentences_by_period(self.text).split())
+        assert self.instrumentation.stats(TIMER_COUNT).calls >= words
+
+        self.instrumentation.reset()
+        self.processor.format_multi(self.text, [8, 12, 16])
+        assert self.instrumentation.stats(TIMER_TOKENIZE).calls == 1
+        assert self.instrumentation.stats(TIMER_WRAP).calls == 0
+
+    def test_reset_and_summary(self):
+        """초기화하면 통계가 0이 되고 요약은 호출된 구간만 보이는지 테스트"""
+        assert self.instrumentation.summary() == "계측된 처리가 없습니다"
+        self.processor.format_text_with_options(self.text, 8)
+        summary = self.instrumentation.summary()
+        assert "마침표 분리" in summary and "강제 분할 10회" in summary
+        assert "단어 배열" not in summary
+
+        self.instrumentation.reset()
+        assert all(
+            stats == {"seconds": 0.0, "calls": 0, "chars": 0}
+            for stats in self.instrumentation.snapshot().values()
+        )
+
+    def test_records_on_error(self):
+        """예외가 나도 실행 시간과 호출 수를 누적하는지 테스트"""
+
+        def fail(text):
+            raise ValueError(text)
+
+        timed = self.instrumentation.timed(TIMER_COUNT, fail)
+        try:
+            timed("가나다")
+        except ValueError:
+            pass
+        assert self.instrumentation.stats(TIMER_COUNT)[1:] == (1, 3)
+
+    def test_threads(self):
+        """여러 스레드에서 함께 써도 호출 수를 잃지 않는지 테스트"""
+        count = self.instrumentation.timed(TIMER_COUNT, len)
+
+        def run():
+            for _ in range(1000):
+                count("가나")
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert self.instrumentation.stats(TIMER_COUNT)[1:] == (4000, 8000)
+
+    def test_disabled_has_no_wrappers(self):
+        """계측하지 않는 처리기는 클래스 메서드를 그대로 쓰는지 테스트"""
+        processor = TextProcessor()
+
+        assert processor.instrumentation is None
+        assert "normalize_whitespace" not in vars(processor)
+        assert "normalize_whitespace" in vars(self.processor)
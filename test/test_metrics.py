@@ -0,0 +1,321 @@
+import asyncio
+import io
+import json
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.batch import format_directory
+from core.cache import ResultCache
+from core.metrics import (
+    API_ERRORS,
+    API_INPUT_CHARS,
+    API_SECONDS,
+    CACHE_HIT_RATIO,
+    CONTENT_TYPE,
+    DOCUMENT_INPUT_BYTES,
+    DOCUMENT_OUTPUT_BYTES,
+    DOCUMENT_SECONDS,
+    DOCUMENTS,
+    HTTP_REQUESTS,
+    HTTP_SENT_BYTES,
+    MetricFamily,
+    MetricsRegistry,
+)
+from core.pipe import run_pipe
+from core.service import FormatService, ServiceClient, _read_response
+from core.text_processor import TextProcessor
+
+
+def parse(text):
+    """Prometheus 텍스트 형식을 {이름{레이블}: 값}으로 읽습니다. (주석 줄 제외)"""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+class TestMetricsRegistry:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.registry = MetricsRegistry()
+
+    def test_render_counter_and_histogram(self):
+        """카운터와 히스토그램을 HELP/TYPE 줄, 누적 구간 수, 합계, 개수로 내보내는지 테스트"""
+        counter = self.registry.counter("test_requests_total", "요청 수", ("path",))
+        counter.inc(("/format",))
+        counter.inc(("/format",), 2)
+        histogram = self.registry.histogram(
+            "test_seconds", "처리 시간", ("api",), buckets=(0.1, 1.0)
+        )
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, ("format",))
+
+        text = self.registry.render()
+        assert "# HELP test_requests_total 요청 수\n" in text
+        assert "# TYPE test_requests_total counter\n" in text
+        assert "# TYPE test_seconds histogram\n" in text
+        samples = parse(text)
+        assert samples['test_requests_total{path="/format"}'] == 3
+        assert samples['test_seconds_bucket{api="format",le="0.1"}'] == 2
+        assert samples['test_seconds_bucket{api="format",le="1"}'] == 3
+        assert samples['test_seconds_bucket{api="format",le="+Inf"}'] == 4
+        assert samples['test_seconds_count{api="format"}'] == 4
+        assert samples['test_seconds_sum{api="format"}'] == pytest.approx(3.65)
+        assert histogram.snapshot(("format",)) == (4, 3.65, (2, 3))
+
+    def test_get_or_create(self):
+        """같은 이름은 같은 지표를 돌려주고, 종류나 레이블이 다르면 거절하는지 테스트"""
+        counter = self.registry.counter("test_total", "수")
+        assert self.registry.counter("test_total", "수") is counter
+        with pytest.raises(ValueError):
+            self.registry.histogram("test_total", "수")
+        with pytest.raises(ValueError):
+            self.registry.counter("test_total", "수", ("path",))
+
+    def test_collectors_merge_and_escape(self):
+        """수집기의 같은 이름 지표를 합치고 레이블 값을 이스케이프하는지 테스트"""
+        for name in ('a"b', "c\\d"):
+            self.registry.add_collector(
+                name,
+                lambda name=name: [
+                    MetricFamily(
+                        "test_entries", "gauge", "항목 수", ("cache",), {(name,): 1}
+                    )
+                ],
+            )
+        text = self.registry.render()
+
+        assert text.count("# TYPE test_entries gauge") == 1
+        assert 'test_entries{cache="a\\"b"} 1\n' in text
+        assert 'test_entries{cache="c\\\\d"} 1\n' in text
+
+        self.registry.remove_collector('a"b')
+        assert 'cache="a' not in self.registry.render()
+
+    def test_threads(self):
+        """여러 스레드에서 함께 기록해도 값을 잃지 않는지 테스트"""
+        counter = self.registry.counter("test_total", "수")
+        histogram = self.registry.histogram("test_seconds", "시간")
+
+        def run():
+            for _ in range(1000):
+                counter.inc()
+                histogram.observe(0.001)
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert counter.value() == 4000
+        assert histogram.snapshot().count == 4000
+
+    def test_write_textfile(self, tmp_path):
+        """파일에 쓴 내용이 render와 같고 임시 파일이 남지 않는지 테스트"""
+        self.registry.counter("test_total", "수").inc()
+        path = tmp_path / "word_breaker.prom"
+        self.registry.write_textfile(path)
+
+        assert path.read_text(encoding="utf-8") == self.registry.render()
+        assert [item.name for item in tmp_path.iterdir()] == ["word_breaker.prom"]
+
+    def test_serve(self):
+        """localhost의 /metrics로 내보내고 다른 경로는 404인지 테스트"""
+        self.registry.counter("test_total", "수").inc()
+        with self.registry.serve(port=0) as server:
+            url = f"http://127.0.0.1:{server.port}"
+            with urllib.request.urlopen(f"{url}/metrics") as response:
+                assert response.headers["Content-Type"] == CONTENT_TYPE
+                assert parse(response.read().decode("utf-8"))["test_total"] == 1
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(f"{url}/missing")
+            assert error.value.code == 404
+
+
+class TestProcessorMetrics:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.registry = MetricsRegistry()
+        self.processor = TextProcessor(
+            result_cache=ResultCache(), metrics=self.registry
+        )
+        self.text = "안녕하세요. 반갑습니다. 아주아주아주긴단어입니다 끝. " * 10
+
+    def test_same_results(self):
+        """지표를 모아도 모으지 않는 처리기와 결과가 같은지 테스트"""
+        plain = TextProcessor()
+        for use_all_chars in (True, False):
+            assert self.processor.format_text_with_options(
+                self.text, 8, use_all_chars
+            ) == plain.format_text_with_options(self.text, 8, use_all_chars)
+        assert self.processor.split_by_display_width(
+            self.text, 8
+        ) == plain.split_by_display_width(self.text, 8)
+        assert self.processor.format_multi(self.text, [8, 12]) == plain.format_multi(
+            self.text, [8, 12]
+        )
+
+    def test_records_public_apis(self):
+        """공개 API만 API별로 기록하고 내부에서 단어마다 세는 호출은 기록하지 않는지 테스트"""
+        self.processor.format_text_with_options(self.text, 8, use_all_chars=False)
+        self.processor.split_by_all_chars(self.text, 8)
+        self.processor.count_korean_chars("가나다")
+        seconds = self.registry.histogram(API_SECONDS, "", ("api",))
+        input_chars = self.registry.counter(API_INPUT_CHARS, "", ("api",))
+
+        apis = ("format_text_with_options", "split_by_all_chars", "count_korean_chars")
+        for api in apis:
+            assert seconds.snapshot((api,)).count == 1
+        assert input_chars.value(("format_text_with_options",)) == len(self.text)
+        assert input_chars.value(("count_korean_chars",)) == 3
+
+    def test_records_errors(self):
+        """예외로 끝난 호출을 실패 수와 지연 시간에 기록하는지 테스트"""
+        with pytest.raises(AttributeError):
+            self.processor.split_by_all_chars(None, 8)
+        assert self.processor.count_all_chars(None) == 0
+        errors = self.registry.counter(API_ERRORS, "", ("api",))
+        seconds = self.registry.histogram(API_SECONDS, "", ("api",))
+
+        assert errors.value(("split_by_all_chars",)) == 1
+        assert seconds.snapshot(("split_by_all_chars",)).count == 1
+        assert errors.value(("count_all_chars",)) == 0
+
+    def test_cache_hit_ratio(self):
+        """결과 캐시의 적중률을 내보낼 때 읽는지 테스트"""
+        for _ in range(4):
+            self.processor.format_text_with_options(self.text, 8)
+        samples = parse(self.registry.render())
+
+        assert samples[f'{CACHE_HIT_RATIO}{{cache="result"}}'] == 0.75
+
+    def test_disabled_has_no_wrappers(self):
+        """지표를 모으지 않는 처리기는 클래스 메서드를 그대로 쓰는지 테스트"""
+        processor = TextProcessor()
+
+        assert processor.metrics is None
+        assert "format_text_with_options" not in vars(processor)
+        assert "format_text_with_options" in vars(self.processor)
+
+
+class TestDocumentMetrics:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.registry = MetricsRegistry()
+
+    def test_batch(self, tmp_path):
+        """일괄 처리가 파일마다 문서 수, 입출력 바이트 수, 처리 시간을 기록하는지 테스트"""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.txt").write_text("안녕하세요. 반갑습니다.", encoding="utf-8")
+        (src / "b.txt").write_bytes(b"\xff\xfe")
+        summary = format_directory(src, tmp_path / "dst", jobs=1, metrics=self.registry)
+        samples = parse(self.registry.render())
+
+        assert samples[f'{DOCUMENTS}{{source="batch",status="ok"}}'] == 1
+        assert samples[f'{DOCUMENTS}{{source="batch",status="error"}}'] == 1
+        assert samples[f'{DOCUMENT_INPUT_BYTES}{{source="batch"}}'] == (
+            summary.input_bytes
+        )
+        assert samples[f'{DOCUMENT_OUTPUT_BYTES}{{source="batch"}}'] == sum(
+            result.output_bytes for result in summary.results
+        )
+        assert samples[f'{DOCUMENT_SECONDS}_count{{source="batch"}}'] == 2
+        # 현재 프로세스에서 처리하면 처리기의 API 지표도 기록
+        assert samples[f'{API_SECONDS}_count{{api="format_to"}}'] == 1
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_pipe(self, workers):
+        """파이프 모드가 줄 수, 실패 수, 입출력 바이트 수를 기록하는지 테스트"""
+        source = '{"text": "가. 나."}\n{"text": 1}\n{"id": "x", "text": "다."}\n'
+        output = io.BytesIO()
+        run_pipe(
+            io.BytesIO(source.encode()), output, workers=workers, metrics=self.registry
+        )
+        samples = parse(self.registry.render())
+
+        assert samples[f'{DOCUMENTS}{{source="pipe",status="ok"}}'] == 2
+        assert samples[f'{DOCUMENTS}{{source="pipe",status="error"}}'] == 1
+        assert samples[f'{DOCUMENT_INPUT_BYTES}{{source="pipe"}}'] == len(
+            source.encode()
+        )
+        assert samples[f'{DOCUMENT_OUTPUT_BYTES}{{source="pipe"}}'] == len(
+            output.getvalue()
+        )
+        # 작업 프로세스의 API 지표는 모이지 않음
+        api_calls = f'{API_SECONDS}_count{{api="format_text_with_options"}}'
+        assert samples.get(api_calls) == (2 if workers == 1 else None)
+
+
+class TestServiceMetrics:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.registry = MetricsRegistry()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def teardown_method(self):
+        self.executor.shutdown()
+
+    def serve(self, test, metrics):
+        async def run():
+            service = FormatService(1, self.executor, metrics=metrics)
+            try:
+                return await test(await service.start(port=0))
+            finally:
+                await service.close()
+
+        return asyncio.run(run())
+
+    async def get_metrics(self, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nConnection: close\r\n\r\n")
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        status = int(head.split(b" ")[1])
+        body = await reader.read()
+        writer.close()
+        return status, head.decode("latin-1"), body.decode("utf-8")
+
+    def test_metrics_route(self):
+        """/metrics가 HTTP 요청 지표와 처리 통계를 Prometheus 텍스트 형식으로 돌려주는지 테스트"""
+
+        async def test(port):
+            async with ServiceClient(port=port) as client:
+                await client.request("POST", "/format", {"text": "가. 나.", "width": 5})
+                await client.request("POST", "/count", {"text": "가나"})
+                await client.request("GET", "/missing")
+            return await self.get_metrics(port)
+
+        status, head, body = self.serve(test, self.registry)
+        samples = parse(body)
+
+        assert status == 200
+        assert f"Content-Type: {CONTENT_TYPE}" in head
+        assert samples[f'{HTTP_REQUESTS}{{path="/format",status="200"}}'] == 1
+        assert samples[f'{HTTP_REQUESTS}{{path="/count",status="200"}}'] == 1
+        assert samples[f'{HTTP_REQUESTS}{{path="other",status="404"}}'] == 1
+        assert samples[HTTP_SENT_BYTES] > 0
+        assert samples["word_breaker_service_requests_total"] == 2
+        assert samples["word_breaker_service_queued"] == 0
+        # 스레드 풀에서 처리하면 처리기의 API 지표도 기록
+        assert samples[f'{API_SECONDS}_count{{api="format_text_with_options"}}'] == 1
+        assert samples[f'{API_SECONDS}_count{{api="count_korean_chars"}}'] == 1
+
+    def test_no_metrics_route_when_disabled(self):
+        """지표 모음이 없으면 /metrics가 없는 경로인지 테스트"""
+
+        async def test(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /metrics HTTP/1.1\r\n\r\n")
+            await writer.drain()
+            status, body = await _read_response(reader)
+            writer.close()
+            return status, json.loads(body)
+
+        status, payload = self.serve(test, None)
+        assert status == 404 and "error" in payload
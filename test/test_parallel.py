@@ -0,0 +1,63 @@
+import pytest
+
+import core.text_processor as text_processor
+from core.parallel import split_at_paragraphs
+from core.text_processor import TextProcessor
+
+
+class TestParallel:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+        self.text = (
+            "안녕하세요. 저는 개발자입니다.\n\n\n\n반갑습니다. "
+            "아주아주아주긴단어입니다. 끝 "
+        ) * 40
+
+    def test_split_at_paragraphs_cuts_after_words(self):
+        """조각을 이으면 원문이 되고, 조각 경계가 단어 뒤 빈 행인지 테스트"""
+        separated = self.processor.separate_sentences_by_period(self.text)
+        chunks = split_at_paragraphs(separated, 8)
+
+        assert "".join(chunks) == separated
+        assert len(chunks) > 1
+        for before, after in zip(chunks, chunks[1:]):
+            assert not before[-1].isspace()
+            assert after.startswith("\n\n")
+
+    def test_split_at_paragraphs_without_breaks(self):
+        """문단 경계가 없으면 한 조각으로 반환하는지 테스트"""
+        assert split_at_paragraphs("문단 경계 없는 텍스트", 4) == [
+            "문단 경계 없는 텍스트"
+        ]
+
+    @pytest.mark.parametrize("use_all_chars", [True, False])
+    @pytest.mark.parametrize("separate_sentences", [True, False])
+    def test_parallel_matches_serial(
+        self, monkeypatch, use_all_chars, separate_sentences
+    ):
+        """병렬 처리 결과가 한 스레드 처리와 같은지 테스트"""
+        monkeypatch.setattr(text_processor, "PARALLEL_MIN_LENGTH", 0)
+        with TextProcessor(workers=2) as parallel:
+            assert parallel.format_text_with_options(
+                self.text, 7, use_all_chars, separate_sentences
+            ) == self.processor.format_text_with_options(
+                self.text, 7, use_all_chars, separate_sentences
+            )
+            separated = self.processor.separate_sentences_by_period(self.text)
+            assert parallel.split_by_all_chars(
+                separated, 7
+            ) == self.processor.split_by_all_chars(separated, 7)
+
+    def test_parallel_balanced_matches_serial(self, monkeypatch):
+        """균형 배치도 병렬 처리 결과가 한 스레드 처리와 같은지 테스트"""
+        monkeypatch.setattr(text_processor, "PARALLEL_MIN_LENGTH", 0)
+        with TextProcessor(workers=2) as parallel:
+            assert parallel.format_text_with_options(
+                self.text, 7, balanced=True
+            ) == self.processor.format_text_with_options(self.text, 7, balanced=True)
+
+    def test_invalid_workers(self):
+        """잘못된 작업자 수 테스트"""
+        with pytest.raises(ValueError):
+            TextProcessor(workers=0)
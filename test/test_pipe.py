@@ -0,0 +1,163 @@
+import io
+import json
+
+import pytest
+
+import core.pipe as pipe_module
+from core.pipe import format_records, run_pipe
+from core.text_processor import TextProcessor
+
+
+class ChunkedSource:
+    """read1마다 정해 둔 조각을 하나씩 돌려주는 입력 (대화형 파이프 흉내)"""
+
+    def __init__(self, chunks, output):
+        self.chunks = list(chunks)
+        self.output = output
+        self.seen = []
+
+    def read1(self, size):
+        # 다음 입력을 읽기 전까지 쓰인 출력 줄 수를 기록
+        self.seen.append(self.output.getvalue().count(b"\n"))
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+class ClosedOutput:
+    """쓰면 BrokenPipeError가 나는 출력 (읽는 쪽이 닫힌 파이프 흉내)"""
+
+    def __init__(self):
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        raise BrokenPipeError(32, "Broken pipe")
+
+    def flush(self):
+        pass
+
+
+class TestPipe:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+        self.texts = [
+            f"{index}번째 문서입니다. 안녕하세요.반갑습니다! 긴단어가나다라마바사 끝."
+            * (index % 7 + 1)
+            for index in range(60)
+        ]
+
+    def requests(self):
+        lines = [
+            json.dumps({"id": f"doc-{index}", "text": text, "width": 10 + index % 5})
+            for index, text in enumerate(self.texts)
+        ]
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def expected(self, index):
+        width = 10 + index % 5
+        return self.processor.format_text_with_options(self.texts[index], width)
+
+    def parse(self, output):
+        return [json.loads(line) for line in output.getvalue().splitlines()]
+
+    def test_serial_keeps_order(self):
+        """작업자 하나면 입력 순서대로 결과를 쓰는지 테스트"""
+        output = io.BytesIO()
+        summary = run_pipe(io.BytesIO(self.requests()), output)
+
+        results = self.parse(output)
+        assert [result["id"] for result in results] == [
+            f"doc-{index}" for index in range(60)
+        ]
+        for index, result in enumerate(results):
+            assert result["text"] == self.expected(index)
+        assert (summary.records, summary.errors) == (60, 0)
+        assert summary.input_bytes == len(self.requests())
+
+    @pytest.mark.parametrize("ordered", [False, True])
+    def test_workers(self, monkeypatch, ordered):
+        """작업자가 여럿이면 id로 구별되는 같은 결과를 쓰고, ordered면 순서도 같은지 테스트"""
+        monkeypatch.setattr(pipe_module, "BATCH_BYTES", 1024)
+        output = io.BytesIO()
+        summary = run_pipe(
+            io.BytesIO(self.requests()), output, workers=2, ordered=ordered
+        )
+
+        results = self.parse(output)
+        ids = [result["id"] for result in results]
+        assert sorted(ids) == sorted(f"doc-{index}" for index in range(60))
+        if ordered:
+            assert ids == [f"doc-{index}" for index in range(60)]
+        for result in results:
+            assert result["text"] == self.expected(int(result["id"].split("-")[1]))
+        assert summary.records == 60
+
+    def test_errors_and_missing_id(self):
+        """잘못된 줄은 그 줄의 오류로 쓰고, id가 없으면 입력 줄 번호를 쓰는지 테스트"""
+        source = '{"text": "가. 나."}\n\nnot json\n{"id": 7, "text": 1}\n[1]'.encode()
+        output = io.BytesIO()
+        summary = run_pipe(io.BytesIO(source), output)
+
+        results = self.parse(output)
+        assert results[0] == {"id": 0, "text": "가.\n\n나."}
+        assert [result["id"] for result in results[1:]] == [2, 7, 4]
+        assert all("error" in result for result in results[1:])
+        assert (summary.records, summary.errors) == (4, 3)
+
+    def test_responds_before_next_input(self):
+        """다음 입력을 기다리기 전에 앞 줄의 결과를 써서 대화형으로 쓸 수 있는지 테스트"""
+        lines = self.requests().splitlines(keepends=True)[:3]
+        # 줄 하나가 두 조각으로 나뉘어 들어와도 완성된 뒤 한 번만 처리
+        chunks = [lines[0], lines[1][:20], lines[1][20:], lines[2]]
+        output = io.BytesIO()
+        source = ChunkedSource(chunks, output)
+        run_pipe(source, output)
+
+        assert source.seen == [0, 1, 1, 2, 3]
+
+    def test_long_line_across_many_reads(self):
+        """여러 번에 걸쳐 읽힌 긴 줄도 한 줄로 처리하고 입력 크기를 모두 세는지 테스트"""
+        line = self.requests().splitlines(keepends=True)[59]
+        chunks = [line[index : index + 7] for index in range(0, len(line), 7)]
+        chunks.append(b'{"id": "last", "text": "\xea\xb0\x80"}')
+        output = io.BytesIO()
+        summary = run_pipe(ChunkedSource(chunks, output), output)
+
+        results = self.parse(output)
+        assert results == [
+            {"id": "doc-59", "text": self.expected(59)},
+            {"id": "last", "text": "가"},
+        ]
+        assert summary.input_bytes == sum(map(len, chunks))
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_write_failure_stops_reading(self, monkeypatch, workers):
+        """출력이 닫히면 남은 입력을 기다리지 않고 쓰기 오류로 끝나는지 테스트"""
+        monkeypatch.setattr(pipe_module, "BATCH_BYTES", 1024)
+        output = ClosedOutput()
+
+        with pytest.raises(BrokenPipeError):
+            run_pipe(io.BytesIO(self.requests() * 20), output, workers=workers)
+        assert output.writes == 1
+
+    def test_format_records_counts(self):
+        """묶음 처리 결과의 줄 수와 실패 수 테스트"""
+        data, records, errors = format_records([b'{"text": "a"}', b"", b"{}"], 10)
+
+        assert (records, errors) == (2, 1)
+        assert data.decode("utf-8").splitlines()[1].startswith('{"id": 12, "error"')
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_unencodable_text_fails_only_its_record(self, workers):
+        """UTF-8로 쓸 수 없는 문자가 든 줄만 오류가 되고 나머지 줄은 그대로 쓰는지 테스트"""
+        source = b'{"id": 1, "text": "a b"}\n{"id": 2, "text": "a\\ud800b"}\n'
+        source += b'{"id": "\\udfff", "text": "\\udfff"}\n{"id": 4, "text": "c d"}\n'
+        output = io.BytesIO()
+        summary = run_pipe(io.BytesIO(source), output, workers=workers, ordered=True)
+
+        results = self.parse(output)
+        assert results[0] == {"id": 1, "text": "a b"}
+        assert results[1]["id"] == 2 and "UnicodeEncodeError" in results[1]["error"]
+        assert results[2]["id"] == "\udfff" and "error" in results[2]
+        assert results[3] == {"id": 4, "text": "c d"}
+        assert (summary.records, summary.errors) == (4, 2)
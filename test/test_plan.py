@@ -0,0 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+
+import pytest
+
+from core.cache import ResultCache
+from core.cancellation import CancellationToken, OperationCancelled
+from core.text_processor import (
+    COUNTING_ALL_CHARS,
+    COUNTING_DISPLAY_WIDTH,
+    COUNTING_KOREAN,
+    TextProcessor,
+)
+from utils.text_counter import count_display_width
+
+
+class TestFormatPlan:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+        self.texts = [
+            "",
+            "   \n  ",
+            "안녕하세요. 저는 개발자입니다.반갑습니다!",
+            "첫 문단입니다.\n\n\n둘째 문단, 긴단어가나다라마바사아자차카타파하 끝. ",
+            " 앞뒤 공백​과 보이지 않는 문자. Hello world.. ",
+            "마침표 없는 긴 텍스트 " * 50,
+        ]
+
+    @pytest.mark.parametrize(
+        "counting, sentence_split, balanced",
+        list(
+            product((COUNTING_ALL_CHARS, COUNTING_KOREAN), (True, False), (True, False))
+        ),
+    )
+    def test_matches_processor(self, counting, sentence_split, balanced):
+        """모든 옵션 조합에서 처리기 메서드와 같은 결과를 내는지 테스트"""
+        plan = self.processor.compile(7, counting, sentence_split, balanced)
+        options = (7, counting == COUNTING_ALL_CHARS, sentence_split, balanced)
+
+        for text in self.texts:
+            assert plan.format(text) == self.processor.format_text_with_options(
+                text, *options
+            )
+            assert list(plan.format_lines(text)) == list(
+                self.processor.format_lines(text, *options)
+            )
+            assert plan.format_with_stats(text) == self.processor.format_with_stats(
+                text, *options
+            )
+
+    def test_is_immutable(self):
+        """만든 뒤에 옵션을 바꾸거나 지울 수 없는지 테스트"""
+        plan = self.processor.compile(10)
+
+        with pytest.raises(AttributeError):
+            plan.line_length = 20
+        with pytest.raises(AttributeError):
+            del plan.balanced
+        assert plan.line_length == 10
+        assert repr(plan) == (
+            "FormatPlan(line_length=10, counting='all_chars', "
+            "sentence_split=True, balanced=False)"
+        )
+
+    def test_invalid_options(self):
+        """잘못된 줄 길이나 카운팅 방식은 ValueError를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            self.processor.compile(0)
+        with pytest.raises(ValueError):
+            self.processor.compile(10, counting="bytes")
+
+    def test_shares_result_cache(self):
+        """처리기의 결과 캐시를 같은 키로 함께 쓰는지 테스트"""
+        processor = TextProcessor(result_cache=ResultCache())
+        text = self.texts[2]
+        expected = processor.format_text_with_options(text, 10)
+        plan = processor.compile(10)
+
+        assert plan.format(text) == expected
+        assert processor.result_cache.stats.hits == 1
+
+    def test_progress_and_cancel(self):
+        """진행 상황을 전체 양에서 끝내고 취소 토큰을 확인하는지 테스트"""
+        plan = self.processor.compile(10)
+        text = self.texts[5]
+        reports = []
+        plan.format(text, progress=lambda *args: reports.append(args))
+        assert reports[-1] == (len(text), len(text))
+
+        token = CancellationToken()
+        token.cancel()
+        with pytest.raises(OperationCancelled):
+            plan.format(text, token=token)
+
+    def test_shared_across_threads(self):
+        """여러 스레드에서 한 계획을 함께 써도 결과가 같은지 테스트"""
+        plan = self.processor.compile(9, balanced=True)
+        texts = [text + f" {index}번." for index in range(40) for text in self.texts]
+        expected = [plan.format(text) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(plan.format, texts)) == expected
+
+    @pytest.mark.parametrize("balanced", [False, True])
+    def test_display_width_counting(self, balanced):
+        """표시 폭 카운팅은 모든 문자 카운팅과 같은 규칙으로 칸 수를 세어 나누는지 테스트"""
+        plan = self.processor.compile(8, COUNTING_DISPLAY_WIDTH, balanced=balanced)
+        text = "漢字テスト 안녕하세요. ｈｅｌｌｏ world 긴단어가나다라마바사. "
+        lines = plan.format(text).split("\n")
+
+        assert all(count_display_width(line.replace(" ", "")) <= 8 for line in lines)
+        if not balanced:
+            separated = self.processor.separate_sentences_by_period(text)
+            assert lines == self.processor.split_by_display_width(separated, 8)
+        assert plan.format_with_stats(text).longest_line == 8
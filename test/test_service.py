@@ -0,0 +1,289 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import core.service as service_module
+from benchmarks.bench_service import generate_load
+from core.service import (
+    FormatService,
+    ServiceBusy,
+    ServiceClient,
+    parse_format_options,
+)
+from core.text_processor import TextProcessor
+
+
+class GatedExecutor(ThreadPoolExecutor):
+    """gate가 열릴 때까지 작업을 시작하지 않는 작업자 풀 (바쁜 작업자 흉내)"""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.gate = threading.Event()
+        self.calls = []
+
+    def submit(self, fn, jobs, *args, **kwargs):
+        self.calls.append(len(jobs))
+
+        def gated():
+            self.gate.wait()
+            return fn(jobs, *args, **kwargs)
+
+        return super().submit(gated)
+
+
+class TestFormatService:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.text = "안녕하세요. 저는 개발자입니다. 반갑습니다. " * 20
+
+    def teardown_method(self):
+        self.executor.shutdown()
+
+    def serve(self, test, **options):
+        """서비스를 띄워 test(service, port)를 실행하고 닫습니다."""
+
+        async def run():
+            service = FormatService(2, self.executor, **options)
+            try:
+                return await test(service, await service.start(port=0))
+            finally:
+                await service.close()
+
+        return asyncio.run(run())
+
+    def test_parse_format_options(self):
+        """요청 옵션의 기본값과 잘못된 형식 처리 테스트"""
+        assert parse_format_options({}) == (18, True, True, False)
+        assert parse_format_options({"width": 10, "balanced": True}) == (
+            10,
+            True,
+            True,
+            True,
+        )
+        for payload in ({"width": 0}, {"width": "10"}, {"all_chars": 1}):
+            with pytest.raises(ValueError):
+                parse_format_options(payload)
+
+    def test_format_and_count(self):
+        """/format과 /count가 처리기 메서드와 같은 결과를 돌려주는지 테스트"""
+
+        async def test(service, port):
+            async with ServiceClient(port=port) as client:
+                formatted = await client.request(
+                    "POST",
+                    "/format",
+                    {"text": self.text, "width": 10, "sentence_split": False},
+                )
+                counted = await client.request("POST", "/count", {"text": "가a. b"})
+                health = await client.request("GET", "/health")
+            return formatted, counted, health
+
+        formatted, counted, health = self.serve(test)
+        expected = self.processor.format_text_with_options(self.text, 10, True, False)
+        assert formatted == (200, {"text": expected})
+        assert counted == (
+            200,
+            {
+                "all_chars": 3,
+                "all_chars_with_period": 4,
+                "korean": 1,
+                "display_width": 6,
+            },
+        )
+        assert health[0] == 200 and health[1]["requests"] == 2
+
+    def test_bad_requests(self):
+        """잘못된 본문, 경로, 메서드에 오류 상태 코드를 돌려주는지 테스트"""
+
+        async def test(service, port):
+            async with ServiceClient(port=port) as client:
+                return [
+                    (await client.request(method, path, payload))[0]
+                    for method, path, payload in (
+                        ("POST", "/format", {"text": 1}),
+                        ("POST", "/format", {"text": "가", "width": -1}),
+                        ("POST", "/count", {}),
+                        ("GET", "/format", None),
+                        ("GET", "/missing", None),
+                    )
+                ]
+
+        assert self.serve(test) == [400, 400, 400, 405, 404]
+
+    def test_streams_large_result(self, monkeypatch):
+        """긴 결과를 청크 전송 인코딩으로 나눠 보내도 같은 결과인지 테스트"""
+        monkeypatch.setattr(service_module, "STREAM_CHUNK_CHARS", 100)
+        text = self.text * 20 + '"따옴표"와 \\역슬래시\\ 그리고 \t탭.'
+        body = json.dumps({"text": text}).encode()
+
+        async def test(service, port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(
+                b"POST /format HTTP/1.1\r\nConnection: close\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+            )
+            raw = await reader.read()
+            writer.close()
+            async with ServiceClient(port=port) as client:
+                return raw, await client.request("POST", "/format", {"text": text})
+
+        raw, result = self.serve(test, stream_min_chars=1000)
+        assert b"Transfer-Encoding: chunked" in raw.split(b"\r\n\r\n")[0]
+        assert raw.count(b"\r\n") > 50
+        assert result == (
+            200,
+            {"text": self.processor.format_text_with_options(text, 18)},
+        )
+
+    @pytest.mark.parametrize("stream_min_chars", [1, 1 << 20])
+    def test_unencodable_text(self, stream_min_chars):
+        """UTF-8로 쓸 수 없는 문자가 든 결과도 이스케이프해 같은 문자열로 돌려주는지 테스트"""
+        text = "a\ud800b 가나 " * 3
+
+        async def test(service, port):
+            async with ServiceClient(port=port) as client:
+                return await client.request("POST", "/format", {"text": text})
+
+        result = self.serve(test, stream_min_chars=stream_min_chars)
+        assert result == (
+            200,
+            {"text": self.processor.format_text_with_options(text, 18)},
+        )
+
+    def test_negative_content_length(self):
+        """음수 Content-Length에 400을 돌려주는지 테스트"""
+
+        async def test(service, port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"POST /format HTTP/1.1\r\nContent-Length: -5\r\n\r\n")
+            raw = await reader.read()
+            writer.close()
+            return raw
+
+        assert self.serve(test).startswith(b"HTTP/1.1 400 ")
+
+    def test_batches_and_coalesces(self):
+        """작업자가 바쁠 때 쌓인 요청을 묶고, 같은 요청은 한 번만 처리하는지 테스트"""
+        executor = GatedExecutor()
+        texts = [f"{index}번 문장입니다." for index in range(5)] * 2
+
+        async def run():
+            service = FormatService(1, executor)
+            first = asyncio.ensure_future(service.submit("count", "처음"))
+            await asyncio.sleep(0.01)
+            options = (10, True, True, False)
+            rest = [
+                asyncio.ensure_future(service.submit("format", text, options))
+                for text in texts
+            ]
+            await asyncio.sleep(0.01)
+            executor.gate.set()
+            results = await asyncio.gather(first, *rest)
+            await service.close()
+            return results, service.stats
+
+        try:
+            results, stats = asyncio.run(run())
+        finally:
+            executor.shutdown()
+
+        assert results[1:] == [
+            self.processor.format_text_with_options(text, 10) for text in texts
+        ]
+        assert executor.calls == [1, 5]
+        assert (stats.requests, stats.coalesced, stats.batches) == (11, 5, 2)
+
+    def test_large_request_runs_alone(self):
+        """넣으면 묶음 문자 수를 넘는 요청은 앞 묶음에 끼지 않고 혼자 처리되는지 테스트"""
+        executor = GatedExecutor()
+        texts = ["작은 요청 하나", "작은 요청 둘", "큰 요청 " * 30, "작은 요청 셋"]
+
+        async def run():
+            service = FormatService(1, executor, batch_chars=100)
+            first = asyncio.ensure_future(service.submit("count", "처음"))
+            await asyncio.sleep(0.01)
+            rest = [
+                asyncio.ensure_future(service.submit("count", text)) for text in texts
+            ]
+            await asyncio.sleep(0.01)
+            executor.gate.set()
+            results = await asyncio.gather(first, *rest)
+            await service.close()
+            return results
+
+        try:
+            results = asyncio.run(run())
+        finally:
+            executor.shutdown()
+
+        assert executor.calls == [1, 2, 1, 1]
+        assert [result["all_chars"] for result in results[1:]] == [
+            self.processor.count_all_chars(text) for text in texts
+        ]
+
+    def test_cancelled_waiter_keeps_shared_job(self):
+        """같은 작업을 기다리던 요청 하나가 취소돼도 다른 요청은 결과를 받는지 테스트"""
+        executor = GatedExecutor()
+
+        async def run():
+            service = FormatService(1, executor, queue_size=1)
+            running = asyncio.ensure_future(service.submit("count", "실행 중"))
+            await asyncio.sleep(0.01)
+            queued = asyncio.ensure_future(service.submit("count", "대기 중"))
+            await asyncio.sleep(0)
+            # 대기열이 가득 찬 동안 같은 작업을 두 요청이 기다림
+            cancelled = asyncio.ensure_future(service.submit("count", "같은 작업"))
+            shared = asyncio.ensure_future(service.submit("count", "같은 작업"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            executor.gate.set()
+            results = await asyncio.gather(running, queued, shared)
+            await service.close()
+            return cancelled, results
+
+        try:
+            cancelled, results = asyncio.run(run())
+        finally:
+            executor.shutdown()
+
+        assert cancelled.cancelled()
+        assert results[2]["all_chars"] == self.processor.count_all_chars("같은 작업")
+
+    def test_rejects_when_queue_full(self):
+        """대기열이 가득 차면 기다리는 시간 뒤에 ServiceBusy로 거절하는지 테스트"""
+        executor = GatedExecutor()
+
+        async def run():
+            service = FormatService(1, executor, queue_size=1, queue_wait=0.01)
+            running = asyncio.ensure_future(service.submit("count", "실행 중"))
+            await asyncio.sleep(0.01)
+            queued = asyncio.ensure_future(service.submit("count", "대기 중"))
+            await asyncio.sleep(0)
+            with pytest.raises(ServiceBusy):
+                await service.submit("count", "넘침")
+            executor.gate.set()
+            await asyncio.gather(running, queued)
+            await service.close()
+            return service.stats
+
+        try:
+            stats = asyncio.run(run())
+        finally:
+            executor.shutdown()
+        assert stats.rejected == 1
+
+    def test_load_generator(self):
+        """부하 생성기가 모든 요청을 보내고 지연 시간 백분위수를 구하는지 테스트"""
+
+        async def test(service, port):
+            return await generate_load(port, ["가나다. 라마.", "바사아."], 40, 4)
+
+        report = self.serve(test)
+        assert (report.requests, report.errors) == (40, 0)
+        assert 0 < report.p50 <= report.p99
+        assert report.requests_per_second > 0
@@ -3,9 +3,17 @@ text_counter 모듈의 모든 함수에 대한 테스트
 korean_counter의 기능도 포함하여 테스트
 """
 
+import unicodedata
+
 import pytest
+from utils.display_width import build_table, compute_ranges, unicode_width
+from utils.display_width_data import UNICODE_VERSION, WIDTH_RANGES
 from utils.text_counter import (
+    char_width,
     count_all_chars,
+    count_all_chars_with_period,
+    count_display_width,
+    count_many,
     count_visible_chars,
     is_visible_char,
     count_korean,
@@ -170,3 +178,83 @@ class TestTextCounter:
         assert all_chars > visible_chars  # 탭 문자 차이
         assert all_chars == 9  # 탭은 카운트, 공백은 제외
         assert visible_chars == 8  # 탭과 공백 모두 제외
+
+    def test_count_many(self):
+        """여러 단어 일괄 카운팅 테스트"""
+        words = ["안녕하세요!", "Hello,", "세상."]
+        assert count_many(words) == [5, 5, 2]
+        assert count_many(words, count_korean) == [5, 0, 2]
+        assert count_many([]) == []
+
+    def test_long_text_matches_short_text_counting(self):
+        """긴 문자열 경로와 짧은 문자열 경로의 결과가 같은지 테스트"""
+        word = "안녕,​ Hello.\n세상!ㅤ ab\t"
+        text = word * 50
+
+        assert count_all_chars(text) == count_all_chars(word) * 50
+        assert count_all_chars_with_period(text) == (
+            count_all_chars_with_period(word) * 50
+        )
+        assert count_visible_chars(text) == count_visible_chars(word) * 50
+        assert count_korean(text) == count_korean(word) * 50
+
+    def test_count_korean_hangul_block_boundary(self):
+        """완성형 한글 범위 경계 문자 테스트 (\\uD7A3 포함, \\uD7A4 이후 제외)"""
+        text = "가힣힤ힰ꯿" * 30
+        assert count_korean(text) == 60
+        assert count_korean(text[:5]) == 2
+
+    def test_count_all_chars_ascii_long_text(self):
+        """ASCII 전용 긴 문자열 카운팅 테스트"""
+        text = "Hello, World. Nice!\n" * 10
+        assert count_all_chars(text) == 140
+        assert count_all_chars_with_period(text) == 160
+
+    def test_count_display_width(self):
+        """전각 2, 반각 1, 폭 없음/결합 문자 0으로 세는지 테스트"""
+        assert (
+            count_display_width("안녕 Hello") == 10
+        )  # 한글 2자(4) + 공백(1) + 영문 5자
+        assert count_display_width("漢字テスト") == 10
+        assert (
+            count_display_width("ｈｉ ﾊﾝ") == 7
+        )  # 전각 영문(4) + 공백 + 반각 가타카나(2)
+        assert count_display_width("é​한ᅡ") == 3  # 결합 부호, ZWSP, 중성 자모
+        assert count_display_width("😀𠀀a") == 5
+        assert count_display_width("tab\there\n") == 7
+        assert count_display_width("") == 0
+
+    def test_char_width(self):
+        """문자 하나의 표시 폭 테스트"""
+        assert [char_width(char) for char in "가á　｡"] == [2, 1, 0, 2, 1]
+        assert char_width("") == 0
+        assert char_width("ab") == 0
+
+    def test_count_display_width_matches_per_char(self):
+        """긴 문자열과 단어 일괄 카운팅이 문자별 합과 같은지 테스트"""
+        words = ["안녕,​", "Hello.\n", "é", "ｈｅｌｌｏ", "\ud800", "😀가", "가"]
+        text = " ".join(words) * 30
+
+        assert count_display_width(text) == sum(map(char_width, text))
+        assert count_many(words, count_display_width) == [
+            sum(map(char_width, word)) for word in words
+        ]
+        assert count_many(words[:4], count_display_width) == [5, 6, 1, 10]
+
+    def test_display_width_table_matches_unicodedata(self):
+        """2단계 표가 모든 코드 포인트에서 unicodedata 기준 구현과 같은지 테스트"""
+        if unicodedata.unidata_version != UNICODE_VERSION:
+            pytest.skip("생성 파일과 파이썬의 유니코드 버전이 다름")
+        index, blocks = build_table(WIDTH_RANGES)
+
+        assert len(blocks) < 64 * 1024
+        for code_point in range(0x110000):
+            assert blocks[index[code_point >> 8] << 8 | code_point & 0xFF] == (
+                unicode_width(code_point)
+            ), hex(code_point)
+
+    def test_generated_ranges_are_current(self):
+        """생성 파일의 구간 목록이 현재 unicodedata로 만든 것과 같은지 테스트"""
+        if unicodedata.unidata_version != UNICODE_VERSION:
+            pytest.skip("생성 파일과 파이썬의 유니코드 버전이 다름")
+        assert tuple(compute_ranges()) == WIDTH_RANGES
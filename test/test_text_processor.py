@@ -1,5 +1,14 @@
+import io
+
 import pytest
-from core.text_processor import TextProcessor, DEFAULT_LINE_LENGTH
+import core.wrapping as wrapping
+from core.cache import StageCache
+from core.text_processor import FormatResult, TextProcessor, DEFAULT_LINE_LENGTH
+from utils.text_counter import (
+    count_all_chars,
+    count_all_chars_with_period,
+    count_korean,
+)
 
 
 class TestTextProcessor:
@@ -169,6 +178,29 @@ class TestTextProcessor:
         result = self.processor.separate_sentences_by_period(text)
         assert result == ""
 
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("가.나", "가.\n\n나"),
+            ("가..나", "가.\n\n.나"),
+            ("가... 나", "가.\n\n..\n\n나"),
+            ("  가\n\n나\t다.  ", " 가 나 다.\n\n"),
+            ("가\u200b나.\u200b", "가나."),
+            (" \u200b ", " "),
+            ("\u200b", ""),
+        ],
+    )
+    def test_separate_sentences_by_period_edge_cases(self, text, expected):
+        """연속 마침표, 앞뒤 공백, 보이지 않는 문자 처리 테스트"""
+        assert self.processor.separate_sentences_by_period(text) == expected
+
+    def test_separate_sentences_by_period_many_newlines(self):
+        """마침표 없이 개행만 많은 텍스트도 한 칸 공백으로 정리되는지 테스트"""
+        text = "가사 한 줄\n" * 20000
+        result = self.processor.separate_sentences_by_period(text)
+
+        assert result == ("가사 한 줄 " * 20000)
+
     def test_format_text_with_options_korean_mode(self):
         """한글 카운팅 모드 테스트 (호환성)"""
         text = "안녕 Hello 123"
@@ -196,6 +228,23 @@ class TestTextProcessor:
             char_count = len([char for char in item if char != " "])
             assert char_count <= length
 
+    def test_split_by_display_width(self):
+        """표시 폭 기준 분할 테스트 (전각 2칸, 긴 단어는 칸 수에 맞춰 분할)"""
+        text = "가나다 abc 라마바사아자차카\n\n漢字 ｈｉ"
+        result = self.processor.split_by_display_width(text, 6)
+
+        assert result == [
+            "가나다",
+            "abc",
+            "라마바",
+            "사아자",
+            "차카",
+            "",
+            "漢字",
+            "ｈｉ",
+        ]
+        assert self.processor.count_display_width("가나다 abc") == 10
+
     def test_format_text_with_options_all_options_enabled(self):
         """모든 옵션이 활성화된 경우 테스트"""
         text = "안녕하세요. 저는 Hello World 123 개발자입니다."
@@ -210,3 +259,193 @@ class TestTextProcessor:
             if line.strip():  # 빈 행 제외
                 char_count = len([char for char in line if char != " "])
                 assert char_count <= 10  # 모든 문자 카운팅
+
+    @pytest.mark.parametrize("use_all_chars", [True, False])
+    @pytest.mark.parametrize("separate_sentences", [True, False])
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+    def test_iter_format_matches_batch(
+        self, use_all_chars, separate_sentences, chunk_size
+    ):
+        """스트리밍 결과가 일괄 처리 결과와 동일한지 테스트"""
+        text = (
+            "안녕하세요.저는 Hello World 123 개발자입니다.\n\n"
+            "마침표 없이\n개행만 있는 줄\n"
+            "verylongwordthatexceedslimit... 끝. ​ 다음 "
+        )
+        chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+        expected = self.processor.format_text_with_options(
+            text, 10, use_all_chars, separate_sentences
+        )
+        result = "\n".join(
+            self.processor.iter_format(chunks, 10, use_all_chars, separate_sentences)
+        )
+        assert result == expected
+
+    @pytest.mark.parametrize("use_all_chars", [True, False])
+    @pytest.mark.parametrize("separate_sentences", [True, False])
+    def test_iter_format_large_chunk_matches_batch(
+        self, monkeypatch, use_all_chars, separate_sentences
+    ):
+        """구간보다 큰 청크와 구간 경계에 걸친 줄/문단도 일괄 처리 결과와 같은지 테스트"""
+        monkeypatch.setattr(wrapping, "BLOCK_SIZE", 16)
+        text = (
+            "안녕하세요.저는 Hello World 개발자입니다.\n\n\n"
+            "verylongwordthatexceedslimit 마침표 없이\n개행만 있는 줄 끝. "
+        ) * 5
+        expected = self.processor.format_text_with_options(
+            text, 10, use_all_chars, separate_sentences
+        )
+        chunks = [text[:100], text[100:]]
+        result = "\n".join(
+            self.processor.iter_format(chunks, 10, use_all_chars, separate_sentences)
+        )
+        assert result == expected
+
+    def test_iter_format_word_across_chunks(self):
+        """청크 경계에 걸친 단어가 하나로 이어지는지 테스트"""
+        result = list(
+            self.processor.iter_format(
+                ["안녕하", "세요 개발", "자입니다"], 20, separate_sentences=False
+            )
+        )
+        assert result == ["안녕하세요 개발자입니다"]
+
+    def test_iter_format_period_across_chunks(self):
+        """청크 끝의 마침표 뒤 공백이 다음 청크에 있어도 문단이 분리되는지 테스트"""
+        result = list(self.processor.iter_format(["안녕하세요.", " 반갑습니다."], 20))
+        assert result == ["안녕하세요.", "", "반갑습니다."]
+
+    def test_iter_format_is_lazy(self):
+        """무한 입력에서도 완성된 줄을 바로 내보내는지 테스트"""
+
+        def endless():
+            while True:
+                yield "안녕하세요 반갑습니다. "
+
+        lines = self.processor.iter_format(endless(), 9)
+        assert [next(lines) for _ in range(4)] == [
+            "안녕하세요",
+            "반갑습니다.",
+            "",
+            "안녕하세요",
+        ]
+
+    def test_iter_format_empty_input(self):
+        """빈 입력 스트리밍 테스트"""
+        assert list(self.processor.iter_format(["", "  ", "\n"], 10)) == []
+
+    @pytest.mark.parametrize("use_all_chars", [True, False])
+    @pytest.mark.parametrize("separate_sentences", [True, False])
+    @pytest.mark.parametrize("balanced", [False, True])
+    def test_format_to_matches_format_text(
+        self, use_all_chars, separate_sentences, balanced
+    ):
+        """문자열과 청크 입력 모두 쓴 내용이 format_text_with_options 결과와 같은지 테스트"""
+        text = (
+            "안녕하세요. 저는 개발자입니다.\n반갑습니다! 가나다라마바사아자차카타 끝 "
+            * 20
+        )
+        expected = self.processor.format_text_with_options(
+            text, 10, use_all_chars, separate_sentences, balanced
+        )
+
+        for source in (text, [text[:37], text[37:200], text[200:]]):
+            output = io.StringIO()
+            written = self.processor.format_to(
+                source,
+                output,
+                10,
+                use_all_chars,
+                separate_sentences,
+                balanced,
+                batch_lines=3,
+            )
+            assert output.getvalue() == expected
+            assert written == len(expected)
+
+    def test_format_to_batches_writes(self):
+        """함수 sink에 줄을 묶음으로 나눠 쓰는지 테스트"""
+        writes = []
+        self.processor.format_to(
+            "가나 다라 마바 사아 자차", writes.append, 2, batch_lines=2
+        )
+
+        assert writes == ["가나\n다라", "\n마바\n사아", "\n자차"]
+
+    def test_format_to_empty_input(self):
+        """빈 입력은 아무것도 쓰지 않는지 테스트"""
+        writes = []
+        assert self.processor.format_to("  \n", writes.append, 10) == 0
+        assert writes == []
+
+    def test_format_to_invalid_batch(self):
+        """잘못된 묶음 크기 테스트"""
+        with pytest.raises(ValueError):
+            self.processor.format_to("가나", [].append, 10, batch_lines=0)
+
+    def test_normalize_whitespace_across_blocks(self, monkeypatch):
+        """구간 경계를 넘는 텍스트도 공백을 한 칸으로 정리하는지 테스트"""
+        monkeypatch.setattr(wrapping, "BLOCK_SIZE", 3)
+        text = " 가나다라 마\n\n바  사\t아자차카 타 "
+
+        assert (
+            self.processor.normalize_whitespace(text)
+            == " " + " ".join(text.split()) + " "
+        )
+
+
+class TestFormatWithStats:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+        self.text = (
+            "안녕하세요. 저는 개발자입니다.\n반갑습니다! "
+            "가나다라마바사아자차카타파하가나다라마바사아자차카타파하 끝.\n\n\n\n"
+            "Hello World, this is a test. 마지막 문장입니다 "
+        ) * 3
+
+    @pytest.mark.parametrize("use_all_chars", [True, False])
+    @pytest.mark.parametrize("separate_sentences", [True, False])
+    @pytest.mark.parametrize("balanced", [False, True])
+    def test_stats_match_output(self, use_all_chars, separate_sentences, balanced):
+        """결과와 통계가 출력을 다시 세어 얻은 값과 같은지 테스트"""
+        result = self.processor.format_with_stats(
+            self.text, 10, use_all_chars, separate_sentences, balanced
+        )
+        expected = self.processor.format_text_with_options(
+            self.text, 10, use_all_chars, separate_sentences, balanced
+        )
+        count = count_all_chars if use_all_chars else count_korean
+        lines = expected.split("\n")
+        line_counts = [count(line) for line in lines if line]
+
+        assert result.text == expected
+        assert result.line_count == len(lines)
+        assert result.all_chars == count_all_chars(expected)
+        assert result.all_chars_with_period == count_all_chars_with_period(expected)
+        assert result.korean_chars == count_korean(expected)
+        assert result.longest_line == max(line_counts)
+        assert result.shortest_line == min(line_counts)
+
+    def test_paragraphs_and_forced_splits(self):
+        """문단 수와 긴 단어 강제 분할 수 테스트"""
+        result = self.processor.format_with_stats(
+            "첫 문장. 가나다라마바사아자차카타파하 둘째. 셋째\n\n", 5
+        )
+
+        assert result.paragraph_count == 3
+        assert result.forced_splits == 1
+        assert result.longest_line == 5
+
+    def test_staged_processor_matches(self):
+        """단계 캐시를 쓰는 처리기도 같은 결과를 내는지 테스트"""
+        staged = TextProcessor(stage_cache=StageCache())
+        for width in (10, 12, 10):
+            assert staged.format_with_stats(
+                self.text, width
+            ) == self.processor.format_with_stats(self.text, width)
+
+    @pytest.mark.parametrize("text", ["", "   \n "])
+    def test_empty_text(self, text):
+        """빈 텍스트는 통계가 모두 0인지 테스트"""
+        assert self.processor.format_with_stats(text, 10) == FormatResult("")
@@ -0,0 +1,75 @@
+import pytest
+
+from core.text_processor import LINE_LENGTH_RANGE, TextProcessor
+from core.tokens import Tokens
+from core.wrapping import wrap_spans
+from utils.text_counter import count_all_chars
+
+
+class TestTokens:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+        self.text = (
+            "안녕하세요. 저는 개발자입니다.\n반갑습니다! "
+            "가나다라마바사아자차카타파하가나다라마바사아자차카타파하 끝.\n\n\n\n"
+            "Hello World, this is a test. 마지막 문장입니다 "
+        ) * 5
+
+    @pytest.mark.parametrize("paragraphs", [True, False])
+    def test_wrap_matches_wrap_spans(self, paragraphs):
+        """같은 단어 배열로 여러 줄 길이를 나눠도 wrap_spans와 같은지 테스트"""
+        text = self.processor.separate_sentences_by_period(self.text)
+        split = self.processor._split_long_word_by_all_chars
+        tokens = Tokens(text, count_all_chars, split, paragraphs=paragraphs)
+
+        for width in (1, 3, 7, 18, 100):
+            assert tokens.wrap(width) == wrap_spans(
+                text, width, count_all_chars, split, paragraphs=paragraphs
+            )
+
+    def test_empty_text(self):
+        """단어가 없는 텍스트 테스트"""
+        tokens = Tokens(
+            "", count_all_chars, self.processor._split_long_word_by_all_chars
+        )
+
+        assert len(tokens) == 0
+        assert list(tokens.wrap(10)) == []
+
+    @pytest.mark.parametrize("use_all_chars", [True, False])
+    @pytest.mark.parametrize("separate_sentences", [True, False])
+    @pytest.mark.parametrize("balanced", [False, True])
+    def test_format_multi_matches_format_lines(
+        self, use_all_chars, separate_sentences, balanced
+    ):
+        """줄 길이별 결과가 format_lines를 따로 호출한 것과 같은지 테스트"""
+        widths = [5, 10, 18, 40]
+        results = self.processor.format_multi(
+            self.text, widths, use_all_chars, separate_sentences, balanced
+        )
+
+        assert list(results) == widths
+        for width, lines in results.items():
+            assert lines == self.processor.format_lines(
+                self.text, width, use_all_chars, separate_sentences, balanced
+            )
+
+    def test_format_multi_default_widths(self):
+        """기본 줄 길이 범위와 줄 수 테스트"""
+        results = self.processor.format_multi(self.text)
+
+        assert list(results) == list(LINE_LENGTH_RANGE)
+        assert len(results[10]) >= len(results[100])
+        assert results[18].join() == self.processor.format_text_with_options(
+            self.text, 18
+        )
+
+    def test_format_multi_empty_text(self):
+        """빈 텍스트는 줄 길이마다 빈 목록인지 테스트"""
+        results = self.processor.format_multi("  \n ", [10, 20])
+
+        assert {width: len(lines) for width, lines in results.items()} == {
+            10: 0,
+            20: 0,
+        }
@@ -0,0 +1,103 @@
+import pytest
+
+import core.wrapping as wrapping
+from core.text_processor import TextProcessor
+from core.wrapping import Lines, wrap_spans
+from utils.text_counter import count_all_chars
+
+
+class TestWrapping:
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.processor = TextProcessor()
+
+    def _wrap(self, text, length, paragraphs=False):
+        return wrap_spans(
+            text,
+            length,
+            count_all_chars,
+            self.processor._split_long_word_by_all_chars,
+            paragraphs=paragraphs,
+        )
+
+    def test_lines_are_spans_of_source(self):
+        """줄이 원문 구간을 그대로 가리키는지 테스트"""
+        text = "안녕하세요 저는 개발자입니다"
+        lines = self._wrap(text, 7)
+
+        assert list(lines) == ["안녕하세요 저는", "개발자입니다"]
+        assert [text[start:end] for start, end in lines.spans()] == list(lines)
+
+    def test_lines_sequence_access(self):
+        """인덱스, 음수 인덱스, 슬라이스, 길이 접근 테스트"""
+        lines = self._wrap("a b c d e f", 3)
+
+        assert len(lines) == 2
+        assert lines[0] == "a b c"
+        assert lines[-1] == "d e f"
+        assert lines[1:] == ["d e f"]
+        with pytest.raises(IndexError):
+            lines[2]
+
+    def test_lines_normalize_other_whitespace(self):
+        """개행, 탭 등이 섞인 줄은 한 칸 공백으로 정리되는지 테스트"""
+        lines = self._wrap("가\n나\t\t다 라", 10)
+
+        assert lines == ["가 나 다 라"]
+        assert lines.join() == "가 나 다 라"
+
+    def test_paragraph_breaks_become_empty_lines(self):
+        """문단 경계(\\n\\n)가 빈 줄로 보존되는지 테스트"""
+        lines = self._wrap("첫 문장.\n\n둘째 문장.", 18, paragraphs=True)
+
+        assert list(lines) == ["첫 문장.", "", "둘째 문장."]
+
+    def test_long_word_parts(self):
+        """긴 단어가 원문 구간 단위로 분할되는지 테스트"""
+        lines = self._wrap("가나다라마바사 아", 3)
+
+        assert list(lines) == ["가나다", "라마바", "사 아"]
+
+    def test_empty_lines(self):
+        """빈 목록 테스트"""
+        assert len(Lines.empty()) == 0
+        assert Lines.empty().join() == ""
+        assert list(self._wrap("   ", 5)) == []
+
+    def test_lines_from_text(self):
+        """이어 붙인 결과 문자열에서 만든 줄 목록 테스트"""
+        lines = Lines.from_text("가나 다\n\n라마")
+
+        assert list(lines) == ["가나 다", "", "라마"]
+        assert lines.join() == "가나 다\n\n라마"
+        assert list(lines.spans()) == [(0, 4), (5, 5), (6, 8)]
+        assert len(Lines.from_text("")) == 0
+
+    @pytest.mark.parametrize("block_size", [1, 7, 64])
+    def test_small_blocks_match_single_block(self, monkeypatch, block_size):
+        """구간을 잘게 나눠도 한 번에 처리한 결과와 같은지 테스트"""
+        text = (
+            "안녕하세요.  반갑습니다.\n\n\n\n저는\t개발자입니다. "
+            "아주아주아주긴단어입니다 끝.\n\n"
+        ) * 5
+        expected = {
+            paragraphs: list(self._wrap(text, 6, paragraphs))
+            for paragraphs in (True, False)
+        }
+
+        monkeypatch.setattr(wrapping, "BLOCK_SIZE", block_size)
+        for paragraphs in (True, False):
+            assert list(self._wrap(text, 6, paragraphs)) == expected[paragraphs]
+
+    def test_format_lines_matches_format_text_with_options(self):
+        """format_lines 결과를 이으면 format_text_with_options와 같은지 테스트"""
+        text = "안녕하세요. 저는 개발자입니다. 반갑습니다." * 3
+
+        for use_all_chars in (True, False):
+            for separate_sentences in (True, False):
+                lines = self.processor.format_lines(
+                    text, 8, use_all_chars, separate_sentences
+                )
+                assert lines.join() == self.processor.format_text_with_options(
+                    text, 8, use_all_chars, separate_sentences
+                )
@@ -0,0 +1,32 @@
+"""
+글꼴별 전진 폭 표
+QFontMetricsF로 문자마다 한 번만 전진 폭을 재어 AdvanceTable에 담고, 글꼴마다 표 하나를 다시 씁니다.
+QFontMetricsF는 글꼴을 쓸 수 있는 스레드(메인 스레드)에서 재야 하므로,
+작업 스레드로 넘기기 전에 measure_missing으로 텍스트의 새 문자를 미리 재어 둡니다.
+"""
+
+from typing import Dict
+
+from PySide6.QtGui import QFont, QFontMetricsF
+
+from core.advances import AdvanceTable
+
+# 글꼴 키(QFont.key) → 전진 폭 표
+_tables: Dict[str, AdvanceTable] = {}
+
+
+def advance_table_for(font: QFont) -> AdvanceTable:
+    """
+    글꼴의 전진 폭 표를 찾고, 없으면 만듭니다.
+
+    Args:
+        font (QFont): 자막을 그리는 글꼴
+
+    Returns:
+        AdvanceTable: 같은 글꼴이면 같은 표
+    """
+    key = font.key()
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = AdvanceTable(QFontMetricsF(font).horizontalAdvance, key)
+    return table
@@ -0,0 +1,99 @@
+"""
+백그라운드 가다듬기 작업
+QThreadPool에서 TextProcessor를 실행해 큰 텍스트를 처리하는 동안에도 창이 멈추지 않게 합니다.
+"""
+
+import time
+from typing import Optional
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from core.cancellation import CancellationToken, OperationCancelled
+from core.plan import FormatPlan
+from core.text_processor import TextProcessor
+
+
+class FormatSignals(QObject):
+    """작업 스레드에서 메인 스레드로 결과를 전달하는 시그널"""
+
+    # 요청 번호, 결과 텍스트, 문자 수(공백 제외), 소요 시간(초)
+    finished = Signal(int, str, int, float)
+    # 요청 번호, 처리한 문자 수, 전체 문자 수
+    progress = Signal(int, int, int)
+    # 요청 번호, 오류 메시지
+    failed = Signal(int, str)
+    # 요청 번호
+    cancelled = Signal(int)
+
+
+class FormatTask(QRunnable):
+    """
+    텍스트 하나를 가다듬는 작업 (엔진이 구간과 문단마다 취소 토큰을 확인)
+    plan을 주면 줄 길이와 카운팅 옵션 대신 그 계획으로 가다듬습니다. (픽셀 폭 줄 나누기 등)
+    """
+
+    def __init__(
+        self,
+        request_id: int,
+        processor: TextProcessor,
+        text: str,
+        line_length: int,
+        use_all_chars: bool,
+        separate_sentences: bool,
+        token: CancellationToken,
+        plan: Optional[FormatPlan] = None,
+    ):
+        super().__init__()
+        self.request_id = request_id
+        self.processor = processor
+        self.text = text
+        self.line_length = line_length
+        self.use_all_chars = use_all_chars
+        self.separate_sentences = separate_sentences
+        self.token = token
+        self.plan = plan
+        self.signals = FormatSignals()
+
+    def run(self):
+        """작업 스레드에서 실행"""
+        started = time.perf_counter()
+        try:
+            if self.token.cancelled:
+                self.signals.cancelled.emit(self.request_id)
+                return
+
+            # 문자 수는 줄을 나누는 중에 함께 세므로 결과를 다시 훑지 않음
+            if self.plan is not None:
+                result = self.plan.format_with_stats(
+                    self.text, progress=self._report_progress, token=self.token
+                )
+            else:
+                result = self.processor.format_with_stats(
+                    self.text,
+                    self.line_length,
+                    use_all_chars=self.use_all_chars,
+                    separate_sentences=self.separate_sentences,
+                    progress=self._report_progress,
+                    token=self.token,
+                )
+        except OperationCancelled:
+            self.signals.cancelled.emit(self.request_id)
+            return
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+            return
+
+        if self.token.cancelled:
+            self.signals.cancelled.emit(self.request_id)
+            return
+
+        self.signals.finished.emit(
+            self.request_id,
+            result.text,
+            result.all_chars_with_period,
+            time.perf_counter() - started,
+        )
+
+    def _report_progress(self, done: int, total: int) -> None:
+        """엔진의 진행 상황을 메인 스레드로 전달 (전체의 1%마다 호출됨)"""
+        self.signals.progress.emit(self.request_id, done, total)
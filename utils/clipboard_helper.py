@@ -1,4 +1,8 @@
-from PySide6.QtWidgets import QApplication
+def _clipboard():
+    """애플리케이션 클립보드 (utils를 가져오기만 할 때는 Qt를 불러오지 않도록 처음 쓸 때 가져옴)"""
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.clipboard()
 
 
 class ClipboardHelper:
@@ -15,7 +19,7 @@ class ClipboardHelper:
             bool: 성공 시 True, 실패 시 False
         """
         try:
-            clipboard = QApplication.clipboard()
+            clipboard = _clipboard()
             clipboard.setText(text)
             return True
         except Exception as e:
@@ -30,7 +34,7 @@ class ClipboardHelper:
             str: 클립보드의 텍스트, 실패 시 빈 문자열
         """
         try:
-            clipboard = QApplication.clipboard()
+            clipboard = _clipboard()
             return clipboard.text()
         except Exception as e:
             print(f"클립보드 텍스트 가져오기 실패: {e}")
@@ -0,0 +1,200 @@
+"""
+동아시아 표시 폭 표
+터미널과 자막 렌더러에서 한 글자가 차지하는 칸 수(전각 2, 반각 1, 폭 없음/결합 문자 0)를
+코드 포인트마다 문자 하나씩 unicodedata로 묻지 않고 미리 만든 2단계 표에서 찾습니다.
+
+표는 코드 포인트를 256개씩 묶은 블록 단위입니다.
+    1단계: 블록 번호(코드 포인트 >> 8) → 폭 블록 번호 (array)
+    2단계: 폭 블록 번호 * 256 + 하위 8비트 → 폭 (bytes)
+같은 내용의 블록은 하나만 두므로 0x110000개 코드 포인트의 폭이 약 35KB에 들어갑니다.
+
+표는 생성 파일(display_width_data.py)의 구간 목록으로 임포트 시 만듭니다.
+파이썬의 유니코드 버전이 바뀌면 다시 생성합니다:
+    python -m utils.display_width
+"""
+
+import os
+import unicodedata
+from array import array
+from typing import Iterable, List, Tuple
+
+
+# 2단계 표의 블록 크기 (비트 수)
+BLOCK_BITS = 8
+BLOCK_SIZE = 1 << BLOCK_BITS
+BLOCK_MASK = BLOCK_SIZE - 1
+
+# 코드 포인트 범위
+MAX_CODE_POINT = 0x10FFFF
+
+# 폭 없는 문자로 보는 일반 분류 (결합 부호, 둘러싸는 부호, 서식 문자, 제어 문자)
+ZERO_WIDTH_CATEGORIES = frozenset({"Mn", "Me", "Cf", "Cc"})
+
+# 앞 글자와 합쳐져 한 음절을 이루는 한글 자모 (중성/종성)
+HANGUL_COMBINING_JAMO = ((0x1160, 0x11FF), (0xD7B0, 0xD7FF))
+
+# 생성 파일 경로
+DATA_PATH = os.path.join(os.path.dirname(__file__), "display_width_data.py")
+
+# 구간: (시작, 끝(포함), 폭)
+WidthRange = Tuple[int, int, int]
+
+
+def unicode_width(code_point: int) -> int:
+    """
+    unicodedata로 구한 코드 포인트 하나의 표시 폭 (표 생성과 검증용 기준 구현)
+
+    Args:
+        code_point (int): 코드 포인트
+
+    Returns:
+        int: 전각(W, F) 2, 폭 없음/결합 문자 0, 그 밖(반각, 모호한 폭 포함) 1
+    """
+    for start, end in HANGUL_COMBINING_JAMO:
+        if start <= code_point <= end:
+            return 0
+    char = chr(code_point)
+    if unicodedata.category(char) in ZERO_WIDTH_CATEGORIES:
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+def compute_ranges() -> List[WidthRange]:
+    """모든 코드 포인트의 폭을 unicodedata로 구해 폭이 1이 아닌 구간으로 묶습니다."""
+    ranges = []
+    start = 0
+    width = unicode_width(0)
+    for code_point in range(1, MAX_CODE_POINT + 2):
+        current = unicode_width(code_point) if code_point <= MAX_CODE_POINT else -1
+        if current != width:
+            if width != 1:
+                ranges.append((start, code_point - 1, width))
+            start = code_point
+            width = current
+    return ranges
+
+
+def build_table(ranges: Iterable[WidthRange]) -> Tuple[array, bytes]:
+    """
+    구간 목록으로 2단계 표를 만듭니다.
+
+    Args:
+        ranges (Iterable[WidthRange]): 폭이 1이 아닌 구간들 (나머지는 폭 1)
+
+    Returns:
+        Tuple[array, bytes]: (블록 번호 → 폭 블록 번호, 폭 블록들을 이어 붙인 바이트열)
+    """
+    # 구간이 걸친 블록만 만들고 나머지 블록은 모두 폭 1인 블록(0번)을 가리킴
+    ones = b"\x01" * BLOCK_SIZE
+    blocks = {}
+    for start, end, width in ranges:
+        for number in range(start >> BLOCK_BITS, (end >> BLOCK_BITS) + 1):
+            block = blocks.get(number)
+            if block is None:
+                block = blocks[number] = bytearray(ones)
+            low = max(start, number << BLOCK_BITS) & BLOCK_MASK
+            high = min(end, number << BLOCK_BITS | BLOCK_MASK) & BLOCK_MASK
+            block[low : high + 1] = bytes((width,)) * (high - low + 1)
+
+    block_ids = {ones: 0}
+    index = array("H", bytes(2 * ((MAX_CODE_POINT >> BLOCK_BITS) + 1)))
+    for number, block in blocks.items():
+        index[number] = block_ids.setdefault(bytes(block), len(block_ids))
+    return index, b"".join(block_ids)
+
+
+def bmp_block_widths(index: array, blocks: bytes) -> bytes:
+    """
+    기본 다국어 평면의 블록(UTF-16 상위 바이트)마다 가장 많은 폭을 구합니다.
+    서로게이트 쌍은 상위 단위를 0, 하위 단위를 1로 두어 보조 평면 문자 하나가 1로 세어지게 합니다.
+
+    Returns:
+        bytes: 상위 바이트 → 블록의 대표 폭 (bytes.translate 표)
+    """
+    widths = bytearray(BLOCK_SIZE)
+    for high in range(BLOCK_SIZE):
+        start = index[high] << BLOCK_BITS
+        block = blocks[start : start + BLOCK_SIZE]
+        widths[high] = max((1, 0, 2), key=block.count)
+    widths[0xD8:0xDC] = b"\x00" * 4
+    widths[0xDC:0xE0] = b"\x01" * 4
+    return bytes(widths)
+
+
+def width_exceptions(
+    ranges: Iterable[WidthRange], index: array, blocks: bytes, block_widths: bytes
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    블록의 대표 폭으로 세면 틀리는 코드 포인트 구간을 구합니다.
+
+    Args:
+        ranges (Iterable[WidthRange]): 표를 만든 구간들
+        index (array): 블록 번호 → 폭 블록 번호
+        blocks (bytes): 폭 블록들
+        block_widths (bytes): bmp_block_widths의 결과
+
+    Returns:
+        Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+            (폭이 블록의 대표 폭과 다른 기본 다국어 평면 구간, 폭이 1이 아닌 보조 평면 구간)
+    """
+    first_astral = BLOCK_SIZE << BLOCK_BITS
+    astral = [
+        (max(start, first_astral), end)
+        for start, end, _ in ranges
+        if end >= first_astral
+    ]
+
+    bmp = []
+    for high in range(BLOCK_SIZE):
+        start = index[high] << BLOCK_BITS
+        block = blocks[start : start + BLOCK_SIZE]
+        expected = block_widths[high]
+        if block.count(expected) == BLOCK_SIZE:
+            continue
+        for low, width in enumerate(block):
+            if width == expected:
+                continue
+            code_point = high << BLOCK_BITS | low
+            if bmp and bmp[-1][1] == code_point - 1:
+                bmp[-1] = (bmp[-1][0], code_point)
+            else:
+                bmp.append((code_point, code_point))
+    return bmp, astral
+
+
+def write_data(path: str = DATA_PATH) -> int:
+    """
+    현재 파이썬의 unicodedata로 구간 목록을 다시 만들어 생성 파일에 씁니다.
+
+    Returns:
+        int: 구간 수
+    """
+    ranges = compute_ranges()
+    lines = [
+        '"""',
+        "동아시아 표시 폭 구간 (자동 생성 파일이므로 직접 고치지 마세요)",
+        "python -m utils.display_width 로 다시 생성합니다.",
+        '"""',
+        "",
+        "# 생성에 쓴 유니코드 버전 (unicodedata.unidata_version)",
+        f'UNICODE_VERSION = "{unicodedata.unidata_version}"',
+        "",
+        "# 폭이 1이 아닌 코드 포인트 구간: (시작, 끝(포함), 폭)",
+        "WIDTH_RANGES = (",
+    ]
+    lines += [
+        f"    (0x{start:05X}, 0x{end:05X}, {width})," for start, end, width in ranges
+    ]
+    lines += [")", ""]
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines))
+    return len(ranges)
+
+
+if __name__ == "__main__":
+    count = write_data()
+    print(
+        f"{os.path.basename(DATA_PATH)}: 유니코드 {unicodedata.unidata_version}, 구간 {count}개"
+    )
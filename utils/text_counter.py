@@ -2,26 +2,33 @@
 모든 문자 카운팅 유틸리티
 기존 korean_counter.py를 대체하여 사용
 korean_counter.py는 호환성을 위해 유지하되 미사용 상태
+
+제외 문자 표와 정규식은 임포트 시 한 번만 만들어 두고 모든 호출에서 재사용합니다.
+짧은 문자열(단어)은 컴파일된 정규식 한 번으로, 긴 문자열은 C 수준의 전체 스캔
+(str.count, bytes.translate)으로 셉니다.
+
+표시 폭(count_display_width)은 utils.display_width의 2단계 표로 셉니다.
+표는 만드는 데 수 밀리초가 걸리므로 임포트할 때가 아니라 표시 폭을 처음 셀 때 만듭니다.
 """
 
 import re
+from bisect import bisect_right
+from itertools import accumulate
+from operator import sub
+from typing import Callable, Iterable, List, Tuple
 
+from utils.display_width import (
+    BLOCK_BITS,
+    BLOCK_MASK,
+    bmp_block_widths,
+    build_table,
+    width_exceptions,
+)
 
-def count_all_chars(text: str) -> int:
-    """
-    모든 문자 카운팅 (공백, 쉼표, 마침표, 개행문자, 보이지 않는 문자 제외)
-
-    Args:
-        text (str): 카운트할 텍스트
 
-    Returns:
-        int: 공백, 쉼표, 마침표, 개행문자, 보이지 않는 문자를 제외한 모든 문자 수
-    """
-    if not text:
-        return 0
-
-    # 제외할 문자들 (기존 + 보이지 않는 문자들)
-    excluded_chars = {
+# count_all_chars에서 제외할 문자들 (기존 + 보이지 않는 문자들)
+ALL_CHARS_EXCLUDED = frozenset(
+    {
         " ",  # 공백
         ",",  # 쉼표
         ".",  # 마침표
@@ -38,11 +45,112 @@ def count_all_chars(text: str) -> int:
         "\u180e",  # Mongolian Vowel Separator
         "\u3164",  # Hangul Filler
     }
+)
 
-    return len([char for char in text if char not in excluded_chars])
+# count_all_chars_with_period에서 제외할 문자들 (쉼표, 마침표는 카운트)
+ALL_CHARS_WITH_PERIOD_EXCLUDED = ALL_CHARS_EXCLUDED - {",", "."}
 
+# 이 길이 이하의 문자열은 정규식 한 번, 초과하면 문자별 str.count 스캔으로 셉니다
+_SHORT_TEXT_LENGTH = 64
 
-def count_all_chars_with_period(text: str) -> int:
+
+def _excluded_pattern(chars: frozenset) -> Callable[[str], List[str]]:
+    return re.compile("[" + re.escape("".join(sorted(chars))) + "]").findall
+
+
+_find_all_chars_excluded = _excluded_pattern(ALL_CHARS_EXCLUDED)
+_find_with_period_excluded = _excluded_pattern(ALL_CHARS_WITH_PERIOD_EXCLUDED)
+
+# 긴 문자열용 (ASCII 문자열에는 ASCII 제외 문자만 스캔)
+_ALL_CHARS_SCAN = tuple(sorted(ALL_CHARS_EXCLUDED))
+_ALL_CHARS_ASCII_SCAN = tuple(c for c in _ALL_CHARS_SCAN if c.isascii())
+_WITH_PERIOD_SCAN = tuple(sorted(ALL_CHARS_WITH_PERIOD_EXCLUDED))
+_WITH_PERIOD_ASCII_SCAN = tuple(c for c in _WITH_PERIOD_SCAN if c.isascii())
+
+# 공백문자 (str.strip/str.split과 같은 기준)
+_find_whitespace = re.compile(r"\s").findall
+
+# 완성형 한글 범위: \uAC00-\uD7A3
+_find_korean = re.compile(r"[\uAC00-\uD7A3]").findall
+
+# UTF-16 상위 바이트 기준 한글 판별표
+# 상위 바이트가 0xAC~0xD7이면 한글 후보이며, 0xD7 블록은 하위 바이트 0xA3까지만 완성형
+_NOT_HANGUL_HIGH = bytes(b for b in range(256) if not 0xAC <= b <= 0xD7)
+_IS_D7_HIGH = bytes(1 if b == 0xD7 else 0 for b in range(256))
+_ABOVE_A3_LOW = bytes(1 if b > 0xA3 else 0 for b in range(256))
+
+# 표시 폭 2단계 표: 블록 번호(코드 포인트 >> 8) → 폭 블록 번호, 폭 블록들
+# (_load_width_tables가 처음 쓸 때 채우며, _WIDTH_BLOCKS를 마지막에 채워 다 만들었는지 표시)
+_WIDTH_INDEX = None
+_WIDTH_BLOCKS = None
+
+# UTF-16 상위 바이트 → 블록의 대표 폭, 대표 폭과 다른 문자를 찾는 정규식
+# (대부분의 블록은 폭이 하나뿐이므로 상위 바이트 변환 한 번으로 세고 예외 문자만 표에서 찾음)
+_BMP_BLOCK_WIDTHS = None
+_BMP_WIDTH_EXCEPTIONS = None
+_ASTRAL_WIDTH_EXCEPTIONS = None
+
+
+def _code_point_class(ranges: List[Tuple[int, int]]) -> re.Pattern:
+    return re.compile(
+        "["
+        + "".join(
+            f"\\U{start:08x}" if start == end else f"\\U{start:08x}-\\U{end:08x}"
+            for start, end in ranges
+        )
+        + "]"
+    )
+
+
+def _load_width_tables() -> None:
+    """표시 폭 표와 예외 문자 정규식을 만듭니다. (여러 스레드가 함께 불러도 같은 표를 만듦)"""
+    global _WIDTH_INDEX, _WIDTH_BLOCKS, _BMP_BLOCK_WIDTHS
+    global _BMP_WIDTH_EXCEPTIONS, _ASTRAL_WIDTH_EXCEPTIONS
+    from utils.display_width_data import WIDTH_RANGES
+
+    index, blocks = build_table(WIDTH_RANGES)
+    block_widths = bmp_block_widths(index, blocks)
+    # 기본 다국어 평면과 보조 평면의 예외를 나눠 두어 앞쪽 정규식이 C 수준 비트맵으로 컴파일되게 함
+    _BMP_WIDTH_EXCEPTIONS, _ASTRAL_WIDTH_EXCEPTIONS = map(
+        _code_point_class,
+        width_exceptions(WIDTH_RANGES, index, blocks, block_widths),
+    )
+    _WIDTH_INDEX = index
+    _BMP_BLOCK_WIDTHS = block_widths
+    _WIDTH_BLOCKS = blocks
+
+
+# 폭 없는 ASCII 문자 (제어 문자)
+_find_ascii_controls = re.compile(r"[\x00-\x1f\x7f]").findall
+
+
+def _count_without(text: str, scan: tuple, ascii_scan: tuple) -> int:
+    """긴 문자열에서 제외 문자 수를 빼서 셉니다. (문자별 C 수준 스캔)"""
+    count = len(text)
+    for char in ascii_scan if text.isascii() else scan:
+        count -= text.count(char)
+    return count
+
+
+def _count_korean_long(text: str) -> int:
+    """긴 문자열의 한글 수를 UTF-16 상위 바이트 판별표로 셉니다."""
+    if text.isascii():
+        return 0
+
+    units = text.encode("utf-16-be", "surrogatepass")
+    high = units[0::2]
+    count = len(high.translate(None, _NOT_HANGUL_HIGH))
+
+    # \uD7A4-\uD7FF (완성형 범위 밖) 제외: 상위 0xD7 이고 하위 > 0xA3 인 위치 수
+    if b"\xd7" in high:
+        is_d7 = int.from_bytes(high.translate(_IS_D7_HIGH))
+        above_a3 = int.from_bytes(units[1::2].translate(_ABOVE_A3_LOW))
+        count -= (is_d7 & above_a3).bit_count()
+
+    return count
+
+
+def count_all_chars(text: str) -> int:
     """
     모든 문자 카운팅 (공백, 쉼표, 마침표, 개행문자, 보이지 않는 문자 제외)
 
@@ -55,24 +163,27 @@ def count_all_chars_with_period(text: str) -> int:
     if not text:
         return 0
 
-    # 제외할 문자들 (기존 + 보이지 않는 문자들)
-    excluded_chars = {
-        " ",  # 공백
-        "!",  # 느낌표
-        "\n",  # 개행문자
-        "\u200b",  # Zero Width Space
-        "\u200c",  # Zero Width Non-Joiner
-        "\u200d",  # Zero Width Joiner
-        "\u200e",  # Left-to-Right Mark
-        "\u200f",  # Right-to-Left Mark
-        "\ufeff",  # Zero Width No-Break Space (BOM)
-        "\u2060",  # Word Joiner
-        "\u00a0",  # Non-Breaking Space
-        "\u180e",  # Mongolian Vowel Separator
-        "\u3164",  # Hangul Filler
-    }
+    if len(text) <= _SHORT_TEXT_LENGTH:
+        return len(text) - len(_find_all_chars_excluded(text))
+    return _count_without(text, _ALL_CHARS_SCAN, _ALL_CHARS_ASCII_SCAN)
+
+
+def count_all_chars_with_period(text: str) -> int:
+    """
+    모든 문자 카운팅 (공백, 쉼표, 마침표, 개행문자, 보이지 않는 문자 제외)
 
-    return len([char for char in text if char not in excluded_chars])
+    Args:
+        text (str): 카운트할 텍스트
+
+    Returns:
+        int: 공백, 쉼표, 마침표, 개행문자, 보이지 않는 문자를 제외한 모든 문자 수
+    """
+    if not text:
+        return 0
+
+    if len(text) <= _SHORT_TEXT_LENGTH:
+        return len(text) - len(_find_with_period_excluded(text))
+    return _count_without(text, _WITH_PERIOD_SCAN, _WITH_PERIOD_ASCII_SCAN)
 
 
 def count_visible_chars(text: str) -> int:
@@ -87,7 +198,10 @@ def count_visible_chars(text: str) -> int:
     """
     if not text:
         return 0
-    return len([char for char in text if char.strip()])
+
+    if len(text) <= _SHORT_TEXT_LENGTH:
+        return len(text) - len(_find_whitespace(text))
+    return sum(map(len, text.split()))
 
 
 def is_visible_char(char: str) -> bool:
@@ -105,6 +219,59 @@ def is_visible_char(char: str) -> bool:
     return char.strip() != ""
 
 
+def char_width(char: str) -> int:
+    """
+    문자 하나의 표시 폭 (2단계 표 조회)
+
+    Args:
+        char (str): 판별할 문자
+
+    Returns:
+        int: 전각 2, 반각 1, 폭 없음/결합 문자 0 (한 글자가 아니면 0)
+    """
+    if not char or len(char) != 1:
+        return 0
+    if _WIDTH_BLOCKS is None:
+        _load_width_tables()
+    code_point = ord(char)
+    return _WIDTH_BLOCKS[
+        _WIDTH_INDEX[code_point >> BLOCK_BITS] << BLOCK_BITS | code_point & BLOCK_MASK
+    ]
+
+
+def count_display_width(text: str) -> int:
+    """
+    표시 폭 카운팅 (한글/한자 등 전각 2, 라틴 문자 등 반각 1, 폭 없음/결합 문자 0)
+
+    Args:
+        text (str): 카운트할 텍스트
+
+    Returns:
+        int: 터미널과 자막 렌더러에서 차지하는 칸 수
+    """
+    if not text:
+        return 0
+
+    if text.isascii():
+        if text.isprintable():
+            return len(text)
+        return len(text) - len(_find_ascii_controls(text))
+
+    if _WIDTH_BLOCKS is None:
+        _load_width_tables()
+    # 상위 바이트가 같은 문자들을 블록의 대표 폭으로 센 뒤 예외 문자만 고침
+    units = text.encode("utf-16-be", "surrogatepass")
+    widths = units[0::2].translate(_BMP_BLOCK_WIDTHS)
+    total = len(widths) + widths.count(2) - widths.count(0)
+    for char in _BMP_WIDTH_EXCEPTIONS.findall(text):
+        total += char_width(char) - _BMP_BLOCK_WIDTHS[ord(char) >> BLOCK_BITS]
+    if len(widths) != len(text):
+        # 보조 평면 문자(서로게이트 쌍)는 1로 세었음
+        for char in _ASTRAL_WIDTH_EXCEPTIONS.findall(text):
+            total += char_width(char) - 1
+    return total
+
+
 def count_korean(text: str) -> int:
     """
     한글 문자 카운팅 (호환성 유지용)
@@ -119,10 +286,9 @@ def count_korean(text: str) -> int:
     if not text:
         return 0
 
-    # 완성형 한글 범위: \uAC00-\uD7A3
-    korean_pattern = re.compile(r"[\uAC00-\uD7A3]")
-    korean_chars = korean_pattern.findall(text)
-    return len(korean_chars)
+    if len(text) <= _SHORT_TEXT_LENGTH:
+        return len(_find_korean(text))
+    return _count_korean_long(text)
 
 
 def is_korean_char(char: str) -> bool:
@@ -140,3 +306,84 @@ def is_korean_char(char: str) -> bool:
 
     # 완성형 한글 범위: \uAC00-\uD7A3
     return "\uac00" <= char <= "\ud7a3"
+
+
+def count_many(
+    words: Iterable[str], counter: Callable[[str], int] = count_all_chars
+) -> List[int]:
+    """
+    여러 단어의 문자 수를 한 번에 카운팅합니다.
+    count_all_chars, count_all_chars_with_period는 단어를 이어 붙인 뒤
+    제외 문자가 나오는 위치만 찾아 해당 단어에서 빼므로 단어별 호출 비용이 없습니다.
+
+    Args:
+        words (Iterable[str]): 카운트할 단어들
+        counter (Callable[[str], int]): 사용할 카운팅 함수 (기본값: count_all_chars)
+
+    Returns:
+        List[int]: 단어별 문자 수
+    """
+    if counter is count_display_width:
+        return _count_display_widths(words)
+    scan = _BULK_SCANS.get(counter)
+    if scan is None:
+        return list(map(counter, words))
+
+    if not isinstance(words, list):
+        words = list(words)
+    counts = list(map(len, words))
+    joined = "".join(words)
+    word_ends = None
+
+    for char in scan:
+        position = joined.find(char)
+        if position == -1:
+            continue
+        if word_ends is None:
+            word_ends = list(accumulate(counts))
+        while position != -1:
+            counts[bisect_right(word_ends, position)] -= 1
+            position = joined.find(char, position + 1)
+
+    return counts
+
+
+# count_many에서 일괄 처리하는 카운터와 제외 문자들
+_BULK_SCANS = {
+    count_all_chars: _ALL_CHARS_SCAN,
+    count_all_chars_with_period: _WITH_PERIOD_SCAN,
+}
+
+
+def _count_display_widths(words: Iterable[str]) -> List[int]:
+    """
+    여러 단어의 표시 폭을 한 번에 셉니다.
+    단어를 이어 붙여 UTF-16 상위 바이트를 블록의 대표 폭으로 한 번에 바꾸고 누적 합에서
+    단어별 폭을 구한 뒤, 예외 문자가 나오는 위치만 해당 단어에서 고칩니다.
+    """
+    if not isinstance(words, list):
+        words = list(words)
+    joined = "".join(words)
+    if joined.isascii() and joined.isprintable():
+        return list(map(len, words))
+
+    if _WIDTH_BLOCKS is None:
+        _load_width_tables()
+    widths = joined.encode("utf-16-be", "surrogatepass")[0::2].translate(
+        _BMP_BLOCK_WIDTHS
+    )
+    if len(widths) != len(joined):
+        # 보조 평면 문자가 있으면 UTF-16 위치와 문자 위치가 어긋나므로 단어별로 셈
+        return list(map(count_display_width, words))
+
+    word_ends = list(accumulate(map(len, words)))
+    prefix = list(accumulate(widths, initial=0))
+    end_widths = list(map(prefix.__getitem__, word_ends))
+    counts = list(map(sub, end_widths, [0] + end_widths[:-1]))
+
+    for match in _BMP_WIDTH_EXCEPTIONS.finditer(joined):
+        char = match.group()
+        counts[bisect_right(word_ends, match.start())] += (
+            char_width(char) - _BMP_BLOCK_WIDTHS[ord(char) >> BLOCK_BITS]
+        )
+    return counts